@@ -88,6 +88,83 @@ class ChunkPaths(typing.TypedDict):
 
 ChunkResult = typing.Union[pl.DataFrame, ChunkPaths]
 
+
+class PipelineStageStats(typing.TypedDict):
+    name: str
+    n_workers: int
+    n_items: int
+    n_failed: int
+    busy_seconds: float
+    utilization: float
+
+
+class RateLimit(typing.TypedDict):
+    requests_per_second: float
+    burst: int
+    tiers: NotRequired[dict[str, RateLimit]]
+
+
+class RetryPolicy(typing.TypedDict):
+    max_attempts: int
+    initial_backoff: float
+    max_backoff: float
+    jitter: float
+    retryable_status_codes: list[int]
+    chunk_deadline: float | None
+
+
+class ParquetOptions(typing.TypedDict):
+    compression: NotRequired[
+        typing.Literal[
+            'lz4', 'uncompressed', 'snappy', 'gzip', 'brotli', 'zstd'
+        ]
+    ]
+    compression_level: NotRequired[int | None]
+    statistics: NotRequired[bool]
+    row_group_size: NotRequired[int | None]
+
+
+class RecompressResult(typing.TypedDict):
+    n_files: int
+    bytes_before: int
+    bytes_after: int
+    read_seconds_before: float
+    read_seconds_after: float
+
+
+class CompactResult(typing.TypedDict):
+    n_files_before: int
+    n_files_after: int
+    compacted_paths: list[str]
+
+
+class ManifestEntry(typing.TypedDict):
+    path: str
+    chunk: str | None
+    n_rows: int
+    n_bytes: int
+    index_min: JSONValue
+    index_max: JSONValue
+    sorted: NotRequired[bool]
+    removed: NotRequired[bool]
+
+
+class JournalEntry(typing.TypedDict):
+    chunk: str
+    status: typing.Literal['planned', 'in_flight', 'done', 'failed']
+    time: float
+    error: NotRequired[str]
+
+
+class TableCollectStatus(typing.TypedDict):
+    name: str
+    source: str
+    status: typing.Literal['pending', 'collecting', 'done', 'failed']
+    start_time: float | None
+    end_time: float | None
+    error: str | None
+
+
 #
 # # table representation
 #
@@ -140,3 +217,4 @@ class Config(typing.TypedDict):
     tracked_tables: list[TableDict]
     use_git: bool
     default_bucket: Bucket
+    parquet_options: ParquetOptions
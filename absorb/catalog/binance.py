@@ -63,13 +63,20 @@ class SpotCandles(absorb.Table):
             datetime.datetime(2025, 5, 1),
         )
 
-    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
-        return get_spot_candles(
+    def fetch_chunk_payload(self, chunk: absorb.Chunk) -> bytes | None:
+        url = get_spot_url(
             pair=self.parameters['pair'],
             timestamp=chunk,  # type: ignore
+            datatype='klines',
             interval=self.parameters['interval'],
             window='daily',
         )
+        return absorb.ops.download_bytes(url)
+
+    def parse_chunk_payload(
+        self, chunk: absorb.Chunk, payload: bytes
+    ) -> absorb.ChunkResult | None:
+        return parse_spot_candles(payload, pair=self.parameters['pair'])
 
 
 class SpotTrades(absorb.Table):
@@ -81,6 +88,7 @@ class SpotTrades(absorb.Table):
     parameter_types = {'pair': str}
     default_parameters = {}
     name_template = 'spot_trades_{pair}'
+    parquet_options = {'compression_level': 10, 'row_group_size': 100_000}
 
     def get_schema(self) -> dict[str, pl.DataType | type[pl.DataType]]:
         import polars as pl
@@ -104,12 +112,19 @@ class SpotTrades(absorb.Table):
             datetime.datetime(2025, 5, 1),
         )
 
-    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
-        return get_spot_trades(
+    def fetch_chunk_payload(self, chunk: absorb.Chunk) -> bytes | None:
+        url = get_spot_url(
             pair=self.parameters['pair'],
             timestamp=chunk,  # type: ignore
+            datatype='trades',
             window='daily',
         )
+        return absorb.ops.download_bytes(url)
+
+    def parse_chunk_payload(
+        self, chunk: absorb.Chunk, payload: bytes
+    ) -> absorb.ChunkResult | None:
+        return parse_spot_trades(payload, pair=self.parameters['pair'])
 
 
 class SpotAggregateTrades(absorb.Table):
@@ -123,6 +138,7 @@ class SpotAggregateTrades(absorb.Table):
     parameter_types = {'pair': str}
     default_parameters = {}
     name_template = 'spot_aggregate_trades_{pair}'
+    parquet_options = {'compression_level': 10, 'row_group_size': 100_000}
 
     def get_schema(self) -> dict[str, pl.DataType | type[pl.DataType]]:
         import polars as pl
@@ -147,12 +163,21 @@ class SpotAggregateTrades(absorb.Table):
             datetime.datetime(2025, 5, 1),
         )
 
-    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
-        return get_spot_aggregate_trades(
+    def fetch_chunk_payload(self, chunk: absorb.Chunk) -> bytes | None:
+        url = get_spot_url(
             pair=self.parameters['pair'],
             timestamp=chunk,  # type: ignore
+            datatype='aggTrades',
             window='daily',
         )
+        return absorb.ops.download_bytes(url)
+
+    def parse_chunk_payload(
+        self, chunk: absorb.Chunk, payload: bytes
+    ) -> absorb.ChunkResult | None:
+        return parse_spot_aggregate_trades(
+            payload, pair=self.parameters['pair']
+        )
 
 
 def get_spot_url(
@@ -208,14 +233,17 @@ def get_spot_trades(
     timestamp: datetime.datetime,
     window: typing.Literal['daily', 'monthly'] = 'daily',
 ) -> pl.DataFrame:
-    import polars as pl
-
     url = get_spot_url(
         pair=pair,
         timestamp=timestamp,
         datatype='trades',
         window=window,
     )
+    return parse_spot_trades(absorb.ops.download_bytes(url), pair=pair)
+
+
+def parse_spot_trades(payload: bytes, pair: str) -> pl.DataFrame:
+    import polars as pl
 
     raw_schema: dict[str, pl.DataType | type[pl.DataType]] = {
         'trade_id': pl.Int64,
@@ -238,7 +266,7 @@ def get_spot_trades(
         'trade_id',
     ]
 
-    return _process(url=url, raw_schema=raw_schema, columns=columns)
+    return _process(payload=payload, raw_schema=raw_schema, columns=columns)
 
 
 def get_spot_aggregate_trades(
@@ -246,14 +274,19 @@ def get_spot_aggregate_trades(
     timestamp: datetime.datetime,
     window: typing.Literal['daily', 'monthly'] = 'daily',
 ) -> pl.DataFrame:
-    import polars as pl
-
     url = get_spot_url(
         pair=pair,
         timestamp=timestamp,
         datatype='aggTrades',
         window=window,
     )
+    return parse_spot_aggregate_trades(
+        absorb.ops.download_bytes(url), pair=pair
+    )
+
+
+def parse_spot_aggregate_trades(payload: bytes, pair: str) -> pl.DataFrame:
+    import polars as pl
 
     raw_schema: dict[str, pl.DataType | type[pl.DataType]] = {
         'aggregate_trade_id': pl.Int64,
@@ -278,7 +311,7 @@ def get_spot_aggregate_trades(
         'last_trade_id',
     ]
 
-    return _process(url=url, raw_schema=raw_schema, columns=columns)
+    return _process(payload=payload, raw_schema=raw_schema, columns=columns)
 
 
 def get_spot_candles(
@@ -287,8 +320,6 @@ def get_spot_candles(
     interval: CandleInterval,
     window: typing.Literal['daily', 'monthly'] = 'daily',
 ) -> pl.DataFrame:
-    import polars as pl
-
     url = get_spot_url(
         pair=pair,
         timestamp=timestamp,
@@ -296,6 +327,11 @@ def get_spot_candles(
         interval=interval,
         window=window,
     )
+    return parse_spot_candles(absorb.ops.download_bytes(url), pair=pair)
+
+
+def parse_spot_candles(payload: bytes, pair: str) -> pl.DataFrame:
+    import polars as pl
 
     raw_schema: dict[str, pl.DataType | type[pl.DataType]] = {
         'timestamp': pl.Int64,
@@ -326,11 +362,11 @@ def get_spot_candles(
         'taker_buy_quote_volume',
     ]
 
-    return _process(url=url, raw_schema=raw_schema, columns=columns)
+    return _process(payload=payload, raw_schema=raw_schema, columns=columns)
 
 
 def _process(
-    url: str,
+    payload: bytes,
     raw_schema: dict[str, pl.DataType | type[pl.DataType]],
     columns: list[str | pl.Expr],
 ) -> pl.DataFrame:
@@ -346,8 +382,8 @@ def _process(
     )
 
     return (
-        absorb.ops.download_csv_zip_to_dataframe(
-            url, polars_kwargs={'schema': raw_schema, 'has_header': False}
+        absorb.ops.read_csv_zip_bytes(
+            payload, polars_kwargs={'schema': raw_schema, 'has_header': False}
         )
         .with_columns(datetime_column)
         .select(columns)
@@ -19,6 +19,7 @@ class Mempool(absorb.Table):
     write_range = 'append_only'
     chunk_size = 'hour'
     index_column = 'detecttime'
+    parquet_options = {'compression_level': 10, 'row_group_size': 100_000}
 
     def get_schema(self) -> dict[str, pl.DataType | type[pl.DataType]]:
         import polars as pl
@@ -53,16 +54,23 @@ class Mempool(absorb.Table):
             'detect_date': pl.String,
         }
 
-    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+    def fetch_chunk_payload(self, chunk: absorb.Chunk) -> bytes | None:
         url = url_template.format(
             year=chunk.year,  # type: ignore
             month=chunk.month,  # type: ignore
             day=chunk.day,  # type: ignore
             hour=chunk.hour,  # type: ignore
         )
+        return absorb.ops.download_bytes(url)
+
+    def parse_chunk_payload(
+        self, chunk: absorb.Chunk, payload: bytes
+    ) -> absorb.ChunkResult | None:
+        import polars as pl
+
         polars_kwargs = {'separator': '\t', 'schema': self.get_schema()}
-        return absorb.ops.download_csv_gz_to_dataframe(
-            url=url, polars_kwargs=polars_kwargs
+        return absorb.ops.read_csv_gz_bytes(
+            payload, polars_kwargs=polars_kwargs
         ).with_columns(
             pl.col.detecttime.str.to_datetime(time_unit='us', time_zone='UTC')
         )
@@ -15,11 +15,19 @@ endpoints = {
     'historical_coin_prices': 'https://api.coingecko.com/api/v3/coins/{id}/market_chart',
 }
 
+# public api allows ~10 requests per minute, demo api keys allow 30
+rate_limit: absorb.RateLimit = {
+    'requests_per_second': 1 / 6,
+    'burst': 1,
+    'tiers': {'demo': {'requests_per_second': 0.5, 'burst': 5}},
+}
+
 
 class CoinMetrics(absorb.Table):
     source = 'coingecko'
     description = 'Price, market cap, and volume data for coins'
     url = 'https://coingecko.com/'
+    rate_limit = rate_limit
     write_range = 'overwrite_all'
     index_type = 'temporal'
     parameter_types = {'top_n': int}
@@ -58,6 +66,7 @@ class Categories(absorb.Table):
     source = 'coingecko'
     description = 'Categorizations of coins'
     url = 'https://coingecko.com/'
+    rate_limit = rate_limit
     write_range = 'overwrite_all'
     index_type = 'id'
     index_column = ('coin', 'category')
@@ -90,6 +99,7 @@ class CategoryMetrics(absorb.Table):
     source = 'coingecko'
     description = 'Aggregated metrics for each category of coins'
     url = 'https://coingecko.com/'
+    rate_limit = rate_limit
     write_range = 'overwrite_all'
     index_type = 'temporal'
     parameter_types = {'categories': (list, type(None))}
@@ -133,7 +143,6 @@ def _fetch(
     api_key: str | None = None,
 ) -> typing.Any:
     import time
-    import requests
 
     headers = {'accept': 'application/json'}
     if api_key is None:
@@ -146,9 +155,15 @@ def _fetch(
     url = endpoints[datatype].format(**url_params)
     # response = session.get(url, headers=headers, params=params)
 
+    if api_key is not None:
+        tier = 'demo'
+    else:
+        tier = None
+
     n_attempts = 5
     for i in range(n_attempts):
-        response = requests.get(url, headers=headers, params=params)
+        absorb.ops.wait_for_rate_limit('coingecko', rate_limit, tier=tier)
+        response = absorb.ops.http_get(url, headers=headers, params=params)
         if response.status_code == 429:
             time.sleep(60 * (i + 1))
             continue
@@ -191,7 +206,6 @@ def get_current_coin_prices(
     category: str | None = None,
     include_price_changes: bool = False,
 ) -> pl.DataFrame:
-    import time
     import math
     import polars as pl
 
@@ -205,7 +219,6 @@ def get_current_coin_prices(
             params['price_change_percentage'] = '7d,14d,30d,200d,1y'
         result = _fetch('current_coin_prices', params=params)
         results.extend(result)
-        time.sleep(6)
         if len(result) == 0:
             break
     schema = {
@@ -244,15 +257,12 @@ def get_current_coin_prices(
 def get_historical_coin_metrics(
     coins: pl.Series | list[str] | int | None = None,
 ) -> pl.DataFrame:
-    import time
     import polars as pl
 
     if coins is None:
         coins = get_current_coin_prices()['id']
-        time.sleep(5)
     elif isinstance(coins, int):
         coins = get_current_coin_prices(coins)['id']
-        time.sleep(5)
 
     print('getting historical data for', len(coins), 'coins')
     dfs = []
@@ -278,20 +288,16 @@ def get_historical_coin_metrics(
         df = df.insert_column(1, pl.lit(coin).alias('coin'))
         dfs.append(df)
 
-        time.sleep(6)
-
     return pl.concat(dfs)
 
 
 def get_current_coin_categories(
     categories: list[str] | pl.Series | None = None,
 ) -> pl.DataFrame:
-    import time
     import polars as pl
 
     if categories is None:
         categories = get_category_list()['category_id']
-        time.sleep(10)
 
     print('getting tokens for', len(categories), 'categories')
     dfs = []
@@ -301,7 +307,6 @@ def get_current_coin_categories(
         if len(result) > 0:
             df = result.select(coin='id', category=pl.lit(category))
             dfs.append(df)
-        time.sleep(30)
     return pl.concat(dfs)
 
 
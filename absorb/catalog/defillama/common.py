@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import typing
 
+import absorb
+
 
 default_root = 'https://api.llama.fi'
 stablecoin_root = 'https://stablecoins.llama.fi'
@@ -54,10 +56,8 @@ endpoints = {
 def _fetch(
     endpoint: str, parameters: dict[str, str] | None = None
 ) -> typing.Any:
-    import requests
-
     url = _get_url(endpoint, parameters)
-    response = requests.get(url, timeout=(5, 60))
+    response = absorb.ops.http_get(url, timeout=(5, 60))
     response.raise_for_status()
     return response.json()
 
@@ -116,13 +116,11 @@ class ChainFees(absorb.Table):
         print('collecting', len(chains), 'chains')
         for c, chain in enumerate(chains, start=1):
             print('[' + str(c) + ' / ' + str(len(chains)) + ']', chain)
-            for i in range(3):
-                try:
-                    df = get_historical_fees_per_protocol_of_chain(chain)
-                    break
-                except Exception as e:
-                    continue
-            else:
+            try:
+                df = self.call_with_retry(
+                    get_historical_fees_per_protocol_of_chain, chain
+                )
+            except Exception:
                 print(f'Failed to fetch data for chain {chain}')
                 continue
             df = df.select(
@@ -8,12 +8,17 @@ if typing.TYPE_CHECKING:
     import polars as pl
 
 
+# one page request every 0.1 seconds
+rate_limit: absorb.RateLimit = {'requests_per_second': 10, 'burst': 1}
+
+
 class FourbyteDatatype(absorb.Table):
     source = 'fourbyte'
     url = 'https://www.4byte.directory/'
     write_range = 'append_only'
     chunk_size = 10000
     index_column = 'id'
+    rate_limit = rate_limit
 
     # custom
     endpoint: str
@@ -57,16 +62,15 @@ def get_tables() -> list[type[absorb.Table]]:
 def scrape_4byte(
     url: str,
     chunk: tuple[int, int],
-    wait_time: float = 0.1,
     min_id: int | None = None,
 ) -> pl.DataFrame:
     import requests
     import polars as pl
-    import time
 
     results = []
     while True:
         # get page
+        absorb.ops.wait_for_rate_limit('fourbyte', rate_limit)
         response = requests.get(url)
         result: dict[str, typing.Any] = response.json()
         results.extend(result['results'])
@@ -82,8 +86,4 @@ def scrape_4byte(
         if url is None:
             break
 
-        # wait between responses
-        if wait_time is not None:
-            time.sleep(wait_time)
-
     return pl.DataFrame(results, orient='row')
@@ -64,7 +64,11 @@ class Metrics(absorb.Table):
         import datetime
 
         first = datetime.datetime(year=2021, month=6, day=30)
-        last = _find_last()
+        seed = None
+        collected = self.get_collected_range()
+        if isinstance(collected, list) and len(collected) > 0:
+            seed = collected[-1][1]
+        last = _find_last(seed=seed)
         return (first, last)
 
 
@@ -172,18 +176,30 @@ def get_date_path(date: datetime.datetime) -> str:
     return path_template.format(year=date.year, month=date.month, day=date.day)
 
 
-def _find_last() -> datetime.datetime:
+def _find_last(seed: datetime.datetime | None = None) -> datetime.datetime:
     import datetime
 
-    current = datetime.datetime.now()
-    current = datetime.datetime(
-        year=current.year, month=current.month, day=current.day
+    initial = datetime.datetime(year=2021, month=6, day=29)
+    today = datetime.datetime.now()
+    today = datetime.datetime(year=today.year, month=today.month, day=today.day)
+
+    def get_url(index: int) -> str:
+        return get_date_url(initial + datetime.timedelta(days=index))
+
+    if seed is not None:
+        seed_index: int | None = (seed.replace(tzinfo=None) - initial).days
+    else:
+        seed_index = None
+    last = absorb.ops.find_last_existing_url(
+        get_url,
+        lower=0,
+        upper=(today - initial).days,
+        seed=seed_index,
+        workers=4,
     )
-    while current > datetime.datetime(year=2021, month=6, day=28):
-        if absorb.ops.does_remote_file_exist(get_date_url(current)):
-            return current
-        current = current - datetime.timedelta(days=1)
-    raise Exception()
+    if last is None:
+        raise Exception('could not find any kalshi market data files')
+    return initial + datetime.timedelta(days=last)
 
 
 def get_series_data(series_ticker):
@@ -20,11 +20,15 @@ endpoints = {
     'project_activity': root + 'scaling/activity/{project}?range=max',
 }
 
+# per-project endpoints are throttled to one request per 20 seconds
+rate_limit: absorb.RateLimit = {'requests_per_second': 1 / 20, 'burst': 1}
+
 
 class Metrics(absorb.Table):
     source = 'l2beat'
     description = 'On-chain metrics for Ethereum and its rollups'
     url = 'https://l2beat.com/'
+    rate_limit = rate_limit
     write_range = 'overwrite_all'
     row_precision = 'day'
 
@@ -74,6 +78,7 @@ def get_project_activity(project: str) -> pl.DataFrame:
     import requests
     import polars as pl
 
+    absorb.ops.wait_for_rate_limit('l2beat', rate_limit)
     response = requests.get(
         endpoints['project_activity'].format(project=project)
     )
@@ -97,6 +102,7 @@ def get_project_tvs(project: str) -> pl.DataFrame:
     import requests
     import polars as pl
 
+    absorb.ops.wait_for_rate_limit('l2beat', rate_limit)
     response = requests.get(endpoints['project_tvs'].format(project=project))
     data = response.json()
     if not data['success']:
@@ -118,7 +124,6 @@ def get_project_tvs(project: str) -> pl.DataFrame:
 
 def get_all_data(*, projects: pl.DataFrame | None = None) -> pl.DataFrame:
     import polars as pl
-    import time
 
     if projects is None:
         projects = get_projects()
@@ -127,9 +132,7 @@ def get_all_data(*, projects: pl.DataFrame | None = None) -> pl.DataFrame:
     for project in projects.to_dicts():
         print('getting', project['slug'])
         try:
-            time.sleep(20)
             activity = get_project_activity(project['slug'])
-            time.sleep(20)
             tvs = get_project_tvs(project['slug'])
         except Exception as e:
             print('skipping ' + project['slug'] + ' because ' + str(e.args[0]))
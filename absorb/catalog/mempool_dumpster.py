@@ -15,6 +15,7 @@ class Transactions(absorb.Table):
     description = 'Archive of the Ethereum mempool collected by Flashbots'
     write_range = 'append_only'
     chunk_size = 'day'
+    parquet_options = {'compression_level': 10, 'row_group_size': 100_000}
 
     def get_schema(self) -> dict[str, pl.DataType | type[pl.DataType]]:
         import polars as pl
@@ -71,20 +72,36 @@ class Transactions(absorb.Table):
     def get_available_range(self) -> absorb.Coverage:
         import datetime
 
-        current = datetime.datetime.now()
-        current = datetime.datetime(
-            year=current.year, month=current.month, day=current.day
+        today = datetime.datetime.now()
+        today = datetime.datetime(
+            year=today.year, month=today.month, day=today.day
         )
-        current = current + datetime.timedelta(days=1)
         initial = datetime.datetime(year=2023, month=8, day=8)
-        while current > initial:
-            url = url_template.format(
-                year=current.year, month=current.month, day=current.day
+
+        # search outward from the last collected day instead of walking
+        # backward from today one request at a time
+        seed = None
+        collected = self.get_collected_range()
+        if isinstance(collected, list) and len(collected) > 0:
+            last_collected = collected[-1][1].replace(tzinfo=None)
+            seed = (last_collected - initial).days
+
+        def get_url(index: int) -> str:
+            day = initial + datetime.timedelta(days=index)
+            return url_template.format(
+                year=day.year, month=day.month, day=day.day
             )
-            if absorb.ops.does_remote_file_exist(url):
-                break
-            current -= datetime.timedelta(days=1)
-        return (initial, current)
+
+        last = absorb.ops.find_last_existing_url(
+            get_url,
+            lower=0,
+            upper=(today - initial).days + 1,
+            seed=seed,
+            workers=4,
+        )
+        if last is None:
+            return (initial, initial)
+        return (initial, initial + datetime.timedelta(days=last))
 
     def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
         url = url_template.format(
@@ -92,7 +109,7 @@ class Transactions(absorb.Table):
             month=chunk.month,  # type: ignore
             day=chunk.day,  # type: ignore
         )
-        return absorb.ops.download_parquet_to_dataframe(url)
+        return self.download_chunk_file(chunk, url)
 
     # @classmethod
     # def scan(
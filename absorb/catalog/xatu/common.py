@@ -6,16 +6,17 @@ import absorb
 
 if typing.TYPE_CHECKING:
     import datetime
-    import polars as pl
 
 
 root_url = 'https://data.ethpandaops.io/xatu'
 
 url_templates = {
     'per_day': root_url
-    + '{network}/databases/default/{datatype}/{year}/{month}/{day}.parquet',
+    + '/{network}/databases/default/{datatype}/{year}/{month}/{day}.parquet',
     'per_hour': root_url
-    + '{network}/databases/default/{datatype}/{year}/{month}/{day}/{hour}.parquet',
+    + '/{network}/databases/default/{datatype}/{year}/{month}/{day}/{hour}.parquet',
+    'per_number_range': root_url
+    + '/{network}/databases/default/{datatype}/{number_interval}/{chunk_index}.parquet',
 }
 
 
@@ -30,12 +31,23 @@ class XatuTable(absorb.Table):
     required_packages = ['yaml >= 5.4.1']
 
     def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
-        return _fetch(
-            datatype=self.datatype,
-            network=self.parameters['network'],
-            timestamp=chunk,  # type: ignore
-            per=self.per,
-        )
+        number_interval = absorb.ops.get_number_interval(self.get_chunk_size())
+        if number_interval is not None:
+            start, end = typing.cast(tuple[int, int], chunk)
+            url = _get_number_range_url(
+                datatype=self.datatype,
+                network=self.parameters['network'],
+                start=start,
+                number_interval=number_interval,
+            )
+        else:
+            url = _get_url(
+                datatype=self.datatype,
+                network=self.parameters['network'],
+                timestamp=chunk,  # type: ignore
+                per=self.per,
+            )
+        return self.download_chunk_file(chunk, url)
 
     def get_available_range(self) -> absorb.Coverage:
         return get_table_range(
@@ -43,19 +55,29 @@ class XatuTable(absorb.Table):
         )
 
 
-def _fetch(
+def _get_url(
     datatype: str, network: str, timestamp: datetime.datetime, per: str
-) -> pl.DataFrame:
+) -> str:
     url_template = url_templates['per_' + per]
-    url = url_template.format(
+    return url_template.format(
         network=network,
-        datatpye=datatype,
+        datatype=datatype,
         year=timestamp.year,
         month=timestamp.month,
         day=timestamp.day,
         hour=timestamp.hour,
     )
-    return absorb.ops.download_parquet_to_dataframe(url)
+
+
+def _get_number_range_url(
+    datatype: str, network: str, start: int, number_interval: int
+) -> str:
+    return url_templates['per_number_range'].format(
+        network=network,
+        datatype=datatype,
+        number_interval=number_interval,
+        chunk_index=start // number_interval,
+    )
 
 
 @functools.lru_cache()
@@ -39,6 +39,39 @@ def collect_command(args: Namespace) -> dict[str, Any]:
             absorb.ops.print_bullet(key=name, value=None, number=d + 1)
         print()
 
+    # discard cached available ranges so that they are fetched again
+    if args.refresh_available:
+        absorb.ops.clear_cached_available_ranges(datasets)
+
+    # collect datasets concurrently through the scheduler
+    source_limits = cli_parsing._parse_source_limits(args.source_limits)
+    use_scheduler = (
+        len(datasets) > 1
+        and (args.parallel > 1 or len(source_limits) > 0)
+        and not args.dry
+        and not args.setup_only
+    )
+    if use_scheduler:
+        statuses = absorb.ops.collect_tables(
+            datasets,
+            max_workers=args.parallel,
+            source_limits=source_limits,
+            data_range=cli_parsing._parse_ranges(args.range),
+            verbose=args.verbose,
+            overwrite=args.overwrite,
+            workers=args.workers,
+            executor=args.executor,
+            processes=args.processes,
+        )
+        failed = [status for status in statuses if status['status'] == 'failed']
+        if len(failed) > 0:
+            import sys
+
+            print()
+            print(str(len(failed)) + ' datasets failed to collect')
+            sys.exit(1)
+        return {}
+
     # collect each dataset
     first = True
     for dataset in datasets:
@@ -60,6 +93,9 @@ def collect_command(args: Namespace) -> dict[str, Any]:
                 dry=args.dry,
                 overwrite=args.overwrite,
                 verbose=args.verbose,
+                workers=args.workers,
+                executor=args.executor,
+                processes=args.processes,
             )
         first = False
 
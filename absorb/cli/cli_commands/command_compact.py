@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import typing
+
+import absorb
+from .. import cli_parsing
+
+if typing.TYPE_CHECKING:
+    from argparse import Namespace
+
+
+def compact_command(args: Namespace) -> dict[str, typing.Any]:
+    import os
+    import toolstr
+
+    tables = cli_parsing._parse_datasets(args)
+
+    results = {}
+    for table in tables:
+        toolstr.print_text_box(table.full_name(), style='green')
+        result = absorb.ops.compact_table(table, args.interval, dry=args.dry)
+        results[table.full_name()] = result
+
+        if args.dry:
+            key = 'files that would be created'
+        else:
+            key = 'files created'
+        absorb.ops.print_bullet(
+            key=key, value=str(len(result['compacted_paths']))
+        )
+        for path in result['compacted_paths']:
+            toolstr.print_bullet(
+                value=os.path.basename(path), key=None, indent=4
+            )
+        absorb.ops.print_bullet(
+            key='data files',
+            value=str(result['n_files_before'])
+            + ' -> '
+            + str(result['n_files_after']),
+        )
+        print()
+
+    return {'results': results}
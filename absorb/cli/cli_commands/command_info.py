@@ -16,6 +16,10 @@ def info_command(args: argparse.Namespace) -> dict[str, typing.Any]:
         print('specify dataset to print info')
         sys.exit(0)
 
+    # discard cached available ranges so that they are fetched again
+    if args.refresh_available:
+        absorb.ops.clear_cached_available_ranges()
+
     if '.' in args.dataset_or_source:
         return print_dataset_info(
             table_str=args.dataset_or_source, verbose=args.verbose
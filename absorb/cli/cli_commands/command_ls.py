@@ -27,6 +27,10 @@ def ls_command(args: Namespace) -> dict[str, Any]:
     if args.untracked_collected:
         sections.add('untracked_collected')
 
+    # discard cached available ranges so that they are fetched again
+    if args.refresh_available:
+        absorb.ops.clear_cached_available_ranges()
+
     # available datasets
     if 'available' in sections:
         cli_outputs._print_title('Available datasets')
@@ -207,7 +211,7 @@ def _print_datasets_verbose(datasets: list[absorb.TableDict]) -> None:
     rows = []
     for dataset in datasets:
         instance = absorb.Table.instantiate(dataset)
-        available_range = instance.get_available_range()
+        available_range = instance.get_cached_available_range()
         available_range_str = absorb.ops.format_coverage(
             available_range, instance.get_chunk_size()
         )
@@ -15,32 +15,49 @@ def preview_command(args: Namespace) -> dict[str, Any]:
     import toolstr
 
     datasets = cli_parsing._parse_datasets(args)
+    start, end = cli_parsing._parse_range(args.range)
     for dataset in datasets:
-        absorb.ops.preview(dataset, n_rows=args.count, offset=args.offset)
+        absorb.ops.preview(
+            dataset,
+            n_rows=args.count,
+            offset=args.offset,
+            start=start,
+            end=end,
+        )
 
     # load interactive previews
     if args.interactive:
         if len(datasets) == 1:
             dataset = datasets[0]
             dataset_n_rows = (
-                absorb.ops.scan(dataset).select(pl.len()).collect().item()
+                absorb.ops.scan(dataset, start=start, end=end)
+                .select(pl.len())
+                .collect()
+                .item()
             )
             if dataset_n_rows <= 1_000_000:
-                return {'df': absorb.ops.load(dataset)}
+                return {'df': absorb.ops.load(dataset, start=start, end=end)}
             else:
-                return {'lf': absorb.ops.scan(dataset)}
+                return {'lf': absorb.ops.scan(dataset, start=start, end=end)}
         else:
             dfs = {}
             lfs = {}
             for dataset in datasets:
                 table_name = dataset.full_name()
                 dataset_n_rows = (
-                    absorb.ops.scan(dataset).select(pl.len()).collect().item()
+                    absorb.ops.scan(dataset, start=start, end=end)
+                    .select(pl.len())
+                    .collect()
+                    .item()
                 )
                 if dataset_n_rows <= 1_000_000:
-                    dfs[table_name] = absorb.ops.load(dataset)
+                    dfs[table_name] = absorb.ops.load(
+                        dataset, start=start, end=end
+                    )
                 else:
-                    lfs[table_name] = absorb.ops.scan(dataset)
+                    lfs[table_name] = absorb.ops.scan(
+                        dataset, start=start, end=end
+                    )
             outputs: dict[str, typing.Any] = {}
             if len(dfs) > 0:
                 outputs['dfs'] = dfs
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import typing
+
+import absorb
+from .. import cli_parsing
+
+if typing.TYPE_CHECKING:
+    from argparse import Namespace
+
+
+def recompress_command(args: Namespace) -> dict[str, typing.Any]:
+    import toolstr
+
+    tables = cli_parsing._parse_datasets(args)
+
+    results = {}
+    for table in tables:
+        # override parquet options of table with those given as arguments
+        parquet_options = table.get_parquet_options()
+        if args.compression is not None:
+            parquet_options['compression'] = args.compression
+            parquet_options['compression_level'] = None
+        if args.compression_level is not None:
+            parquet_options['compression_level'] = args.compression_level
+        if args.row_group_size is not None:
+            parquet_options['row_group_size'] = args.row_group_size
+
+        toolstr.print_text_box(table.full_name(), style='green')
+        absorb.ops.print_bullet(
+            key='parquet options', value=str(parquet_options)
+        )
+        result = absorb.ops.recompress_table(
+            table, parquet_options, dry=args.dry
+        )
+        results[table.full_name()] = result
+        _print_recompress_result(result, dry=args.dry)
+        print()
+
+    return {'results': results}
+
+
+def _print_recompress_result(
+    result: absorb.RecompressResult, dry: bool
+) -> None:
+    if dry:
+        absorb.ops.print_bullet(
+            key='files checked', value=str(result['n_files'])
+        )
+    else:
+        absorb.ops.print_bullet(
+            key='files rewritten', value=str(result['n_files'])
+        )
+    if result['n_files'] == 0:
+        return
+
+    bytes_saved = result['bytes_before'] - result['bytes_after']
+    if bytes_saved >= 0:
+        saved = absorb.ops.format_bytes(bytes_saved)
+    else:
+        saved = '-' + absorb.ops.format_bytes(-bytes_saved)
+    absorb.ops.print_bullet(
+        key='size',
+        value=absorb.ops.format_bytes(result['bytes_before'])
+        + ' -> '
+        + absorb.ops.format_bytes(result['bytes_after'])
+        + ' ('
+        + saved
+        + ' saved, '
+        + _format_percent_change(result['bytes_before'], result['bytes_after'])
+        + ')',
+    )
+    absorb.ops.print_bullet(
+        key='read time',
+        value='%.3fs -> %.3fs (%s)'
+        % (
+            result['read_seconds_before'],
+            result['read_seconds_after'],
+            _format_percent_change(
+                result['read_seconds_before'], result['read_seconds_after']
+            ),
+        ),
+    )
+
+
+def _format_percent_change(before: float, after: float) -> str:
+    if before == 0:
+        return 'n/a'
+    return '%+.1f%%' % (100 * (after - before) / before)
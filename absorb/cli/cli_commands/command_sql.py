@@ -12,7 +12,10 @@ if typing.TYPE_CHECKING:
 
 
 def sql_command(args: Namespace) -> dict[str, Any]:
-    lf = absorb.ops.sql_query(args.sql, backend=args.backend)
+    start, end = cli_parsing._parse_range(args.range)
+    lf = absorb.ops.sql_query(
+        args.sql, backend=args.backend, lazy=True, start=start, end=end
+    )
     df = lf.collect()
     print(df)
 
@@ -141,9 +141,16 @@ def validate_command(args: Namespace) -> dict[str, Any]:
             # check there are no extra files beyond metadata and parquet files
             target_parquet_files = glob.glob(instance.get_data_glob())
             for filename in os.listdir(table_dir):
-                if filename == os.path.basename(metadata_path):
+                if filename in [
+                    os.path.basename(metadata_path),
+                    os.path.basename(instance.get_journal_path()),
+                    os.path.basename(instance.get_manifest_path()),
+                    os.path.basename(instance.get_coverage_path()),
+                ]:
                     continue
                 path = os.path.join(table_dir, filename)
+                if instance.file_layout == 'hive' and os.path.isdir(path):
+                    continue
                 if path not in target_parquet_files:
                     errors.append(
                         source
@@ -155,6 +162,52 @@ def validate_command(args: Namespace) -> dict[str, Any]:
                         + table_dir
                     )
 
+            # check that manifest lists exactly the data files
+            manifest_path = instance.get_manifest_path()
+            if os.path.isfile(manifest_path):
+                manifest_files = set(absorb.ops.read_manifest(manifest_path))
+                data_files = {
+                    os.path.relpath(path, table_dir)
+                    for path in target_parquet_files
+                }
+                for filename in sorted(data_files - manifest_files):
+                    errors.append(
+                        source
+                        + '.'
+                        + table
+                        + ' manifest is missing data file '
+                        + filename
+                    )
+                for filename in sorted(manifest_files - data_files):
+                    errors.append(
+                        source
+                        + '.'
+                        + table
+                        + ' manifest lists missing data file '
+                        + filename
+                    )
+
+            # check that every data file name parses as a chunk
+            if (
+                '{chunk}' in instance.filename_template
+                and instance.write_range != 'overwrite_all'
+                and instance.get_chunk_size() is not None
+            ):
+                chunks = instance.parse_chunk_paths(
+                    sorted(target_parquet_files)
+                )
+                for path, is_null in zip(
+                    sorted(target_parquet_files), chunks.is_null().to_list()
+                ):
+                    if is_null:
+                        errors.append(
+                            source
+                            + '.'
+                            + table
+                            + ' has data file with unparseable chunk '
+                            + os.path.basename(path)
+                        )
+
     # validate tracked datasets
     config = absorb.ops.get_config()
     for metadata in config['tracked_tables']:
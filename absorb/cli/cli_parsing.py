@@ -53,6 +53,13 @@ def get_subcommands() -> list[
                         'help': 'list one dataset per line',
                     },
                 ),
+                (
+                    ['--refresh-available'],
+                    {
+                        'action': 'store_true',
+                        'help': 'refetch available ranges instead of using cached ones',
+                    },
+                ),
                 (
                     ['-v', '--verbose'],
                     {
@@ -82,6 +89,13 @@ def get_subcommands() -> list[
                         'help': 'show verbose details',
                     },
                 ),
+                (
+                    ['--refresh-available'],
+                    {
+                        'action': 'store_true',
+                        'help': 'refetch available ranges instead of using cached ones',
+                    },
+                ),
             ],
         ),
         (
@@ -127,6 +141,54 @@ def get_subcommands() -> list[
                         'help': 'only setup the table directory, do not collect data',
                     },
                 ),
+                (
+                    ['--workers'],
+                    {
+                        'type': _positive_int,
+                        'help': 'number of chunks to collect concurrently',
+                        'metavar': 'N',
+                    },
+                ),
+                (
+                    ['--executor'],
+                    {
+                        'choices': ['thread', 'process'],
+                        'default': 'thread',
+                        'help': 'parse chunks in threads or worker processes',
+                    },
+                ),
+                (
+                    ['--processes'],
+                    {
+                        'type': _positive_int,
+                        'help': 'worker processes for --executor process',
+                        'metavar': 'N',
+                    },
+                ),
+                (
+                    ['--parallel'],
+                    {
+                        'type': _positive_int,
+                        'default': 1,
+                        'help': 'number of datasets to collect at once',
+                        'metavar': 'N',
+                    },
+                ),
+                (
+                    ['--source-limits'],
+                    {
+                        'nargs': '+',
+                        'help': 'max datasets per source at once, e.g. coingecko=1',
+                        'metavar': 'SOURCE=N',
+                    },
+                ),
+                (
+                    ['--refresh-available'],
+                    {
+                        'action': 'store_true',
+                        'help': 'refetch available ranges instead of using cached ones',
+                    },
+                ),
                 (
                     ['-v', '--verbose'],
                     {
@@ -331,6 +393,13 @@ def get_subcommands() -> list[
                         'help': 'number of rows to preview',
                     },
                 ),
+                (
+                    ['--range'],
+                    {
+                        'help': 'range of data to preview',
+                        'metavar': 'RANGE',
+                    },
+                ),
             ],
         ),
         (
@@ -358,6 +427,13 @@ def get_subcommands() -> list[
                         'metavar': 'FILE',
                     },
                 ),
+                (
+                    ['--range'],
+                    {
+                        'help': 'range of data to query from each table',
+                        'metavar': 'RANGE',
+                    },
+                ),
             ],
         ),
         (
@@ -506,6 +582,100 @@ def get_subcommands() -> list[
                 ),
             ],
         ),
+        (
+            'compact',
+            'merge data files of closed months or years into single files',
+            [
+                (
+                    ['dataset'],
+                    {
+                        'nargs': '+',
+                        'help': 'dataset to compact, format as "<source>.<dataset>"',
+                    },
+                ),
+                (
+                    ['--parameters'],
+                    {
+                        'nargs': '*',
+                        'help': 'dataset parameters',
+                        'metavar': 'PARAMS',
+                    },
+                ),
+                (
+                    ['--interval'],
+                    {
+                        'choices': ['month', 'year'],
+                        'default': 'month',
+                        'help': 'size of compacted files [default: month]',
+                    },
+                ),
+                (
+                    ['--dry'],
+                    {
+                        'action': 'store_true',
+                        'help': 'list files that would be created without compacting',
+                    },
+                ),
+            ],
+        ),
+        (
+            'recompress',
+            'rewrite collected data files with new parquet options',
+            [
+                (
+                    ['dataset'],
+                    {
+                        'nargs': '+',
+                        'help': 'dataset to recompress, format as "<source>.<dataset>"',
+                    },
+                ),
+                (
+                    ['--parameters'],
+                    {
+                        'nargs': '*',
+                        'help': 'dataset parameters',
+                        'metavar': 'PARAMS',
+                    },
+                ),
+                (
+                    ['--compression'],
+                    {
+                        'choices': [
+                            'lz4',
+                            'uncompressed',
+                            'snappy',
+                            'gzip',
+                            'brotli',
+                            'zstd',
+                        ],
+                        'help': 'compression codec [default: parquet_options of table]',
+                    },
+                ),
+                (
+                    ['--compression-level'],
+                    {
+                        'type': int,
+                        'help': 'compression level of codec',
+                        'metavar': 'LEVEL',
+                    },
+                ),
+                (
+                    ['--row-group-size'],
+                    {
+                        'type': _positive_int,
+                        'help': 'number of rows per row group',
+                        'metavar': 'ROWS',
+                    },
+                ),
+                (
+                    ['--dry'],
+                    {
+                        'action': 'store_true',
+                        'help': 'report effect of recompression without rewriting files',
+                    },
+                ),
+            ],
+        ),
         (
             'upload',
             'upload datasets to a cloud bucket',
@@ -698,6 +868,15 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def _positive_int(raw: str) -> int:
+    import argparse
+
+    value = int(raw)
+    if value < 1:
+        raise argparse.ArgumentTypeError('must be at least 1')
+    return value
+
+
 def _parse_datasets(args: argparse.Namespace) -> list[absorb.Table]:
     """parse the datasets parameter into a list of instantiated Tables"""
     # parse parameters
@@ -716,6 +895,20 @@ def _parse_datasets(args: argparse.Namespace) -> list[absorb.Table]:
     return tables
 
 
+def _parse_source_limits(
+    raw_source_limits: list[str] | None,
+) -> dict[str, int]:
+    if raw_source_limits is None:
+        return {}
+    source_limits = {}
+    for raw in raw_source_limits:
+        source, _, raw_limit = raw.partition('=')
+        if source == '' or not raw_limit.isdigit() or int(raw_limit) < 1:
+            raise Exception('invalid source limit: ' + raw)
+        source_limits[source] = int(raw_limit)
+    return source_limits
+
+
 def _parse_ranges(
     raw_ranges: list[str] | None,
 ) -> list[tuple[datetime.datetime | None, datetime.datetime | None]] | None:
@@ -782,6 +975,18 @@ def _parse_ranges(
     return output
 
 
+def _parse_range(
+    raw_range: str | None,
+) -> tuple[datetime.datetime | None, datetime.datetime | None]:
+    """parse single range in a format of _parse_ranges()"""
+    if raw_range is None:
+        return (None, None)
+    parsed = _parse_ranges([raw_range])
+    if parsed is None or len(parsed) != 1:
+        raise ValueError('Invalid range format: ' + str(raw_range))
+    return parsed[0]
+
+
 def _parse_bucket(args: argparse.Namespace) -> absorb.Bucket:
     default_bucket = absorb.ops.get_config()['default_bucket']
     if args.rclone_remote is not None:
@@ -6,11 +6,15 @@ from .env import *
 from .formatting import *
 from .git import *
 from .io import *
+from .journal import *
+from .manifest import *
 from .names import *
 from .networking import *
 from .parsing import *
 from .paths import *
+from .pipelines import *
 from .queries import *
 from .ranges import *
+from .scheduling import *
 from .schemas import *
 from .validation import *
@@ -72,8 +72,8 @@ def scan_bucket(
     import polars as pl
 
     glob = get_table_bucket_glob(bucket=bucket, table=table)
-    if scan_kwargs is None:
-        scan_kwargs = {}
+    table = absorb.Table.instantiate(table)
+    scan_kwargs = dict(table.get_hive_scan_kwargs(), **(scan_kwargs or {}))
     if verbose:
         print('scanning remote bucket:', glob)
     return pl.scan_parquet(glob, **scan_kwargs)
@@ -192,6 +192,10 @@ def get_table_bucket_glob(
         raise Exception()
 
     raw_path = get_raw_bucket_path(table=table, bucket=bucket)
+    table = absorb.Table.instantiate(table)
+    if table.file_layout == 'hive':
+        keys = absorb.ops.get_hive_partition_keys(table.get_chunk_size())
+        raw_path += ''.join('/' + key + '=*' for key in keys)
     return protocol + '://' + raw_path + '/*.parquet'
 
 
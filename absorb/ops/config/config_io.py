@@ -27,6 +27,12 @@ def get_default_config() -> absorb.Config:
             'rclone_remote': None,
             'path_prefix': None,
         },
+        'parquet_options': {
+            'compression': 'zstd',
+            'compression_level': None,
+            'statistics': True,
+            'row_group_size': None,
+        },
     }
 
 
@@ -6,10 +6,10 @@ import absorb
 
 
 def get_available_range(
-    dataset: absorb.TableReference,
+    dataset: absorb.TableReference, *, refresh: bool = False
 ) -> absorb.Coverage | None:
     table = absorb.Table.instantiate(dataset)
-    return table.get_available_range()
+    return table.get_cached_available_range(refresh=refresh)
 
 
 def get_collected_range(
@@ -52,3 +52,118 @@ def get_untracked_collected_tables(
         for dataset in get_collected_tables()
         if json.dumps(dataset, sort_keys=True) not in hashed_tracked_datasets
     ]
+
+
+#
+# # available range cache
+#
+
+
+def read_cached_available_range(
+    table: absorb.Table, ttl: float
+) -> tuple[bool, absorb.Coverage | None]:
+    """read available range cached within the last ttl seconds
+
+    returns (hit, available_range), a miss if the cache is missing, expired,
+    or was written by a different table definition
+    """
+    import json
+    import time
+
+    path = _get_available_range_cache_path(table)
+    try:
+        with open(path, 'r') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return False, None
+    if cached.get('table') != _get_table_identity(table):
+        return False, None
+    if time.time() - cached['time'] > ttl:
+        return False, None
+    return True, _decode_coverage(cached['available_range'])
+
+
+def write_cached_available_range(
+    table: absorb.Table, available_range: absorb.Coverage | None
+) -> None:
+    import json
+    import os
+    import time
+
+    path = _get_available_range_cache_path(table)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    cached = {
+        'table': _get_table_identity(table),
+        'time': time.time(),
+        'available_range': _encode_coverage(available_range),
+    }
+    tmp_path = path + '_' + str(os.getpid()) + '_tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cached, f)
+    os.replace(tmp_path, path)
+
+
+def clear_cached_available_ranges(
+    tables: list[absorb.Table] | None = None,
+) -> None:
+    """remove cached available ranges of tables, or of every table if None"""
+    import glob
+    import os
+
+    if tables is None:
+        cache_dir = absorb.ops.get_available_range_cache_dir()
+        paths = glob.glob(os.path.join(cache_dir, '*.json'))
+    else:
+        paths = [_get_available_range_cache_path(table) for table in tables]
+    for path in paths:
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def _get_available_range_cache_path(table: absorb.Table) -> str:
+    import os
+
+    cache_dir = absorb.ops.get_available_range_cache_dir()
+    return os.path.join(cache_dir, table.full_name() + '.json')
+
+
+def _get_table_identity(table: absorb.Table) -> str:
+    import json
+
+    return json.dumps(table.create_table_dict(), sort_keys=True)
+
+
+def _encode_coverage(value: typing.Any) -> typing.Any:
+    import datetime
+
+    if isinstance(value, datetime.datetime):
+        return {'datetime': value.isoformat()}
+    elif isinstance(value, tuple):
+        return {'tuple': [_encode_coverage(item) for item in value]}
+    elif isinstance(value, list):
+        return [_encode_coverage(item) for item in value]
+    elif isinstance(value, dict):
+        return {
+            'dict': {key: _encode_coverage(item) for key, item in value.items()}
+        }
+    else:
+        return value
+
+
+def _decode_coverage(value: typing.Any) -> typing.Any:
+    import datetime
+
+    if isinstance(value, dict):
+        if 'datetime' in value:
+            return datetime.datetime.fromisoformat(value['datetime'])
+        elif 'tuple' in value:
+            return tuple(_decode_coverage(item) for item in value['tuple'])
+        else:
+            return {
+                key: _decode_coverage(item)
+                for key, item in value['dict'].items()
+            }
+    elif isinstance(value, list):
+        return [_decode_coverage(item) for item in value]
+    else:
+        return value
@@ -35,6 +35,9 @@ def format_coverage(
 ) -> str:
     if coverage is None:
         return 'None'
+    if isinstance(chunk_size, dict):
+        # ranges of number_range chunks are in units of the index
+        chunk_size = None
     if isinstance(coverage, tuple):
         start, end = coverage
         return (
@@ -43,13 +46,18 @@ def format_coverage(
             + format_chunk(end, chunk_size)
         )
     elif isinstance(coverage, list):
+        if len(coverage) == 0:
+            return 'None'
         start = min(coverage)[0]
-        end = max(coverage)[0]
-        return (
+        end = max(coverage)[1]
+        formatted = (
             format_chunk(start, chunk_size)
             + '_to_'
             + format_chunk(end, chunk_size)
         )
+        if len(coverage) > 1:
+            formatted += ' (' + str(len(coverage) - 1) + ' gaps)'
+        return formatted
     elif isinstance(coverage, dict):
         raise NotImplementedError()
     else:
@@ -78,7 +86,7 @@ def format_chunk(
         elif chunk.month == 4 and chunk.day == 1:  # type: ignore
             quarter = 2
         elif chunk.month == 7 and chunk.day == 1:  # type: ignore
-            quarter = 4
+            quarter = 3
         elif chunk.month == 10 and chunk.day == 1:  # type: ignore
             quarter = 4
         else:
@@ -91,7 +99,10 @@ def format_chunk(
         template = '%0' + str(width) + 'd'
         return template % chunk
     elif isinstance(chunk_size, dict):
-        raise NotImplementedError('chunk_size as dict not implemented')
+        if absorb.ops.get_number_interval(chunk_size) is None:
+            raise NotImplementedError('chunk_size as dict not implemented')
+        start, end = chunk  # type: ignore
+        return '%010d_to_%010d' % (start, end)
     else:
         raise Exception('invalid chunk_size format: ' + str(type(chunk_size)))
 
@@ -105,7 +116,12 @@ def format_bytes(bytes_size: int | float) -> str:
 
 
 def preview(
-    dataset: absorb.TableReference, offset: int | None, n_rows: int | None
+    dataset: absorb.TableReference,
+    offset: int | None,
+    n_rows: int | None,
+    *,
+    start: typing.Any = None,
+    end: typing.Any = None,
 ) -> None:
     import polars as pl
     import toolstr
@@ -119,7 +135,12 @@ def preview(
     pl.Config.set_tbl_rows(n_rows)
 
     # load dataset preview
-    df = absorb.query(dataset).slice(offset).head(n_rows + 1)
+    df = (
+        absorb.query(dataset, start=start, end=end, lazy=True)
+        .slice(offset)
+        .head(n_rows + 1)
+        .collect()
+    )
 
     # print number of rows in preview
     dataset = absorb.Table.instantiate(dataset)
@@ -135,7 +156,12 @@ def preview(
     print(df.head(n_rows))
 
     # print total number of rows
-    dataset_n_rows = absorb.ops.scan(dataset).select(pl.len()).collect().item()
+    dataset_n_rows = (
+        absorb.ops.scan(dataset, start=start, end=end)
+        .select(pl.len())
+        .collect()
+        .item()
+    )
     print(dataset_n_rows, 'rows,', len(df.columns), 'columns')
 
 
@@ -195,7 +221,7 @@ def print_table_info(
     else:
         # print available range
         if verbose:
-            available_range = table.get_available_range()
+            available_range = table.get_cached_available_range()
             if available_range is not None:
                 formatted_available_range = absorb.ops.format_coverage(
                     available_range, table.get_chunk_size()
@@ -5,6 +5,8 @@ import typing
 import absorb
 
 if typing.TYPE_CHECKING:
+    import zipfile
+
     import polars as pl
 
 
@@ -12,31 +14,70 @@ def scan(
     table: absorb.TableReference,
     *,
     bucket: bool | absorb.Bucket = False,
+    start: typing.Any = None,
+    end: typing.Any = None,
+    columns: typing.Sequence[str] | None = None,
+    filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
     scan_kwargs: dict[str, typing.Any] | None = None,
 ) -> pl.LazyFrame:
+    """start, end, columns, and filter are as in Table.scan()"""
     if bucket:
         if isinstance(bucket, bool):
             bucket = absorb.ops.get_default_bucket()
-        return absorb.ops.scan_bucket(
+        lf = absorb.ops.scan_bucket(
             table=table, bucket=bucket, scan_kwargs=scan_kwargs
         )
+        table = absorb.Table.instantiate(table)
+        lf = table.filter_range(lf, start=start, end=end)
+        return table._filter_and_select(lf, columns=columns, filter=filter)
     else:
         table = absorb.Table.instantiate(table)
-        return table.scan(scan_kwargs=scan_kwargs)
+        return table.scan(
+            start=start,
+            end=end,
+            columns=columns,
+            filter=filter,
+            scan_kwargs=scan_kwargs,
+        )
 
 
 def load(
     table: absorb.TableReference,
     *,
     bucket: bool | absorb.Bucket = False,
+    start: typing.Any = None,
+    end: typing.Any = None,
+    columns: typing.Sequence[str] | None = None,
+    filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
     scan_kwargs: dict[str, typing.Any] | None = None,
 ) -> pl.DataFrame:
     """kwargs are passed to scan()"""
     table = absorb.Table.instantiate(table)
-    return table.load(scan_kwargs=scan_kwargs)
+    return table.load(
+        start=start,
+        end=end,
+        columns=columns,
+        filter=filter,
+        scan_kwargs=scan_kwargs,
+    )
 
 
-def write_file(*, df: pl.DataFrame, path: str) -> None:
+def write_file(
+    *,
+    df: pl.DataFrame,
+    path: str,
+    manifest_path: str | None = None,
+    chunk: str | None = None,
+    index_column: str | None = None,
+    parquet_options: absorb.ParquetOptions | None = None,
+) -> None:
+    """write dataframe to path via a tmp file
+
+    if manifest_path is given, the file is recorded in that manifest once it
+    has been moved into place
+
+    parquet_options defaults to the parquet_options of the config
+    """
     import os
     import shutil
 
@@ -46,13 +87,309 @@ def write_file(*, df: pl.DataFrame, path: str) -> None:
 
     tmp_path = path + '_tmp'
     if path.endswith('.parquet'):
-        df.write_parquet(tmp_path)
+        if parquet_options is None:
+            parquet_options = absorb.ops.get_config()['parquet_options']
+        df.write_parquet(tmp_path, **parquet_options)
     elif path.endswith('.csv'):
         df.write_csv(tmp_path)
     else:
         raise Exception('invalid file extension')
     shutil.move(tmp_path, path)
 
+    if manifest_path is not None:
+        entry = absorb.ops.create_manifest_entry(
+            df=df,
+            path=path,
+            chunk=chunk,
+            index_column=index_column,
+            root=os.path.dirname(manifest_path),
+        )
+        absorb.ops.update_manifest(manifest_path, add=[entry])
+
+
+def recompress_table(
+    table: absorb.TableReference,
+    parquet_options: absorb.ParquetOptions | None = None,
+    *,
+    dry: bool = False,
+) -> absorb.RecompressResult:
+    """rewrite data files of table using parquet_options
+
+    - parquet_options defaults to the parquet options of the table
+    - rows are sorted by the index of the table, as in collect()
+    - read times are for reading every file before and after rewriting
+    - if dry, files are written to a temporary directory and left unchanged
+    """
+    import os
+    import tempfile
+    import time
+    import polars as pl
+
+    table = absorb.Table.instantiate(table)
+    if parquet_options is None:
+        parquet_options = table.get_parquet_options()
+    table_dir = table.get_table_dir()
+    index_column = table._get_manifest_index_column()
+
+    result: absorb.RecompressResult = {
+        'n_files': 0,
+        'bytes_before': 0,
+        'bytes_after': 0,
+        'read_seconds_before': 0.0,
+        'read_seconds_after': 0.0,
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for filename, entry in table.get_manifest().items():
+            if not filename.endswith('.parquet'):
+                continue
+            path = os.path.join(table_dir, filename)
+
+            t_start = time.perf_counter()
+            df = pl.read_parquet(path)
+            result['read_seconds_before'] += time.perf_counter() - t_start
+            df = table._sort_by_index(df)
+            result['bytes_before'] += os.path.getsize(path)
+
+            if dry:
+                new_path = os.path.join(tmp_dir, filename)
+                write_file(
+                    df=df, path=new_path, parquet_options=parquet_options
+                )
+            else:
+                new_path = path
+                write_file(
+                    df=df,
+                    path=new_path,
+                    manifest_path=table.get_manifest_path(),
+                    chunk=entry['chunk'],
+                    index_column=index_column,
+                    parquet_options=parquet_options,
+                )
+            del df
+
+            t_start = time.perf_counter()
+            pl.read_parquet(new_path)
+            result['read_seconds_after'] += time.perf_counter() - t_start
+            result['bytes_after'] += os.path.getsize(new_path)
+            result['n_files'] += 1
+            if dry:
+                os.remove(new_path)
+
+    return result
+
+
+_compactable_chunk_sizes = {
+    'month': ['hour', 'day'],
+    'year': ['hour', 'day', 'month', 'quarter'],
+}
+
+
+def compact_table(
+    table: absorb.TableReference,
+    interval: typing.Literal['month', 'year'] = 'month',
+    *,
+    dry: bool = False,
+) -> absorb.CompactResult:
+    """merge data files of each closed month or year into a single file
+
+    - a period is closed once data has been collected for a later period
+    - only periods whose files form a contiguous range of chunks are merged
+    - merged files use chunks like `<first_chunk>_to_<last_chunk>`, which
+      coverage computations treat as ranges of chunks
+    - if dry, returns the files that would be created without writing them
+    """
+    import collections
+    import os
+    import polars as pl
+
+    table = absorb.Table.instantiate(table)
+    chunk_size = table.get_chunk_size()
+    if table.write_range != 'append_only':
+        raise Exception('only tables with write_range=append_only can compact')
+    if interval not in _compactable_chunk_sizes:
+        raise Exception('interval must be month or year')
+    if chunk_size not in _compactable_chunk_sizes[interval]:
+        raise Exception(
+            'cannot compact chunk_size ' + str(chunk_size) + ' into ' + interval
+        )
+    if table.file_layout == 'hive' and interval == 'year':
+        if 'month' in absorb.ops.get_hive_partition_keys(chunk_size):
+            raise Exception(
+                'cannot compact into years when hive partitions are months'
+            )
+
+    # group files by period
+    manifest = table.get_manifest()
+    filenames = list(manifest.keys())
+    periods: dict[tuple[int, ...], list[tuple[typing.Any, typing.Any, str]]]
+    periods = collections.defaultdict(list)
+    for filename, chunk in zip(
+        filenames, table.parse_chunk_paths(filenames).to_list()
+    ):
+        if chunk is None:
+            continue
+        period = _get_compaction_period(chunk['start'], interval)
+        if period != _get_compaction_period(chunk['end'], interval):
+            continue
+        periods[period].append((chunk['start'], chunk['end'], filename))
+
+    result: absorb.CompactResult = {
+        'n_files_before': len(manifest),
+        'n_files_after': len(manifest),
+        'compacted_paths': [],
+    }
+    if len(periods) == 0:
+        return result
+    latest_period = max(periods.keys())
+    table_dir = table.get_table_dir()
+    for period, files in sorted(periods.items()):
+        # skip periods that are still open or already a single file
+        if period == latest_period or len(files) < 2:
+            continue
+
+        # skip periods with gaps between files
+        files = sorted(files)
+        ranges = absorb.ops.get_contiguous_ranges(
+            [(start, end) for start, end, _ in files], chunk_size
+        )
+        if len(ranges) != 1:
+            continue
+        first, last = ranges[0]
+        chunk_str = (
+            absorb.ops.format_chunk(first, chunk_size)
+            + '_to_'
+            + absorb.ops.format_chunk(last, chunk_size)
+        )
+        path = table.get_chunk_path(chunk=chunk_str)
+        result['compacted_paths'].append(path)
+        result['n_files_after'] -= len(files) - 1
+        if dry:
+            continue
+
+        # write merged file, then swap it for the old files in the manifest
+        old_paths = [
+            os.path.join(table_dir, filename) for _, _, filename in files
+        ]
+        df = pl.concat([pl.read_parquet(old_path) for old_path in old_paths])
+        df = table._sort_by_index(df)
+        write_file(
+            df=df, path=path, parquet_options=table.get_parquet_options()
+        )
+        entry = absorb.ops.create_manifest_entry(
+            df=df,
+            path=path,
+            chunk=chunk_str,
+            index_column=table._get_manifest_index_column(),
+            root=table_dir,
+        )
+        absorb.ops.update_manifest(
+            table.get_manifest_path(), add=[entry], remove=old_paths
+        )
+        for old_path in old_paths:
+            if old_path != path and os.path.isfile(old_path):
+                os.remove(old_path)
+
+    return result
+
+
+def _get_compaction_period(
+    chunk: typing.Any, interval: typing.Literal['month', 'year']
+) -> tuple[int, ...]:
+    if interval == 'month':
+        return (chunk.year, chunk.month)
+    else:
+        return (chunk.year,)
+
+
+def read_csv_gz_bytes(
+    payload: bytes, *, polars_kwargs: dict[str, typing.Any] | None = None
+) -> pl.DataFrame:
+    """read csv.gz payload, polars decompresses and parses the bytes itself"""
+    import polars as pl
+
+    try:
+        if polars_kwargs is None:
+            polars_kwargs = {}
+        return pl.read_csv(payload, **polars_kwargs)
+    except Exception as e:
+        raise Exception(f'Error processing csv.gz file: {str(e)}')
+
+
+def read_csv_zip_bytes(
+    payload: bytes, *, polars_kwargs: dict[str, typing.Any] | None = None
+) -> pl.DataFrame:
+    """read csv.zip payload, decompressed bytes are parsed without decoding"""
+    import io
+    import zipfile
+    import polars as pl
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(payload), 'r') as z:
+            csv_bytes = z.read(_get_zip_csv_filename(z))
+        if polars_kwargs is None:
+            polars_kwargs = {}
+        return pl.read_csv(csv_bytes, **polars_kwargs)
+    except Exception as e:
+        raise Exception(f'Error processing csv.zip file: {str(e)}')
+
+
+def iter_csv_archive_batches(
+    payload: bytes,
+    *,
+    batch_bytes: int = 2**22,
+    polars_kwargs: dict[str, typing.Any] | None = None,
+) -> typing.Iterator[pl.DataFrame]:
+    """read csv.gz or csv.zip payload as DataFrames of about batch_bytes of csv
+
+    - the archive is decompressed block by block and each block is cut at its
+      last newline, so peak memory is about one batch rather than the whole
+      csv, rows must not contain quoted newlines
+    - batches after the first use the schema of the first, unless
+      polars_kwargs specifies a schema
+    """
+    import polars as pl
+
+    if polars_kwargs is None:
+        polars_kwargs = {}
+    polars_kwargs = dict(polars_kwargs)
+    with _open_csv_archive(payload) as f:
+        header = b''
+        if polars_kwargs.get('has_header', True):
+            header = f.readline()
+        remainder = b''
+        while True:
+            block = f.read(batch_bytes)
+            if len(block) == 0:
+                break
+            data = remainder + block
+            cut = data.rfind(b'\n') + 1
+            remainder = data[cut:]
+            if cut == 0:
+                continue
+            batch = pl.read_csv(header + data[:cut], **polars_kwargs)
+            polars_kwargs.setdefault('schema', batch.schema)
+            yield batch
+        if len(remainder.strip()) > 0:
+            yield pl.read_csv(header + remainder, **polars_kwargs)
+
+
+def _open_csv_archive(payload: bytes) -> typing.IO[bytes]:
+    import gzip
+    import io
+    import zipfile
+
+    if payload[:2] == b'\x1f\x8b':
+        return gzip.GzipFile(fileobj=io.BytesIO(payload))
+    elif payload[:4] == b'PK\x03\x04':
+        z = zipfile.ZipFile(io.BytesIO(payload), 'r')
+        return z.open(_get_zip_csv_filename(z))
+    else:
+        raise Exception('payload is not a csv.gz or csv.zip file')
+
+
+def _get_zip_csv_filename(z: zipfile.ZipFile) -> str:
+    return [f for f in z.namelist() if f.endswith('.csv')][0]
+
 
 def delete_table_dir(table: absorb.Table, confirm: bool = False) -> None:
     import os
@@ -87,6 +424,9 @@ def delete_table_data(table: absorb.Table, confirm: bool = False) -> None:
     data_glob = table.get_data_glob()
     for path in glob.glob(data_glob):
         os.remove(path)
+    for path in [table.get_manifest_path(), table.get_coverage_path()]:
+        if os.path.isfile(path):
+            os.remove(path)
 
 
 def get_dir_size(path: str) -> int:
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import typing
+
+import absorb
+
+if typing.TYPE_CHECKING:
+    import threading
+
+
+_journal_locks: dict[str, threading.Lock] = {}
+
+
+def write_journal_entries(
+    path: str,
+    chunks: list[str],
+    status: typing.Literal['planned', 'in_flight', 'done', 'failed'],
+    *,
+    error: str | None = None,
+    truncate: bool = False,
+) -> None:
+    """append an entry for each chunk to the journal at path
+
+    - each entry is one json line, so a crash loses at most a partial line
+    - truncate=True starts a new journal, e.g. when planning a new run
+    """
+    import json
+    import threading
+    import time
+
+    now = time.time()
+    lines = []
+    for chunk in chunks:
+        entry: absorb.JournalEntry = {
+            'chunk': chunk,
+            'status': status,
+            'time': now,
+        }
+        if error is not None:
+            entry['error'] = error
+        lines.append(json.dumps(entry) + '\n')
+
+    lock = _journal_locks.setdefault(path, threading.Lock())
+    with lock:
+        with open(path, 'w' if truncate else 'a') as f:
+            f.write(''.join(lines))
+            f.flush()
+
+
+def read_journal(path: str) -> dict[str, absorb.JournalEntry]:
+    """read latest journal entry of each chunk, in the order chunks were planned"""
+    import json
+    import os
+
+    entries: dict[str, absorb.JournalEntry] = {}
+    if not os.path.isfile(path):
+        return entries
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # partial line from a crash mid-write
+                continue
+            entries[entry['chunk']] = entry
+    return entries
+
+
+def get_pending_journal_chunks(path: str) -> list[str]:
+    """get chunks of the journal that were planned but never finished"""
+    return [
+        chunk
+        for chunk, entry in read_journal(path).items()
+        if entry['status'] != 'done'
+    ]
+
+
+def remove_tmp_files(directory: str) -> list[str]:
+    """remove *_tmp files left behind by interrupted calls to write_file()"""
+    import glob
+    import os
+
+    removed = []
+    pattern = os.path.join(directory, '**', '*_tmp')
+    for path in glob.glob(pattern, recursive=True):
+        os.remove(path)
+        removed.append(path)
+    return removed
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import typing
+
+import absorb
+
+if typing.TYPE_CHECKING:
+    import threading
+
+    import polars as pl
+
+
+_manifest_locks: dict[str, threading.Lock] = {}
+
+
+def read_manifest(manifest_path: str) -> dict[str, absorb.ManifestEntry]:
+    """read live entries of manifest, keyed and sorted by data filename"""
+    import json
+    import os
+
+    entries: dict[str, absorb.ManifestEntry] = {}
+    if not os.path.isfile(manifest_path):
+        return entries
+    with open(manifest_path, 'r') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # partial line from a crash mid-write
+                continue
+            if entry.get('removed'):
+                entries.pop(entry['path'], None)
+            else:
+                entries[entry['path']] = entry
+    return dict(sorted(entries.items()))
+
+
+def update_manifest(
+    manifest_path: str,
+    *,
+    add: list[absorb.ManifestEntry] | None = None,
+    remove: list[str] | None = None,
+) -> None:
+    """add or remove manifest entries by appending lines to the manifest
+
+    each update is a single append write, so readers never observe a
+    partially applied update
+    """
+    import json
+    import os
+    import threading
+
+    lines = []
+    for path in remove or []:
+        key = _get_manifest_key(path, os.path.dirname(manifest_path))
+        lines.append(json.dumps({'path': key, 'removed': True}))
+    for entry in add or []:
+        lines.append(json.dumps(entry))
+    if len(lines) == 0:
+        return
+
+    data = ('\n'.join(lines) + '\n').encode()
+    lock = _manifest_locks.setdefault(manifest_path, threading.Lock())
+    with lock:
+        fd = os.open(manifest_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+def write_manifest(
+    manifest_path: str, entries: typing.Iterable[absorb.ManifestEntry]
+) -> None:
+    """replace manifest with entries, via a tmp file and atomic rename"""
+    import json
+    import os
+    import threading
+
+    lock = _manifest_locks.setdefault(manifest_path, threading.Lock())
+    with lock:
+        tmp_path = manifest_path + '_tmp'
+        with open(tmp_path, 'w') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+        os.replace(tmp_path, manifest_path)
+
+
+def create_manifest_entry(
+    *,
+    df: pl.DataFrame,
+    path: str,
+    chunk: str | None,
+    index_column: str | None,
+    root: str | None = None,
+) -> absorb.ManifestEntry:
+    """create manifest entry of data file, keyed by its path relative to root"""
+    import os
+
+    index_min: typing.Any = None
+    index_max: typing.Any = None
+    is_sorted = False
+    if index_column is not None and index_column in df.columns:
+        index_min = _to_json_value(df[index_column].min())
+        index_max = _to_json_value(df[index_column].max())
+        is_sorted = (
+            df[index_column].null_count() == 0 and df[index_column].is_sorted()
+        )
+    return {
+        'path': _get_manifest_key(path, root),
+        'chunk': chunk,
+        'n_rows': df.height,
+        'n_bytes': os.path.getsize(path),
+        'index_min': index_min,
+        'index_max': index_max,
+        'sorted': is_sorted,
+    }
+
+
+def _get_manifest_key(path: str, root: str | None) -> str:
+    """data files in subdirectories of root are keyed by their relative path"""
+    import os
+
+    if root is None or os.path.dirname(path) == '':
+        return os.path.basename(path)
+    return os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+
+
+def parse_manifest_index_value(value: absorb.JSONValue) -> typing.Any:
+    """convert index_min or index_max of a manifest entry to python value"""
+    import datetime
+
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _to_json_value(value: typing.Any) -> absorb.JSONValue:
+    import datetime
+
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    elif isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    else:
+        return str(value)
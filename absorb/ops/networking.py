@@ -2,15 +2,24 @@ from __future__ import annotations
 
 import typing
 
+import absorb
+
 if typing.TYPE_CHECKING:
+    import threading
+
     import polars as pl
+    import requests
+
+
+_rate_limit_locks: dict[str, threading.Lock] = {}
+_host_windows: dict[str, dict[str, typing.Any]] = {}
 
 
 def does_remote_file_exist(url: str) -> bool:
     import requests
 
     try:
-        response = requests.head(url, allow_redirects=True)
+        response = http_request('HEAD', url, allow_redirects=True)
         # Check if status code is 200 (OK) and content-length exists
         if response.status_code == 200 and 'content-length' in response.headers:
             return True
@@ -19,72 +28,431 @@ def does_remote_file_exist(url: str) -> bool:
         return False
 
 
+_download_block_size = 2**20
+
+
 def download_file(*, url: str, path: str) -> None:
-    raise NotImplementedError()
+    """stream body of url to path, via a tmp file next to path
+
+    the body is written in blocks as it arrives, so memory use does not grow
+    with the size of the file
+    """
+    import os
+
+    dirname = os.path.dirname(path)
+    if dirname != '':
+        os.makedirs(dirname, exist_ok=True)
+    tmp_path = path + '_tmp'
+    try:
+        with _stream_response(url) as response:
+            with open(tmp_path, 'wb') as f:
+                for block in response.iter_content(_download_block_size):
+                    f.write(block)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def download_parquet_to_dataframe(url: str) -> pl.DataFrame:
-    import io
-    import requests
+    import os
+    import tempfile
     import polars as pl
 
     try:
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise Exception(
-                f'Failed to download: HTTP status code {response.status_code}'
-            )
-        parquet_buffer = io.BytesIO(response.content)
-        return pl.read_parquet(parquet_buffer)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'download.parquet')
+            download_file(url=url, path=path)
+            return pl.read_parquet(path)
     except Exception as e:
-        raise Exception(f'Error processing parquet file: {str(e)}')
+        raise Exception(f'Error processing parquet file: {str(e)}') from e
 
 
-def download_csv_gz_to_dataframe(
-    url: str, *, polars_kwargs: dict[str, typing.Any] | None = None
-) -> pl.DataFrame:
+def download_bytes(url: str) -> bytes:
+    """download body of url, streamed into a single buffer"""
     import io
-    import gzip
+
+    buffer = io.BytesIO()
+    with _stream_response(url) as response:
+        for block in response.iter_content(_download_block_size):
+            buffer.write(block)
+    return buffer.getvalue()
+
+
+def _stream_response(url: str) -> requests.Response:
+    """start streaming GET of url, the body is read by iterating over it"""
     import requests
-    import polars as pl
 
-    try:
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise Exception(
-                f'Failed to download: HTTP status code {response.status_code}'
-            )
-        csv_buffer = io.StringIO(
-            gzip.decompress(response.content).decode('utf-8')
+    response = http_get(url, stream=True)
+    if response.status_code != 200:
+        response.close()
+        raise requests.HTTPError(
+            f'Failed to download: HTTP status code {response.status_code}',
+            response=response,
         )
-        if polars_kwargs is None:
-            polars_kwargs = {}
-        return pl.read_csv(csv_buffer, **polars_kwargs)
+    return response
+
+
+def download_csv_gz_to_dataframe(
+    url: str, *, polars_kwargs: dict[str, typing.Any] | None = None
+) -> pl.DataFrame:
+    try:
+        payload = download_bytes(url)
     except Exception as e:
-        raise Exception(f'Error processing csv.gz file: {str(e)}')
+        raise Exception(f'Error processing csv.gz file: {str(e)}') from e
+    return absorb.ops.read_csv_gz_bytes(payload, polars_kwargs=polars_kwargs)
 
 
 def download_csv_zip_to_dataframe(
     url: str, *, polars_kwargs: dict[str, typing.Any] | None = None
 ) -> pl.DataFrame:
-    import io
-    import zipfile
+    try:
+        payload = download_bytes(url)
+    except Exception as e:
+        raise Exception(f'Error processing csv.zip file: {str(e)}') from e
+    return absorb.ops.read_csv_zip_bytes(payload, polars_kwargs=polars_kwargs)
+
+
+def wait_for_rate_limit(
+    key: str, rate_limit: absorb.RateLimit, *, tier: str | None = None
+) -> None:
+    """block until a request to `key` is permitted by its token bucket
+
+    - bucket state lives in a file under ABSORB_ROOT so that every thread
+      and every process making requests to the same source share one budget
+    - `tier` selects an entry of rate_limit['tiers'], e.g. an API key plan
+    """
+    import os
+    import time
+
+    if tier is not None and tier in rate_limit.get('tiers', {}):
+        rate_limit = rate_limit['tiers'][tier]
+        key = key + '__' + tier
+    requests_per_second = rate_limit['requests_per_second']
+    burst = rate_limit['burst']
+
+    path = os.path.join(
+        absorb.ops.get_absorb_root(), 'rate_limits', key + '.json'
+    )
+    while True:
+        wait = _take_rate_limit_token(path, requests_per_second, burst)
+        if wait <= 0:
+            return
+        time.sleep(wait)
+
+
+def _take_rate_limit_token(
+    path: str, requests_per_second: float, burst: int
+) -> float:
+    """take a token if available, otherwise return seconds until one is"""
+    import json
+    import os
+    import threading
+    import time
+
+    lock = _rate_limit_locks.setdefault(path, threading.Lock())
+    with lock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a+') as f:
+            _lock_file(f)
+            try:
+                f.seek(0)
+                raw = f.read()
+                now = time.time()
+                if raw == '':
+                    tokens = float(burst)
+                else:
+                    state = json.loads(raw)
+                    elapsed = max(now - state['updated'], 0)
+                    tokens = state['tokens'] + elapsed * requests_per_second
+                    tokens = min(tokens, float(burst))
+                if tokens >= 1:
+                    tokens -= 1
+                    wait = 0.0
+                else:
+                    wait = (1 - tokens) / requests_per_second
+                f.seek(0)
+                f.truncate()
+                json.dump({'tokens': tokens, 'updated': now}, f)
+                f.flush()
+            finally:
+                _unlock_file(f)
+    return wait
+
+
+def _lock_file(f: typing.IO[str]) -> None:
+    try:
+        import fcntl
+    except ImportError:
+        # no cross-process locking on platforms without fcntl
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(f: typing.IO[str]) -> None:
+    try:
+        import fcntl
+    except ImportError:
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def find_last_existing_url(
+    get_url: typing.Callable[[int], str],
+    *,
+    lower: int,
+    upper: int,
+    seed: int | None = None,
+    workers: int = 1,
+    exists: typing.Callable[[str], bool] | None = None,
+) -> int | None:
+    """find largest index in [lower, upper] whose url exists
+
+    - assumes that the urls that exist form a prefix of the range, such as
+      one file per day up to the latest day
+    - gallops outward from seed, e.g. the last collected index, and then
+      binary searches, so that a gap of n indices takes O(log n) requests
+    - with workers > 1, each round probes `workers` indices concurrently
+    - returns None if no url in the range exists
+    """
+    import concurrent.futures
+
+    if exists is None:
+        exists = does_remote_file_exist
+    if workers < 1:
+        raise Exception('workers must be at least 1')
+    if upper < lower:
+        return None
+    if seed is None:
+        seed = lower
+    seed = min(max(seed, lower), upper)
+
+    def probe(indices: list[int]) -> list[bool]:
+        if workers == 1 or len(indices) == 1:
+            return [exists(get_url(index)) for index in indices]
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            return list(
+                executor.map(lambda index: exists(get_url(index)), indices)
+            )
+
+    # gallop from seed to bracket the last existing index, such that
+    # found exists (or is lower - 1) and missing does not (or is upper + 1)
+    if probe([seed])[0]:
+        found, missing, step = seed, upper + 1, 1
+        while found < upper:
+            indices = []
+            for _ in range(workers):
+                index = min(found + step, upper)
+                if len(indices) == 0 or index > indices[-1]:
+                    indices.append(index)
+                step *= 2
+            results = probe(indices)
+            for index, result in zip(indices, results):
+                if result:
+                    found = index
+                else:
+                    missing = index
+                    break
+            if missing <= upper:
+                break
+    else:
+        found, missing, step = lower - 1, seed, 1
+        while missing > lower:
+            indices = []
+            for _ in range(workers):
+                index = max(missing - step, lower)
+                if len(indices) == 0 or index < indices[-1]:
+                    indices.append(index)
+                step *= 2
+            results = probe(indices)
+            for index, result in zip(indices, results):
+                if result:
+                    found = index
+                    break
+                else:
+                    missing = index
+            if found >= lower:
+                break
+
+    # search between found and missing, narrowing by workers + 1 each round
+    while missing - found > 1:
+        n_probes = min(workers, missing - found - 1)
+        width = (missing - found) / (n_probes + 1)
+        indices = sorted(
+            {found + max(1, int(width * (i + 1))) for i in range(n_probes)}
+        )
+        indices = [index for index in indices if found < index < missing]
+        results = probe(indices)
+        for index, result in zip(indices, results):
+            if result:
+                found = index
+            else:
+                missing = index
+                break
+
+    if found < lower:
+        return None
+    return found
+
+
+#
+# # adaptive concurrency
+#
+
+
+def http_get(url: str, **kwargs: typing.Any) -> requests.Response:
+    """perform GET request, limited by the adaptive window of the url's host"""
+    return http_request('GET', url, **kwargs)
+
+
+def http_request(
+    method: str, url: str, **kwargs: typing.Any
+) -> requests.Response:
+    """perform request, limited by the adaptive window of the url's host
+
+    each host gets an AIMD concurrency window shared by all threads:
+    - the window grows by one request per window of successes while median
+      latency stays within 1.5x of the lowest median seen
+    - HTTP 429 or 503 halves the window and pauses new requests to the host
+      until Retry-After has passed
+    """
+    import time
+    import urllib.parse
     import requests
-    import polars as pl
 
+    host = urllib.parse.urlparse(url).netloc
+    state = _acquire_host_slot(host)
+    t_start = time.perf_counter()
+    response = None
     try:
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise Exception(
-                f'Failed to download: HTTP status code {response.status_code}'
+        response = requests.request(method, url, **kwargs)
+        return response
+    finally:
+        latency = time.perf_counter() - t_start
+        _release_host_slot(state, response, latency)
+
+
+def get_concurrency_windows(since: float | None = None) -> dict[str, float]:
+    """get current concurrency window of each host used since a timestamp"""
+    return {
+        host: state['window']
+        for host, state in _host_windows.items()
+        if since is None or state['last_used'] >= since
+    }
+
+
+def _acquire_host_slot(host: str) -> dict[str, typing.Any]:
+    import collections
+    import threading
+    import time
+
+    state = _host_windows.get(host)
+    if state is None:
+        state = _host_windows.setdefault(
+            host,
+            {
+                'condition': threading.Condition(),
+                'window': 4.0,
+                'min_window': 1.0,
+                'max_window': 64.0,
+                'in_flight': 0,
+                'latencies': collections.deque(maxlen=32),
+                'baseline_p50': None,
+                'blocked_until': 0.0,
+                'last_used': 0.0,
+            },
+        )
+
+    with state['condition']:
+        while True:
+            now = time.time()
+            if now < state['blocked_until']:
+                state['condition'].wait(state['blocked_until'] - now)
+            elif state['in_flight'] >= int(state['window']):
+                state['condition'].wait()
+            else:
+                break
+        state['in_flight'] += 1
+        state['last_used'] = now
+    return state
+
+
+def _release_host_slot(
+    state: dict[str, typing.Any],
+    response: requests.Response | None,
+    latency: float,
+) -> None:
+    import statistics
+    import time
+
+    with state['condition']:
+        state['in_flight'] -= 1
+        status_code = None if response is None else response.status_code
+        if status_code in (429, 503):
+            # multiplicative decrease, and pause until retry-after
+            state['window'] = max(state['min_window'], state['window'] / 2)
+            retry_after = _parse_retry_after(response)
+            state['blocked_until'] = max(
+                state['blocked_until'], time.time() + retry_after
             )
-        zip_buffer = io.BytesIO(response.content)
-        with zipfile.ZipFile(zip_buffer, 'r') as z:
-            csv_filename = [f for f in z.namelist() if f.endswith('.csv')][0]
-            with z.open(csv_filename) as csv_file:
-                csv_buffer = io.StringIO(csv_file.read().decode('utf-8'))
-                if polars_kwargs is None:
-                    polars_kwargs = {}
-                return pl.read_csv(csv_buffer, **polars_kwargs)
-    except Exception as e:
-        raise Exception(f'Error processing csv.zip file: {str(e)}')
+        elif response is not None:
+            # additive increase while latency stays flat
+            state['latencies'].append(latency)
+            if len(state['latencies']) >= 8:
+                p50 = statistics.median(state['latencies'])
+                baseline = state['baseline_p50']
+                if baseline is None or p50 < baseline:
+                    state['baseline_p50'] = baseline = p50
+                if p50 > 1.5 * baseline:
+                    state['condition'].notify_all()
+                    return
+            state['window'] = min(
+                state['max_window'], state['window'] + 1 / state['window']
+            )
+        state['condition'].notify_all()
+
+
+def _parse_retry_after(
+    response: requests.Response | None, default: float = 1.0
+) -> float:
+    import email.utils
+    import time
+
+    if response is None:
+        return default
+    raw = response.headers.get('Retry-After')
+    if raw is None:
+        return default
+    try:
+        return max(float(raw), 0)
+    except ValueError:
+        pass
+    try:
+        retry_time = email.utils.parsedate_to_datetime(raw).timestamp()
+        return max(retry_time - time.time(), 0)
+    except (TypeError, ValueError):
+        return default
+
+
+def is_retryable_error(
+    error: BaseException, retryable_status_codes: list[int]
+) -> bool:
+    """return whether error, or an error it was raised from, is transient
+
+    transient errors are connection failures, timeouts, and http errors
+    whose status code is in retryable_status_codes
+    """
+    import requests
+
+    seen = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(current, requests.HTTPError):
+            response = current.response
+            if response is not None:
+                return response.status_code in retryable_status_codes
+        current = current.__cause__ or current.__context__
+    return False
@@ -56,3 +56,11 @@ def get_source_dir(source: str, *, warn: bool = False) -> str:
     import os
 
     return os.path.join(get_datasets_dir(warn=warn), source)
+
+
+def get_available_range_cache_dir(*, warn: bool = False) -> str:
+    import os
+
+    return os.path.join(
+        absorb.ops.get_absorb_root(warn=warn), 'available_ranges'
+    )
@@ -4,6 +4,11 @@ import typing
 
 import absorb
 
+if typing.TYPE_CHECKING:
+    import datetime
+
+    import polars as pl
+
 
 def get_table_dir(
     table: str | absorb.TableDict | absorb.Table,
@@ -44,6 +49,42 @@ def get_table_metadata_path(
     return os.path.join(table_dir, 'table_metadata.json')
 
 
+def get_table_journal_path(
+    table: str | absorb.TableDict | absorb.Table,
+    *,
+    source: str | None = None,
+    warn: bool = False,
+) -> str:
+    import os
+
+    table_dir = absorb.ops.get_table_dir(table, source=source, warn=warn)
+    return os.path.join(table_dir, 'collect_journal.jsonl')
+
+
+def get_table_manifest_path(
+    table: str | absorb.TableDict | absorb.Table,
+    *,
+    source: str | None = None,
+    warn: bool = False,
+) -> str:
+    import os
+
+    table_dir = absorb.ops.get_table_dir(table, source=source, warn=warn)
+    return os.path.join(table_dir, 'manifest.jsonl')
+
+
+def get_table_coverage_path(
+    table: str | absorb.TableDict | absorb.Table,
+    *,
+    source: str | None = None,
+    warn: bool = False,
+) -> str:
+    import os
+
+    table_dir = absorb.ops.get_table_dir(table, source=source, warn=warn)
+    return os.path.join(table_dir, 'collected_coverage.json')
+
+
 def get_table_filepath(
     chunk: absorb.Chunk,
     chunk_size: absorb.ChunkSize | None,
@@ -54,10 +95,16 @@ def get_table_filepath(
     parameters: dict[str, typing.Any],
     glob: bool = False,
     warn: bool = True,
+    file_layout: typing.Literal['flat', 'hive'] = 'flat',
 ) -> str:
     import os
 
     dir_path = get_table_dir(source=source, table=table, warn=warn)
+    if file_layout == 'hive':
+        partition_dir = get_hive_partition_dir(chunk, chunk_size, glob=glob)
+        dir_path = os.path.join(dir_path, partition_dir)
+    elif file_layout != 'flat':
+        raise Exception('invalid file_layout: ' + str(file_layout))
     filename = get_table_filename(
         chunk=chunk,
         chunk_size=chunk_size,
@@ -107,3 +154,66 @@ def get_table_filename(
 
     # format the filename template
     return filename_template.format(**format_params)
+
+
+def get_hive_partition_keys(chunk_size: absorb.ChunkSize | None) -> list[str]:
+    if chunk_size in ['hour', 'day', 'week', 'month']:
+        return ['year', 'month']
+    elif chunk_size in ['quarter', 'year']:
+        return ['year']
+    else:
+        raise Exception('hive file_layout requires a temporal chunk_size')
+
+
+def get_hive_partition_dir(
+    chunk: absorb.Chunk,
+    chunk_size: absorb.ChunkSize | None,
+    *,
+    glob: bool = False,
+) -> str:
+    """get partition directory of chunk, like year=2024/month=06
+
+    chunks of compacted files go in the partition of their first chunk
+    """
+    import os
+
+    keys = get_hive_partition_keys(chunk_size)
+    if glob:
+        return os.path.join(*[key + '=*' for key in keys])
+    if isinstance(chunk, str):
+        chunk = absorb.ops.parse_chunk(chunk, chunk_size)
+    if isinstance(chunk, tuple):
+        chunk = chunk[0]
+    values = {
+        'year': '%04d' % chunk.year,  # type: ignore
+        'month': '%02d' % chunk.month,  # type: ignore
+    }
+    return os.path.join(*[key + '=' + values[key] for key in keys])
+
+
+def get_hive_range_predicates(
+    keys: list[str],
+    *,
+    start: datetime.datetime | None = None,
+    end: datetime.datetime | None = None,
+) -> list[pl.Expr]:
+    """get filters of hive partition columns that overlap [start, end)"""
+    import polars as pl
+
+    if keys == ['year', 'month']:
+        key = pl.col.year * 100 + pl.col.month
+        predicates = []
+        if start is not None:
+            predicates.append(key >= start.year * 100 + start.month)
+        if end is not None:
+            predicates.append(key <= end.year * 100 + end.month)
+        return predicates
+    elif keys == ['year']:
+        predicates = []
+        if start is not None:
+            predicates.append(pl.col.year >= start.year)
+        if end is not None:
+            predicates.append(pl.col.year <= end.year)
+        return predicates
+    else:
+        raise Exception('invalid hive partition keys: ' + str(keys))
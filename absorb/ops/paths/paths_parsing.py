@@ -4,6 +4,9 @@ import typing
 
 import absorb
 
+if typing.TYPE_CHECKING:
+    import polars as pl
+
 
 def parse_chunk_path(
     path: str,
@@ -16,14 +19,130 @@ def parse_chunk_path(
     keys = os.path.splitext(filename_template)[0].split('__')
     values = os.path.splitext(os.path.basename(path))[0].split('__')
     items = {k[1:-1]: v for k, v in zip(keys, values)}
+
+    # include key=value directories of hive file layouts
+    for part in os.path.dirname(path).split(os.sep):
+        if '=' in part:
+            key, _, value = part.partition('=')
+            items.setdefault(key, value)
+
     if chunk_size is not None and 'chunk' in items:
         items['chunk'] = parse_chunk(items['chunk'], chunk_size)
     return items
 
 
+def parse_chunk_paths(
+    paths: typing.Sequence[str],
+    filename_template: str,
+    *,
+    chunk_size: absorb.ChunkSize | None,
+) -> pl.Series:
+    """parse chunks of many paths at once, vectorized version of parse_chunk_path
+
+    - returns a Series named 'chunk' with one entry per path
+    - with chunk_size None, chunks are left as strings
+    - otherwise entries are structs of the start and end of each file, which
+      are the first and last chunk of the file, or the first and last index
+      for number_range chunks
+    - files of compacted ranges of chunks have chunks like `<first>_to_<last>`
+    - paths whose chunk cannot be parsed, or templates without a chunk, get
+      null
+    """
+    import os
+    import polars as pl
+
+    keys = os.path.splitext(filename_template)[0].split('__')
+    if '{chunk}' not in keys:
+        return pl.Series('chunk', [None] * len(paths), dtype=pl.String)
+    names = pl.Series('chunk', paths, dtype=pl.String)
+    as_str = (
+        names.str.extract(r'([^/\\]*)$')
+        .str.replace(r'\.[^.]*$', '')
+        .str.split('__')
+        .list.get(keys.index('{chunk}'), null_on_oob=True)
+    )
+    if chunk_size is None:
+        return as_str
+    elif absorb.ops.get_number_interval(chunk_size) is not None:
+        return parse_chunks(as_str, chunk_size)
+
+    # split ranges of chunks into first and last chunk
+    parts = as_str.str.split_exact('_to_', 1).struct.unnest()
+    start = parse_chunks(parts['field_0'], chunk_size)
+    end = parse_chunks(parts['field_1'].fill_null(parts['field_0']), chunk_size)
+    return (
+        pl.select(
+            pl.when(
+                pl.lit(start).is_not_null() & pl.lit(end).is_not_null()
+            ).then(pl.struct(start=pl.lit(start), end=pl.lit(end)))
+        )
+        .to_series()
+        .alias('chunk')
+    )
+
+
+def parse_chunks(
+    as_str: pl.Series, chunk_size: absorb.ChunkSize | None
+) -> pl.Series:
+    """parse Series of chunk strings, vectorized version of parse_chunk"""
+    import polars as pl
+
+    name = as_str.name
+    if chunk_size is None:
+        return as_str
+    elif chunk_size == 'hour':
+        return as_str.str.to_datetime(
+            '%Y-%m-%d--%H-%M-%S', time_unit='us', strict=False
+        )
+    elif chunk_size in ['day', 'week']:
+        return as_str.str.to_datetime('%Y-%m-%d', time_unit='us', strict=False)
+    elif chunk_size == 'month':
+        return (as_str + '-01').str.to_datetime(
+            '%Y-%m-%d', time_unit='us', strict=False
+        )
+    elif chunk_size == 'quarter':
+        parts = as_str.str.extract_groups(r'^(\d{4})-?Q([1-4])$')
+        year = parts.struct.field('1').cast(pl.Int32)
+        quarter = parts.struct.field('2').cast(pl.Int32)
+        return (
+            pl.select(pl.datetime(year, 3 * (quarter - 1) + 1, 1))
+            .to_series()
+            .alias(name)
+        )
+    elif chunk_size == 'year':
+        return (as_str + '-01-01').str.to_datetime(
+            '%Y-%m-%d', time_unit='us', strict=False
+        )
+    elif isinstance(chunk_size, int):
+        return as_str.cast(pl.Int64, strict=False)
+    elif absorb.ops.get_number_interval(chunk_size) is not None:
+        parts = as_str.str.extract_groups(r'^(\d+)_to_(\d+)$')
+        start = parts.struct.field('1').cast(pl.Int64)
+        end = parts.struct.field('2').cast(pl.Int64)
+        return (
+            pl.select(
+                pl.when(pl.lit(start).is_not_null()).then(
+                    pl.struct(start=pl.lit(start), end=pl.lit(end))
+                )
+            )
+            .to_series()
+            .alias(name)
+        )
+    else:
+        raise NotImplementedError()
+
+
 def parse_chunk(as_str: str, chunk_size: absorb.ChunkSize | None) -> typing.Any:
+    """parse chunk from string
+
+    ranges of chunks like `<first>_to_<last>`, used by compacted files, are
+    parsed into (first, last) tuples
+    """
     import datetime
 
+    if '_to_' in as_str and absorb.ops.get_number_interval(chunk_size) is None:
+        first, last = as_str.split('_to_')
+        return (parse_chunk(first, chunk_size), parse_chunk(last, chunk_size))
     if chunk_size == 'hour':
         return datetime.datetime.strptime(as_str, '%Y-%m-%d--%H-%M-%S')
     elif chunk_size == 'day':
@@ -34,9 +153,14 @@ def parse_chunk(as_str: str, chunk_size: absorb.ChunkSize | None) -> typing.Any:
         return datetime.datetime.strptime(as_str, '%Y-%m')
     elif chunk_size == 'quarter':
         year = int(as_str[:4])
-        month = int(as_str[as_str.index('Q') + 1 :])
-        return datetime.datetime(year, month, 1)
+        quarter = int(as_str[as_str.index('Q') + 1 :])
+        return datetime.datetime(year, 3 * (quarter - 1) + 1, 1)
     elif chunk_size == 'year':
         return datetime.datetime.strptime(as_str, '%Y')
+    elif isinstance(chunk_size, int):
+        return int(as_str)
+    elif absorb.ops.get_number_interval(chunk_size) is not None:
+        start, end = as_str.split('_to_')
+        return (int(start), int(end))
     else:
         raise NotImplementedError()
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import typing
+
+import absorb
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable, Sequence
+
+
+def run_pipeline(
+    items: Sequence[Any],
+    stages: list[tuple[str, Callable[[Any, Any], Any], int]],
+    *,
+    queue_size: int = 1,
+    ordered: bool = False,
+    retry: Callable[[int, BaseException, int, float], float | None]
+    | None = None,
+) -> tuple[list[Any], list[absorb.PipelineStageStats]]:
+    """run items through stages of worker threads connected by bounded queues
+
+    - each stage is a tuple of (name, function, n_workers)
+    - each stage function is called as function(item, previous_output)
+    - the first stage receives previous_output=None
+    - returns the outputs of the final stage in the same order as items
+    - if ordered, the final stage processes items in the order of items
+    - after an item fails, the first stage stops taking new items, items
+      before the failed item finish every stage, and items after it are
+      dropped, so completed outputs always form a prefix when ordered
+    - the exception of the earliest failed item is re-raised after shutdown
+    - if the first stage fails, retry(index, error, n_failures, elapsed) can
+      return a delay in seconds after which the item is requeued behind all
+      new items, or None to fail the item
+    """
+    import heapq
+    import queue
+    import threading
+    import time
+
+    if len(stages) == 0:
+        raise Exception('pipeline must have at least one stage')
+    for name, function, n_workers in stages:
+        if n_workers < 1:
+            raise Exception('stage ' + name + ' must have at least 1 worker')
+    if ordered and stages[-1][2] != 1:
+        raise Exception('ordered pipeline must have 1 worker in final stage')
+
+    done = object()
+    last_stage = len(stages) - 1
+    queues: list[queue.Queue[Any]] = [
+        queue.Queue(maxsize=queue_size) for stage in stages[1:]
+    ]
+    results: list[Any] = [None] * len(items)
+    errors: dict[int, BaseException] = {}
+    lock = threading.Lock()
+    condition = threading.Condition(lock)
+    next_item = [0]
+    n_fetching = [0]
+    requeued: list[tuple[float, int]] = []
+    n_failures: dict[int, int] = {}
+    first_start: dict[int, float] = {}
+    stats: list[absorb.PipelineStageStats] = [
+        {
+            'name': name,
+            'n_workers': n_workers,
+            'n_items': 0,
+            'n_failed': 0,
+            'busy_seconds': 0.0,
+            'utilization': 0.0,
+        }
+        for name, function, n_workers in stages
+    ]
+    remaining_workers = [n_workers for name, function, n_workers in stages]
+
+    def is_dropped(index: int) -> bool:
+        with lock:
+            return any(index > failed for failed in errors)
+
+    def get_input(s: int) -> Any:
+        if s > 0:
+            return queues[s - 1].get()
+        with condition:
+            while True:
+                if len(errors) == 0 and next_item[0] < len(items):
+                    index = next_item[0]
+                    next_item[0] += 1
+                    break
+                if len(errors) > 0:
+                    # only retries of items before the failure are still used
+                    first_failed = min(errors)
+                    requeued[:] = [r for r in requeued if r[1] < first_failed]
+                    heapq.heapify(requeued)
+                if len(requeued) > 0:
+                    wait = requeued[0][0] - time.monotonic()
+                    if wait <= 0:
+                        ready_time, index = heapq.heappop(requeued)
+                        break
+                    condition.wait(wait)
+                elif n_fetching[0] == 0:
+                    return done
+                else:
+                    # an item in flight may still be requeued
+                    condition.wait()
+            n_fetching[0] += 1
+            first_start.setdefault(index, time.monotonic())
+        return (index, None)
+
+    def finish_fetch(index: int, error: BaseException | None) -> None:
+        delay = None
+        if error is not None and retry is not None:
+            with lock:
+                n_failures[index] = n_failures.get(index, 0) + 1
+                n = n_failures[index]
+                elapsed = time.monotonic() - first_start[index]
+            delay = retry(index, error, n, elapsed)
+        with condition:
+            n_fetching[0] -= 1
+            if error is not None:
+                if delay is None:
+                    errors[index] = error
+                    stats[0]['n_failed'] += 1
+                else:
+                    ready_time = time.monotonic() + delay
+                    heapq.heappush(requeued, (ready_time, index))
+            condition.notify_all()
+
+    def process(s: int, index: int, previous: Any) -> None:
+        name, function, n_workers = stages[s]
+        t_start = time.perf_counter()
+        try:
+            output = function(items[index], previous)
+        except BaseException as e:
+            if s == 0:
+                finish_fetch(index, e)
+            else:
+                with lock:
+                    errors[index] = e
+                    stats[s]['n_failed'] += 1
+            return
+        elapsed = time.perf_counter() - t_start
+        with lock:
+            stats[s]['busy_seconds'] += elapsed
+            stats[s]['n_items'] += 1
+        if s == 0:
+            finish_fetch(index, None)
+
+        if s == last_stage:
+            results[index] = output
+        else:
+            queues[s].put((index, output))
+
+    def run_worker(s: int) -> None:
+        # ordered final stage buffers out-of-order arrivals
+        pending: dict[int, Any] = {}
+        next_index = 0
+        try:
+            while True:
+                entry = get_input(s)
+                if entry is done:
+                    break
+                index, previous = entry
+
+                # keep draining queues after an error so upstream can exit
+                if is_dropped(index):
+                    continue
+
+                if ordered and s == last_stage:
+                    pending[index] = previous
+                    while next_index in pending and not is_dropped(next_index):
+                        process(s, next_index, pending.pop(next_index))
+                        if next_index in errors:
+                            break
+                        next_index += 1
+                else:
+                    process(s, index, previous)
+        finally:
+            with lock:
+                remaining_workers[s] -= 1
+                last_worker = remaining_workers[s] == 0
+            if last_worker and s < last_stage:
+                for _ in range(stages[s + 1][2]):
+                    queues[s].put(done)
+
+    # start workers of every stage
+    start_time = time.perf_counter()
+    threads = [
+        threading.Thread(target=run_worker, args=(s,), daemon=True)
+        for s, (name, function, n_workers) in enumerate(stages)
+        for _ in range(n_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total_seconds = time.perf_counter() - start_time
+
+    if len(errors) > 0:
+        raise errors[min(errors)]
+
+    # compute fraction of each stage's worker time spent busy
+    for stage_stats in stats:
+        capacity = total_seconds * stage_stats['n_workers']
+        if capacity > 0:
+            stage_stats['utilization'] = stage_stats['busy_seconds'] / capacity
+
+    return results, stats
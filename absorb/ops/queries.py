@@ -15,6 +15,10 @@ def query(
     *,
     update: bool = False,
     collect_if_missing: bool = True,
+    start: typing.Any = None,
+    end: typing.Any = None,
+    columns: typing.Sequence[str] | None = None,
+    filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
     scan_kwargs: dict[str, typing.Any] | None = None,
     bucket: bool | absorb.Bucket = False,
     lazy: typing.Literal[False] = False,
@@ -27,6 +31,10 @@ def query(
     *,
     update: bool = False,
     collect_if_missing: bool = True,
+    start: typing.Any = None,
+    end: typing.Any = None,
+    columns: typing.Sequence[str] | None = None,
+    filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
     scan_kwargs: dict[str, typing.Any] | None = None,
     bucket: bool | absorb.Bucket = False,
     lazy: typing.Literal[True],
@@ -38,6 +46,10 @@ def query(
     *,
     update: bool = False,
     collect_if_missing: bool = True,
+    start: typing.Any = None,
+    end: typing.Any = None,
+    columns: typing.Sequence[str] | None = None,
+    filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
     scan_kwargs: dict[str, typing.Any] | None = None,
     bucket: bool | absorb.Bucket = False,
     lazy: bool = False,
@@ -46,6 +58,10 @@ def query(
         table=table,
         update=update,
         collect_if_missing=collect_if_missing,
+        start=start,
+        end=end,
+        columns=columns,
+        filter=filter,
         scan_kwargs=scan_kwargs,
         bucket=bucket,
     )
@@ -61,6 +77,10 @@ def _query_lazy(
     *,
     update: bool = False,
     collect_if_missing: bool = True,
+    start: typing.Any = None,
+    end: typing.Any = None,
+    columns: typing.Sequence[str] | None = None,
+    filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
     scan_kwargs: dict[str, typing.Any] | None = None,
     bucket: bool | absorb.Bucket = False,
 ) -> pl.LazyFrame:
@@ -69,9 +89,13 @@ def _query_lazy(
             bucket = absorb.ops.get_default_bucket()
         if update:
             raise Exception('Cannot auto update bucketed table')
-        return absorb.ops.scan_bucket(
+        return io.scan(
             table,
             bucket=bucket,
+            start=start,
+            end=end,
+            columns=columns,
+            filter=filter,
             scan_kwargs=scan_kwargs,
         )
 
@@ -90,7 +114,14 @@ def _query_lazy(
             table.collect()
 
         # scan the table
-        return io.scan(table, scan_kwargs=scan_kwargs)
+        return io.scan(
+            table,
+            start=start,
+            end=end,
+            columns=columns,
+            filter=filter,
+            scan_kwargs=scan_kwargs,
+        )
 
 
 @typing.overload
@@ -99,6 +130,8 @@ def sql_query(
     *,
     backend: typing.Literal['absorb', 'dune', 'snowflake'] = 'absorb',
     lazy: typing.Literal[False] = False,
+    start: typing.Any = None,
+    end: typing.Any = None,
 ) -> pl.LazyFrame: ...
 
 
@@ -108,6 +141,8 @@ def sql_query(
     *,
     backend: typing.Literal['absorb', 'dune', 'snowflake'] = 'absorb',
     lazy: typing.Literal[True],
+    start: typing.Any = None,
+    end: typing.Any = None,
 ) -> pl.DataFrame: ...
 
 
@@ -116,10 +151,15 @@ def sql_query(
     *,
     backend: typing.Literal['absorb', 'dune', 'snowflake'] = 'absorb',
     lazy: bool = False,
+    start: typing.Any = None,
+    end: typing.Any = None,
 ) -> pl.DataFrame | pl.LazyFrame:
+    """start and end restrict every absorb table to [start, end) of its index"""
+    if backend != 'absorb' and (start is not None or end is not None):
+        raise Exception('start and end are only supported by absorb backend')
     if backend == 'absorb':
         # create table context
-        context = create_sql_context()
+        context = create_sql_context(start=start, end=end)
 
         # modify query to allow dots in names
         for table in context.tables():
@@ -155,6 +195,8 @@ def create_sql_context(
     *,
     tracked_tables: bool = True,
     collected_tables: bool = True,
+    start: typing.Any = None,
+    end: typing.Any = None,
 ) -> pl.SQLContext[typing.Any]:
     import polars as pl
 
@@ -170,7 +212,9 @@ def create_sql_context(
     for table_dict in all_tables:
         name = table_dict['source_name'] + '.' + table_dict['table_name']
         if name not in tables_by_name:
-            tables_by_name[name] = absorb.ops.scan(table_dict)
+            tables_by_name[name] = absorb.ops.scan(
+                table_dict, start=start, end=end
+            )
 
     # create context
     return pl.SQLContext(**tables_by_name)  # type: ignore
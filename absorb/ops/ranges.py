@@ -6,6 +6,7 @@ import absorb
 if typing.TYPE_CHECKING:
     import datetime
     from typing import TypeVar, Protocol
+    import polars as pl
 
     class SupportsComparison(Protocol):
         def __lt__(self, other: object) -> bool: ...
@@ -27,328 +28,581 @@ def get_range_diff(
     boundary_type: typing.Literal['closed', 'semiopen'],
     chunk_size: absorb.ChunkSize | None = None,
 ) -> absorb.Coverage:
-    """
+    """subtract ranges from ranges in a single sorted sweep
+
     subtraction behaves differently depending on range format
-    - mainly, index_type is discrete-closed or continuous-semiopen or other
-    - some of these cases will have equivalent outcomes
-        - handling them separately keeps maximum clarity + robustness
-
-                                           fs         fe
-    original interval                      |----------|
-    16 cases of subtraction    1.  |----|
-                               2.  |-------|
-                               3.  |------------|
-                               4.  |------------------|
-                               5.  |------------------------|
-                               6.          |
-                               7.          |------|
-                               8.          |----------|
-                               9.          |---------------|
-                               10.             |
-                               11.             |----|
-                               12.             |------|
-                               13.             |-----------|
-                               14.                    |
-                               15.                    |-----|
-                               16.                        |----|
-                                                          ss   se
-
-    if fs == fe
-                                            |
-                                1.    |--|
-                                2.    |-----|
-                                3.    |--------|
-                                4.          |
-                                5.          |--|
-                                6.             |--|
+    - closed: ranges are discrete [start, end], and the ends of remaining
+      ranges are offset by one step of chunk_size from subtracted ranges
+    - semiopen: ranges are continuous [start, end), and remaining ranges
+      share their ends with subtracted ranges
+
+    output is sorted, and runs in O((n + m) log(n + m)) for n and m ranges
     """
-    # convert to lists of tuples
-    if isinstance(from_this, list):
-        pass
-    elif isinstance(from_this, tuple):
-        from_this = [from_this]
-    elif isinstance(from_this, dict):
-        raise NotImplementedError('CustomCoverage not supported for from_this')
-    else:
-        raise Exception('invalid from_this format')
-    if isinstance(subtract_this, list):
-        pass
-    elif isinstance(subtract_this, tuple):
-        subtract_this = [subtract_this]
-    elif isinstance(subtract_this, dict):
-        raise NotImplementedError(
-            'CustomCoverage not supported for subtract_this'
-        )
-    else:
-        raise Exception('invalid subtract_this format')
+    from_ranges = _to_range_list(from_this, 'from_this')
+    subtract_ranges = _to_range_list(subtract_this, 'subtract_this')
 
     # return early if from_this is empty
-    if len(from_this) == 0:
+    if len(from_ranges) == 0:
+        return []
+
+    step = _get_range_step(from_ranges, boundary_type, chunk_size)
+    from_ranges = _merge_ranges(
+        from_ranges, boundary_type, step, adjacent=False
+    )
+    subtract_ranges = _merge_ranges(
+        subtract_ranges, boundary_type, step, adjacent=False
+    )
+
+    # sweep both sorted lists, ends of merged ranges are increasing
+    output: list[tuple[typing.Any, typing.Any]] = []
+    j = 0
+    for f_start, f_end in from_ranges:
+        # skip subtracted ranges that end before this range
+        while j < len(subtract_ranges) and (
+            subtract_ranges[j][1] < f_start
+            if boundary_type == 'closed'
+            else subtract_ranges[j][1] <= f_start
+        ):
+            j += 1
+
+        # cut out each subtracted range that overlaps this range
+        current = f_start
+        k = j
+        while k < len(subtract_ranges) and (
+            subtract_ranges[k][0] <= f_end
+            if boundary_type == 'closed'
+            else subtract_ranges[k][0] < f_end
+        ):
+            s_start, s_end = subtract_ranges[k]
+            if boundary_type == 'closed':
+                if s_start > current:
+                    output.append((current, s_start - step))
+                if s_end >= f_end:
+                    current = None
+                    break
+                current = max(current, s_end + step)
+            else:
+                if s_start > current:
+                    output.append((current, s_start))
+                if s_end >= f_end:
+                    current = None
+                    break
+                current = max(current, s_end)
+            k += 1
+
+        # keep the remainder after the last overlapping subtracted range
+        if current is not None and (
+            current <= f_end if boundary_type == 'closed' else current < f_end
+        ):
+            output.append((current, f_end))
+
+    return output
+
+
+def get_range_union(
+    *coverages: absorb.Coverage,
+    boundary_type: typing.Literal['closed', 'semiopen'],
+    chunk_size: absorb.ChunkSize | None = None,
+) -> absorb.Coverage:
+    """merge ranges into sorted ranges that neither overlap nor touch"""
+    ranges = [
+        item
+        for coverage in coverages
+        for item in _to_range_list(coverage, 'coverage')
+    ]
+    if len(ranges) == 0:
         return []
+    step = _get_range_step(ranges, boundary_type, chunk_size)
+    return _merge_ranges(ranges, boundary_type, step, adjacent=True)
+
+
+def get_range_intersection(
+    coverage: absorb.Coverage,
+    other: absorb.Coverage,
+    boundary_type: typing.Literal['closed', 'semiopen'],
+    chunk_size: absorb.ChunkSize | None = None,
+) -> absorb.Coverage:
+    """get sorted ranges that are covered by both coverage and other"""
+    ranges = _to_range_list(coverage, 'coverage')
+    other_ranges = _to_range_list(other, 'other')
+    if len(ranges) == 0 or len(other_ranges) == 0:
+        return []
+    step = _get_range_step(ranges, boundary_type, chunk_size)
+    ranges = _merge_ranges(ranges, boundary_type, step, adjacent=False)
+    other_ranges = _merge_ranges(
+        other_ranges, boundary_type, step, adjacent=False
+    )
+
+    output: list[tuple[typing.Any, typing.Any]] = []
+    i = 0
+    j = 0
+    while i < len(ranges) and j < len(other_ranges):
+        start = max(ranges[i][0], other_ranges[j][0])
+        end = min(ranges[i][1], other_ranges[j][1])
+        if start < end or (boundary_type == 'closed' and start == end):
+            output.append((start, end))
+        if ranges[i][1] < other_ranges[j][1]:
+            i += 1
+        else:
+            j += 1
+    return output
+
+
+def _to_range_list(
+    coverage: absorb.Coverage, name: str
+) -> list[tuple[typing.Any, typing.Any]]:
+    if isinstance(coverage, list):
+        return coverage
+    elif isinstance(coverage, tuple):
+        return [coverage]
+    elif isinstance(coverage, dict):
+        raise NotImplementedError('CustomCoverage not supported for ' + name)
+    else:
+        raise Exception('invalid ' + name + ' format')
+
+
+def _get_range_step(
+    ranges: list[tuple[typing.Any, typing.Any]],
+    boundary_type: typing.Literal['closed', 'semiopen'],
+    chunk_size: absorb.ChunkSize | None,
+) -> typing.Any:
+    """get discrete step between adjacent closed ranges"""
+    import datetime
+
+    if boundary_type == 'semiopen':
+        return None
+    elif boundary_type != 'closed':
+        raise Exception('invalid boundary_type: ' + str(boundary_type))
 
     # infer chunk_size if not provided
     if chunk_size is None:
-        if isinstance(from_this[0][0], int):
+        if isinstance(ranges[0][0], int):
             chunk_size = 1
-        elif isinstance(from_this[0][0], datetime.datetime):
+        elif isinstance(ranges[0][0], datetime.datetime):
             chunk_size = 'day'
         else:
             raise Exception('cannot infer chunk_size from from_this')
+    return _get_discrete_step(chunk_size)
 
-    # subtract each entry of subtract this from the entries of from_this
-    output: list[tuple[typing.Any, typing.Any]] = from_this
-    for sub_subtract_this in subtract_this:
-        new_output = []
-        for sub_from_this in output:
-            new_output.extend(
-                _subtract_tuples(
-                    subtract_this=sub_subtract_this,
-                    from_this=sub_from_this,
-                    boundary_type=boundary_type,
-                    chunk_size=chunk_size,
-                )
-            )
-        output = new_output
 
-    return output
+def _merge_ranges(
+    ranges: list[tuple[typing.Any, typing.Any]],
+    boundary_type: typing.Literal['closed', 'semiopen'],
+    step: typing.Any,
+    *,
+    adjacent: bool,
+) -> list[tuple[typing.Any, typing.Any]]:
+    """sort ranges and merge overlapping ranges, and also adjacent ones if
+    adjacent=True"""
+    for start, end in ranges:
+        if boundary_type == 'closed' and start > end:
+            raise Exception('invalid interval, start must be <= end')
+        elif boundary_type == 'semiopen' and start >= end:
+            raise Exception('invalid interval, start must be < end')
 
+    merged: list[tuple[typing.Any, typing.Any]] = []
+    for start, end in sorted(ranges):
+        if len(merged) > 0:
+            previous_end = merged[-1][1]
+            if boundary_type == 'closed':
+                joins = start <= previous_end or (
+                    adjacent and start <= previous_end + step
+                )
+            else:
+                joins = start < previous_end or (
+                    adjacent and start == previous_end
+                )
+            if joins:
+                if end > previous_end:
+                    merged[-1] = (merged[-1][0], end)
+                continue
+        merged.append((start, end))
+    return merged
 
-def _subtract_tuples(
-    subtract_this: tuple[_T, _T],
-    from_this: tuple[_T, _T],
-    chunk_size: absorb.ChunkSize,
-    boundary_type: typing.Literal['closed', 'open', 'semiopen'],
-) -> list[tuple[_T, _T]]:
-    # get discrete_step
-    discrete_step: typing.Any
+
+def _get_discrete_step(chunk_size: absorb.ChunkSize) -> typing.Any:
     if chunk_size in temporal_intervals:
         import datetime
         import tooltime
 
         if chunk_size == 'hour':
-            discrete_step = datetime.timedelta(hours=1)
+            return datetime.timedelta(hours=1)
         elif chunk_size == 'day':
-            discrete_step = datetime.timedelta(days=1)
+            return datetime.timedelta(days=1)
         elif chunk_size == 'week':
-            discrete_step = datetime.timedelta(days=7)
+            return datetime.timedelta(days=7)
         elif chunk_size == 'month':
-            discrete_step = tooltime.DateDelta(months=1)
+            return tooltime.DateDelta(months=1)
         elif chunk_size == 'quarter':
-            discrete_step = tooltime.DateDelta(quarters=1)
+            return tooltime.DateDelta(quarters=1)
         elif chunk_size == 'year':
-            discrete_step = tooltime.DateDelta(years=1)
+            return tooltime.DateDelta(years=1)
         else:
             raise Exception('invalid chunk_size')
     elif isinstance(chunk_size, int):
-        discrete_step = 1
-    elif isinstance(chunk_size, dict):
-        raise NotImplementedError('CustomChunkSize not supported')
+        return 1
+    elif get_number_interval(chunk_size) is not None:
+        # ranges of number_range chunks are in units of the index
+        return 1
     else:
         raise Exception('invalid chunk_size')
 
-    if boundary_type == 'closed':
-        return _get_discrete_closed_range_diff(
-            subtract_this=subtract_this,
-            from_this=from_this,
-            discrete_step=discrete_step,
-        )
-    elif boundary_type == 'semiopen':
-        return _get_continuous_closed_open_range_diff(
-            subtract_this=subtract_this,
-            from_this=from_this,
+
+def get_chunk_step(chunk_size: absorb.ChunkSize) -> typing.Any:
+    """get difference between the starts of consecutive chunks"""
+    if isinstance(chunk_size, int):
+        return chunk_size
+    number_interval = get_number_interval(chunk_size)
+    if number_interval is not None:
+        return number_interval
+    return _get_discrete_step(chunk_size)
+
+
+def get_number_interval(chunk_size: absorb.ChunkSize | None) -> int | None:
+    """get number_interval of a number_range chunk_size, None for other types
+
+    number_range chunk sizes look like
+    {'type': 'number_range', 'number_interval': 1000}
+    and split the index into closed (start, end) chunks aligned to multiples
+    of number_interval
+    """
+    if not isinstance(chunk_size, dict):
+        return None
+    if chunk_size.get('type') != 'number_range':
+        raise NotImplementedError(
+            'CustomChunkSize not supported: ' + str(chunk_size.get('type'))
         )
-    else:
-        raise Exception('invalid boundary_type: ' + str(boundary_type))
+    number_interval = chunk_size.get('number_interval')
+    if not isinstance(number_interval, int) or number_interval < 1:
+        raise Exception('number_interval must be a positive integer')
+    return number_interval
+
+
+def get_contiguous_ranges(
+    chunks: typing.Iterable[absorb.Chunk], chunk_size: absorb.ChunkSize
+) -> list[tuple[typing.Any, typing.Any]]:
+    """merge chunks into sorted (first_chunk, last_chunk) ranges without gaps
+
+    - chunks can include (first_chunk, last_chunk) tuples of compacted files
+    - for number_range chunks, ranges are (first_index, last_index) instead
+    - chunks can also be a Series from parse_chunk_paths(), which is merged
+      without converting each chunk to a python object
+    """
+    import polars as pl
 
+    if isinstance(chunks, pl.Series):
+        return _get_contiguous_series_ranges(chunks, chunk_size)
 
-def _get_discrete_closed_range_diff(
-    subtract_this: tuple[_T, _T],
-    from_this: tuple[_T, _T],
-    discrete_step: typing.Any,
-) -> list[tuple[_T, _T]]:
-    s_start, s_end = subtract_this
-    f_start, f_end = from_this
-
-    # validity checks
-    if s_start > s_end:
-        raise Exception('invalid interval, start must be <= end')
-    if f_start > f_end:
-        raise Exception('invalid interval, start must be <= end')
-
-    # 6 possible cases when f_start == f_end
-    if f_start == f_end:
-        if s_start < f_start and s_end < f_start:
-            # case 1
-            return [(f_start, f_end)]
-        elif s_start < f_start and s_end == f_start:
-            # case 2
-            return []
-        elif s_start < f_start and s_end > f_start:
-            # case 3
-            return []
-        elif s_start == f_start and s_end == f_start:
-            # case 4
-            return []
-        elif s_start == f_start and s_end > f_start:
-            # case 5
-            return []
-        elif s_start > f_start and s_end > f_start:
-            # case 6
-            return [(f_start, f_end)]
+    if get_number_interval(chunk_size) is not None:
+        index_ranges: list[tuple[typing.Any, typing.Any]] = []
+        for start, end in sorted(set(chunks)):  # type: ignore
+            if len(index_ranges) > 0 and index_ranges[-1][1] + 1 >= start:
+                end = max(end, index_ranges[-1][1])
+                index_ranges[-1] = (index_ranges[-1][0], end)
+            else:
+                index_ranges.append((start, end))
+        return index_ranges
+
+    # chunks of compacted files are (first_chunk, last_chunk) tuples
+    spans = {
+        chunk if isinstance(chunk, tuple) else (chunk, chunk)
+        for chunk in chunks
+    }
+    step = get_chunk_step(chunk_size)
+    ranges: list[tuple[typing.Any, typing.Any]] = []
+    for first, last in sorted(spans):
+        if len(ranges) > 0 and first <= ranges[-1][1] + step:
+            ranges[-1] = (ranges[-1][0], max(last, ranges[-1][1]))
         else:
-            raise Exception()
-
-    # 16 possible cases when f_start < f_end
-    if s_start < f_start and s_end < f_start:
-        # case 1
-        return [(f_start, f_end)]
-    elif s_start < f_start and s_end == f_start:
-        # case 2
-        return [(s_end + discrete_step, f_end)]
-    elif s_start < f_start and s_end < f_end:
-        # case 3
-        return [(s_end + discrete_step, f_end)]
-    elif s_start < f_start and s_end == f_end:
-        # case 4
-        return []
-    elif s_start < f_start and s_end > f_end:
-        # case 5
-        return []
-    elif s_start == f_start and s_end == f_start:
-        # case 6
-        return [(s_end + discrete_step, f_end)]
-    elif s_start == f_start and s_end < f_end:
-        # case 7
-        return [(s_end + discrete_step, f_end)]
-    elif s_start == f_start and s_end == f_end:
-        # case 8
-        return []
-    elif s_start == f_start and s_end > f_end:
-        # case 9
-        return []
-    elif s_start < f_end and s_end == s_start:
-        # case 10
-        return [
-            (f_start, s_start - discrete_step),
-            (s_end + discrete_step, f_end),
-        ]
-    elif s_start < f_end and s_end < f_end:
-        # case 11
-        return [
-            (f_start, s_start - discrete_step),
-            (s_end + discrete_step, f_end),
-        ]
-    elif s_start < f_end and s_end == f_end:
-        # case 12
-        return [(f_start, s_start - discrete_step)]
-    elif s_start < f_end and s_end > f_end:
-        # case 13
-        return [(f_start, s_start - discrete_step)]
-    elif s_start == f_end and s_end == f_end:
-        # case 14
-        return [(f_start, s_start - discrete_step)]
-    elif s_start == f_end and s_end > f_end:
-        # case 15
-        return [(f_start, s_start - discrete_step)]
-    elif s_start > f_end and s_end > f_start:
-        # case 16
-        return [(f_start, f_end)]
-    else:
-        raise Exception()
-
-
-def _get_continuous_closed_open_range_diff(
-    subtract_this: tuple[_T, _T], from_this: tuple[_T, _T]
-) -> list[tuple[_T, _T]]:
-    s_start, s_end = subtract_this
-    f_start, f_end = from_this
-
-    # validity checks
-    if s_start >= s_end:
-        raise Exception('invalid interval, start must be < end')
-    if f_start >= f_end:
-        raise Exception('invalid interval, start must be < end')
-
-    # 16 possible cases
-    if s_start < f_start and s_end < f_start:
-        # case 1
-        return [(f_start, f_end)]
-    elif s_start < f_start and s_end == f_start:
-        # case 2
-        return [(f_start, f_end)]
-    elif s_start < f_start and s_end < f_end:
-        # case 3
-        return [(s_end, f_end)]
-    elif s_start < f_start and s_end == f_end:
-        # case 4
-        return []
-    elif s_start < f_start and s_end > f_end:
-        # case 5
-        return []
-    elif s_start == f_start and s_end == f_start:
-        # case 6
-        raise Exception('s_start should not equal s_end')
-    elif s_start == f_start and s_end < f_end:
-        # case 7
-        return [(s_end, f_end)]
-    elif s_start == f_start and s_end == f_end:
-        # case 8
-        return []
-    elif s_start == f_start and s_end > f_end:
-        # case 9
-        return []
-    elif s_start < f_end and s_end == s_start:
-        # case 10
-        raise Exception('s_start should not equal s_end')
-    elif s_start < f_end and s_end < f_end:
-        # case 11
-        return [(f_start, s_start), (s_end, f_end)]
-    elif s_start < f_end and s_end == f_end:
-        # case 12
-        return [(f_start, s_start)]
-    elif s_start < f_end and s_end > f_end:
-        # case 13
-        return [(f_start, s_start)]
-    elif s_start == f_end and s_end == f_end:
-        # case 14
-        raise Exception('s_start should not equal s_end')
-    elif s_start == f_end and s_end > f_end:
-        # case 15
-        return [(f_start, f_end)]
-    elif s_start > f_end and s_end > f_start:
-        # case 16
-        return [(f_start, f_end)]
+            ranges.append((first, last))
+    return ranges
+
+
+def _get_contiguous_series_ranges(
+    chunks: pl.Series, chunk_size: absorb.ChunkSize
+) -> list[tuple[typing.Any, typing.Any]]:
+    """merge Series of (start, end) structs from parse_chunk_paths()"""
+    import polars as pl
+
+    if chunks.null_count() > 0:
+        raise Exception('could not parse every chunk')
+
+    # get ordinal of each chunk, and the ordinal distance between chunks
+    def get_key(column: pl.Expr) -> pl.Expr:
+        if get_number_interval(chunk_size) is not None:
+            return column
+        elif isinstance(chunk_size, int):
+            return column
+        elif chunk_size == 'hour':
+            return column.dt.epoch('s') // 3600
+        elif chunk_size in ['day', 'week']:
+            return column.dt.epoch('d')
+        elif chunk_size == 'month':
+            return column.dt.year() * 12 + column.dt.month()
+        elif chunk_size == 'quarter':
+            return column.dt.year() * 4 + column.dt.quarter()
+        elif chunk_size == 'year':
+            return column.dt.year()
+        else:
+            raise Exception('invalid chunk_size')
+
+    if isinstance(chunk_size, int):
+        step = chunk_size
+    elif chunk_size == 'week':
+        step = 7
     else:
-        raise Exception()
+        step = 1
+
+    # start a new range wherever a start is beyond all previous ends
+    previous_end = pl.col.end_key.cum_max().shift(1)
+    ranges = (
+        chunks.struct.unnest()
+        .unique()
+        .with_columns(
+            start_key=get_key(pl.col.start).cast(pl.Int64),
+            end_key=get_key(pl.col.end).cast(pl.Int64),
+        )
+        .sort('start_key', 'end_key')
+        .with_columns(
+            range_id=(pl.col.start_key > previous_end + step)
+            .fill_null(True)
+            .cum_sum()
+        )
+        .group_by('range_id', maintain_order=True)
+        .agg(
+            first=pl.col.start.first(),
+            last=pl.col.end.sort_by('end_key').last(),
+        )
+    )
+    return list(zip(ranges['first'].to_list(), ranges['last'].to_list()))
 
 
 def partition_into_chunks(
     coverage: absorb.Coverage, chunk_size: absorb.ChunkSize
-) -> list[absorb.Chunk]:
+) -> ChunkSequence:
+    """get lazy sequence of the chunks that cover each range of coverage
+
+    temporal chunks are UTC datetimes, from the chunk containing the start of
+    each range through the chunk containing its end
+    """
     if isinstance(coverage, list):
-        return [
-            subitem
-            for item in coverage
-            for subitem in partition_into_chunks(item, chunk_size)
-        ]
+        ranges = coverage
     elif isinstance(coverage, tuple):
-        import tooltime
+        ranges = [coverage]
+    else:
+        raise Exception('invalid coverage format')
+    return ChunkSequence(ranges, chunk_size)
 
-        start, end = coverage
-        if chunk_size in temporal_intervals:
-            return tooltime.get_intervals(
-                start,
-                end,
-                interval=typing.cast(str, chunk_size),
-                include_end=True,
-            )['start'].to_list()
-        elif isinstance(chunk_size, int):
-            if not isinstance(start, int) or not isinstance(end, int):
-                raise Exception(
-                    'start and end must be integers for int chunk_size'
-                )
-            return list(range(start, end + 1, chunk_size))
-        else:
+
+class ChunkSequence(typing.Sequence[typing.Any]):
+    """sequence of chunks that are computed on access instead of stored
+
+    each range is stored as (first_ordinal, n_chunks), where the ordinal of a
+    chunk counts chunk_size steps, e.g. months since year 0 for 'month', so
+    len(), indexing, and membership take O(n_ranges) time for any span
+    """
+
+    def __init__(
+        self,
+        ranges: list[tuple[typing.Any, typing.Any]],
+        chunk_size: absorb.ChunkSize,
+    ) -> None:
+        if (
+            chunk_size not in temporal_intervals
+            and not isinstance(chunk_size, int)
+            and get_number_interval(chunk_size) is None
+        ):
             raise Exception('cannot use this chunk_type as tuple range')
+        self.chunk_size = chunk_size
+        self._segments: list[tuple[int, int]] = []
+        for start, end in ranges:
+            if isinstance(chunk_size, int):
+                if not isinstance(start, int) or not isinstance(end, int):
+                    raise Exception(
+                        'start and end must be integers for int chunk_size'
+                    )
+                n = len(range(start, end + 1, chunk_size))
+                first = start
+            else:
+                first = _get_chunk_ordinal(start, chunk_size)
+                n = _get_chunk_ordinal(end, chunk_size) - first + 1
+            if n > 0:
+                self._segments.append((first, n))
+        self._len = sum(n for first, n in self._segments)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @typing.overload
+    def __getitem__(self, index: int) -> typing.Any: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> ChunkSequence: ...
+
+    def __getitem__(self, index: int | slice) -> typing.Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            sliced = ChunkSequence([], self.chunk_size)
+            offset = 0
+            for first, n in self._segments:
+                lo = max(start - offset, 0)
+                hi = min(stop - offset, n)
+                if lo < hi:
+                    sliced._segments.append((self._shift(first, lo), hi - lo))
+                offset += n
+            sliced._len = sum(n for first, n in sliced._segments)
+            return sliced
+
+        if index < 0:
+            index += self._len
+        if index < 0 or index >= self._len:
+            raise IndexError('chunk index out of range')
+        for first, n in self._segments:
+            if index < n:
+                return self._get_chunk(self._shift(first, index))
+            index -= n
+        raise IndexError('chunk index out of range')
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        for first, n in self._segments:
+            for i in range(n):
+                yield self._get_chunk(self._shift(first, i))
+
+    def __contains__(self, chunk: object) -> bool:
+        if isinstance(self.chunk_size, int):
+            if not isinstance(chunk, int):
+                return False
+            return any(
+                first <= chunk < first + n * self.chunk_size
+                and (chunk - first) % self.chunk_size == 0
+                for first, n in self._segments
+            )
+        elif isinstance(self.chunk_size, dict):
+            if not isinstance(chunk, tuple) or len(chunk) != 2:
+                return False
+            ordinal = _get_chunk_ordinal(chunk[0], self.chunk_size)
+            if _get_ordinal_chunk(ordinal, self.chunk_size) != chunk:
+                return False
+            return any(
+                first <= ordinal < first + n for first, n in self._segments
+            )
+        else:
+            import datetime
+
+            if not isinstance(chunk, datetime.datetime):
+                return False
+            ordinal = _get_chunk_ordinal(chunk, self.chunk_size)
+            if _get_ordinal_chunk(ordinal, self.chunk_size) != _to_utc(chunk):
+                return False
+            return any(
+                first <= ordinal < first + n for first, n in self._segments
+            )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ChunkSequence, list, tuple)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if self._len == 0:
+            return 'ChunkSequence([])'
+        return (
+            'ChunkSequence(['
+            + repr(self[0])
+            + ', ..., '
+            + repr(self[-1])
+            + '], n_chunks='
+            + str(self._len)
+            + ')'
+        )
+
+    def _shift(self, first: int, i: int) -> int:
+        if isinstance(self.chunk_size, int):
+            return first + i * self.chunk_size
+        else:
+            return first + i
+
+    def _get_chunk(self, ordinal: int) -> typing.Any:
+        if isinstance(self.chunk_size, int):
+            return ordinal
+        else:
+            return _get_ordinal_chunk(ordinal, self.chunk_size)
+
+
+_epoch_days = 719163  # datetime.date(1970, 1, 1).toordinal()
+
+
+def _to_utc(timestamp: datetime.datetime) -> datetime.datetime:
+    import datetime
+
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=datetime.timezone.utc)
     else:
-        raise Exception('invalid coverage format')
+        return timestamp.astimezone(datetime.timezone.utc)
+
+
+def _get_chunk_ordinal(
+    timestamp: typing.Any, chunk_size: absorb.ChunkSize
+) -> int:
+    """get index of chunk containing timestamp, counted in chunk_size steps"""
+    number_interval = get_number_interval(chunk_size)
+    if number_interval is not None:
+        if not isinstance(timestamp, int):
+            raise Exception('number_range chunks require integer ranges')
+        return timestamp // number_interval
+    timestamp = _to_utc(timestamp)
+    if chunk_size == 'hour':
+        days = timestamp.toordinal() - _epoch_days
+        return days * 24 + timestamp.hour
+    elif chunk_size == 'day':
+        return timestamp.toordinal() - _epoch_days
+    elif chunk_size == 'week':
+        # weeks start on sunday, and 1970-01-04 was a sunday
+        return (timestamp.toordinal() - _epoch_days - 3) // 7
+    elif chunk_size == 'month':
+        return timestamp.year * 12 + timestamp.month - 1
+    elif chunk_size == 'quarter':
+        return timestamp.year * 4 + (timestamp.month - 1) // 3
+    elif chunk_size == 'year':
+        return timestamp.year
+    else:
+        raise Exception('invalid chunk_size')
+
+
+def _get_ordinal_chunk(
+    ordinal: int, chunk_size: absorb.ChunkSize
+) -> typing.Any:
+    """get chunk from its index, counted in chunk_size steps"""
+    import datetime
+
+    number_interval = get_number_interval(chunk_size)
+    if number_interval is not None:
+        start = ordinal * number_interval
+        return (start, start + number_interval - 1)
+    utc = datetime.timezone.utc
+    if chunk_size == 'hour':
+        days, hour = divmod(ordinal, 24)
+        date = datetime.date.fromordinal(days + _epoch_days)
+        return datetime.datetime(
+            date.year, date.month, date.day, hour, tzinfo=utc
+        )
+    elif chunk_size == 'day':
+        date = datetime.date.fromordinal(ordinal + _epoch_days)
+        return datetime.datetime(date.year, date.month, date.day, tzinfo=utc)
+    elif chunk_size == 'week':
+        date = datetime.date.fromordinal(ordinal * 7 + 3 + _epoch_days)
+        return datetime.datetime(date.year, date.month, date.day, tzinfo=utc)
+    elif chunk_size == 'month':
+        year, month = divmod(ordinal, 12)
+        return datetime.datetime(year, month + 1, 1, tzinfo=utc)
+    elif chunk_size == 'quarter':
+        year, quarter = divmod(ordinal, 4)
+        return datetime.datetime(year, 3 * quarter + 1, 1, tzinfo=utc)
+    elif chunk_size == 'year':
+        return datetime.datetime(ordinal, 1, 1, tzinfo=utc)
+    else:
+        raise Exception('invalid chunk_size')
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import typing
+
+import absorb
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Sequence
+
+    import rich.table
+
+
+def collect_tables(
+    tables: Sequence[absorb.Table],
+    *,
+    max_workers: int = 4,
+    source_limits: dict[str, int] | None = None,
+    data_range: Any | None = None,
+    verbose: int = 1,
+    **collect_kwargs: Any,
+) -> list[absorb.TableCollectStatus]:
+    """collect many tables at once using a shared pool of workers
+
+    - at most `max_workers` tables are collected at the same time
+    - `source_limits` caps how many tables of a given source run at once
+    - sources take turns receiving free workers, so one slow source cannot
+      hold back the tables of other sources
+    - data_range only applies to append_only tables
+    - a failed table does not stop the others, check the returned statuses
+    - if verbose, shows a live table of progress instead of per table output
+    """
+    import collections
+    import threading
+    import time
+
+    if max_workers < 1:
+        raise Exception('max_workers must be at least 1')
+    if source_limits is None:
+        source_limits = {}
+    for source, limit in source_limits.items():
+        if limit < 1:
+            raise Exception('source limit of ' + source + ' must be at least 1')
+
+    # group tables by source, preserving order of first appearance
+    statuses: list[absorb.TableCollectStatus] = []
+    pending: dict[str, collections.deque[int]] = {}
+    for t, table in enumerate(tables):
+        statuses.append(
+            {
+                'name': table.full_name(),
+                'source': table.source,
+                'status': 'pending',
+                'start_time': None,
+                'end_time': None,
+                'error': None,
+            }
+        )
+        pending.setdefault(table.source, collections.deque()).append(t)
+    sources = list(pending.keys())
+    running = {source: 0 for source in sources}
+    next_source = [0]
+    condition = threading.Condition()
+
+    def take_next_table() -> int | None:
+        # round robin over sources that have pending tables and free capacity
+        with condition:
+            while True:
+                n_pending = sum(len(queue) for queue in pending.values())
+                if n_pending == 0:
+                    return None
+                for offset in range(len(sources)):
+                    s = (next_source[0] + offset) % len(sources)
+                    source = sources[s]
+                    limit = source_limits.get(source, max_workers)
+                    if len(pending[source]) > 0 and running[source] < limit:
+                        running[source] += 1
+                        next_source[0] = s + 1
+                        return pending[source].popleft()
+                condition.wait()
+
+    def run_worker() -> None:
+        while True:
+            t = take_next_table()
+            if t is None:
+                return
+            table = tables[t]
+            status = statuses[t]
+            status['status'] = 'collecting'
+            status['start_time'] = time.time()
+            try:
+                if table.write_range == 'append_only':
+                    table_range = data_range
+                else:
+                    table_range = None
+                table.collect(
+                    data_range=table_range,
+                    verbose=0 if verbose >= 1 else verbose,
+                    **collect_kwargs,
+                )
+                status['status'] = 'done'
+            except Exception as e:
+                status['status'] = 'failed'
+                status['error'] = str(e)
+            finally:
+                status['end_time'] = time.time()
+                with condition:
+                    running[table.source] -= 1
+                    condition.notify_all()
+
+    threads = [
+        threading.Thread(target=run_worker, daemon=True)
+        for _ in range(min(max_workers, len(tables)))
+    ]
+    for thread in threads:
+        thread.start()
+    if verbose >= 1:
+        import rich.live
+
+        with rich.live.Live(
+            get_renderable=lambda: _get_status_table(statuses),
+            refresh_per_second=4,
+        ):
+            for thread in threads:
+                thread.join()
+    else:
+        for thread in threads:
+            thread.join()
+
+    return statuses
+
+
+def _get_status_table(
+    statuses: list[absorb.TableCollectStatus],
+) -> rich.table.Table:
+    import time
+    import rich.table
+
+    colors = {
+        'pending': 'white',
+        'collecting': 'yellow',
+        'done': 'green',
+        'failed': 'red',
+    }
+    status_table = rich.table.Table(
+        'table', 'status', 'elapsed', 'error', box=None
+    )
+    for status in statuses:
+        start_time = status['start_time']
+        end_time = status['end_time']
+        if start_time is None:
+            elapsed = ''
+        else:
+            if end_time is None:
+                end_time = time.time()
+            elapsed = '%.1fs' % (end_time - start_time)
+        color = colors[status['status']]
+        status_table.add_row(
+            status['name'],
+            '[' + color + ']' + status['status'] + '[/' + color + ']',
+            elapsed,
+            status['error'] or '',
+        )
+    return status_table
@@ -35,6 +35,28 @@ class TableBase:
 
     chunk_datatype: typing.Literal['dataframe', 'files'] = 'dataframe'
 
+    # 'hive' stores data files in year=YYYY/month=MM/ directories, which
+    # scans expose as year and month columns so that filters on them skip
+    # whole directories, requires a temporal chunk_size
+    file_layout: typing.Literal['flat', 'hive'] = 'flat'
+
+    # limit on requests to the source's api, shared by tables of the source
+    rate_limit: absorb.RateLimit | None = None
+
+    # how failed chunks are retried, backoff and deadline are in seconds
+    retry_policy: absorb.RetryPolicy = {
+        'max_attempts': 3,
+        'initial_backoff': 1.0,
+        'max_backoff': 60.0,
+        'jitter': 0.5,
+        'retryable_status_codes': [408, 429, 500, 502, 503, 504],
+        'chunk_deadline': None,
+    }
+
+    # options for writing parquet files, overriding the config default
+    # keys are passed to polars write_parquet()
+    parquet_options: absorb.ParquetOptions = {}
+
     # dependencies
     required_packages: list[str] = []
     required_credentials: list[str] = []
@@ -18,18 +18,94 @@ if typing.TYPE_CHECKING:
         bytes_in_memory: NotRequired[int]
         bytes_on_disk: NotRequired[int]
         n_rows: NotRequired[int]
+        n_retries: NotRequired[int]
 
 
 class TableCollect(table_coverage.TableCoverage):
     def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        if self.has_chunk_payloads():
+            payload = self.fetch_chunk_payload(chunk)
+            if payload is None:
+                return None
+            return self.parse_chunk_payload(chunk, payload)
         raise NotImplementedError()
 
+    def fetch_chunk_payload(self, chunk: absorb.Chunk) -> bytes | None:
+        """optional, download raw bytes of chunk for parse_chunk_payload()"""
+        raise NotImplementedError()
+
+    def parse_chunk_payload(
+        self, chunk: absorb.Chunk, payload: bytes
+    ) -> absorb.ChunkResult | None:
+        """optional, decode raw bytes of chunk, can run in a worker process"""
+        raise NotImplementedError()
+
+    def has_chunk_payloads(self) -> bool:
+        return (
+            type(self).fetch_chunk_payload
+            is not TableCollect.fetch_chunk_payload
+            and type(self).parse_chunk_payload
+            is not TableCollect.parse_chunk_payload
+        )
+
+    async def collect_chunk_async(
+        self, chunk: absorb.Chunk
+    ) -> absorb.ChunkResult | None:
+        """optional asyncio version of collect_chunk(), used by acollect()"""
+        raise NotImplementedError()
+
+    def has_async_collect_chunk(self) -> bool:
+        return (
+            type(self).collect_chunk_async
+            is not TableCollect.collect_chunk_async
+        )
+
+    def call_with_retry(
+        self,
+        function: typing.Callable[..., T],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> T:
+        """call function, retrying transient errors using retry_policy"""
+        import time
+
+        start = time.monotonic()
+        n_failures = 0
+        while True:
+            try:
+                return function(*args, **kwargs)
+            except Exception as e:
+                n_failures += 1
+                elapsed = time.monotonic() - start
+                delay = self._get_retry_delay(e, n_failures, elapsed)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    def _get_retry_delay(
+        self, error: BaseException, n_failures: int, elapsed: float
+    ) -> float | None:
+        """get seconds to wait before retrying a failure, or None to give up"""
+        import random
+
+        policy = self.retry_policy
+        if n_failures >= policy['max_attempts']:
+            return None
+        if not absorb.ops.is_retryable_error(
+            error, policy['retryable_status_codes']
+        ):
+            return None
+        delay = policy['initial_backoff'] * 2 ** (n_failures - 1)
+        delay = min(delay, policy['max_backoff'])
+        delay = delay * (1 - policy['jitter'] * random.random())
+        deadline = policy['chunk_deadline']
+        if deadline is not None and elapsed + delay > deadline:
+            return None
+        return delay
+
     def is_collected(self) -> bool:
         """return True if any data files exist"""
-        import glob
-
-        data_glob = self.get_data_glob()
-        return len(glob.glob(data_glob)) > 0
+        return len(self.get_manifest()) > 0
 
     def collect(
         self,
@@ -38,13 +114,32 @@ class TableCollect(table_coverage.TableCoverage):
         overwrite: bool = False,
         verbose: int = 1,
         dry: bool = False,
+        workers: int | None = None,
+        executor: typing.Literal['thread', 'process'] = 'thread',
+        processes: int | None = None,
     ) -> None:
+        """collect missing chunks of table
+
+        - workers controls how many chunks are fetched concurrently
+        - executor='process' parses chunk payloads in a pool of `processes`
+          worker processes (default cpu count), requires
+          fetch_chunk_payload() and parse_chunk_payload()
+        """
         import datetime
 
+        if workers is not None and workers < 1:
+            raise Exception('workers must be at least 1')
+        if processes is not None and processes < 1:
+            raise Exception('processes must be at least 1')
         self._check_ready_to_collect()
+        if executor == 'process' and not self.has_chunk_payloads():
+            raise Exception(
+                "executor='process' requires fetch_chunk_payload() and "
+                'parse_chunk_payload() to be implemented'
+            )
 
         # get collection plan
-        chunks = self._get_chunks_to_collect(data_range, overwrite)
+        chunks, resumed = self._get_collect_plan(data_range, overwrite, verbose)
 
         # summarize collection plan
         start = datetime.datetime.now()
@@ -57,15 +152,201 @@ class TableCollect(table_coverage.TableCoverage):
 
         # create table directory
         self.setup_table_dir()
+        self._start_collect_journal(chunks, resumed, verbose)
 
         # collect each chunk
-        chunk_summaries = [
-            self._execute_collect_chunk(chunk, overwrite, verbose)
-            for chunk in chunks
-        ]
+        chunk_summaries, stage_stats = self._execute_collect_pipeline(
+            chunks, overwrite, verbose, workers, executor, processes
+        )
+
+        # summarize collection
+        self._summarize_collected_data(
+            chunk_summaries, start, verbose, stage_stats=stage_stats
+        )
+
+    async def acollect(
+        self,
+        data_range: typing.Any | None = None,
+        *,
+        overwrite: bool = False,
+        verbose: int = 1,
+        dry: bool = False,
+        concurrency: int = 16,
+    ) -> None:
+        """collect missing chunks of table from within an asyncio event loop
+
+        - at most `concurrency` chunks are in flight at once
+        - uses collect_chunk_async() if implemented, otherwise runs
+          collect_chunk() in a thread pool
+        - validation and writing run in the thread pool
+        """
+        import asyncio
+        import concurrent.futures
+        import datetime
+
+        if concurrency < 1:
+            raise Exception('concurrency must be at least 1')
+
+        self._check_ready_to_collect()
+
+        # get collection plan
+        chunks, resumed = await asyncio.to_thread(
+            self._get_collect_plan, data_range, overwrite, verbose
+        )
+
+        # summarize collection plan
+        start = datetime.datetime.now()
+        if verbose >= 1:
+            self._summarize_collect_plan(chunks, overwrite, verbose, dry, start)
+
+        # return early if dry
+        if dry:
+            return None
+
+        # create table directory
+        await asyncio.to_thread(self.setup_table_dir)
+        await asyncio.to_thread(
+            self._start_collect_journal, chunks, resumed, verbose
+        )
+
+        # collect each chunk
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        use_async = self.has_async_collect_chunk()
+
+        # threads are only needed for sync fetches, validation, and writes
+        executor = concurrent.futures.ThreadPoolExecutor(min(concurrency, 32))
+
+        def validate_and_write(
+            chunk: absorb.Chunk, data: absorb.ChunkResult | None
+        ) -> ChunkResultSummary:
+            self.validate_chunk(chunk=chunk, data=data)
+            return self._write_chunk(chunk, data, overwrite, verbose)
+
+        async def fetch_and_write(chunk: absorb.Chunk) -> ChunkResultSummary:
+            if use_async:
+                self._print_collecting_chunk(chunk, verbose)
+                self._journal_chunk(chunk, 'in_flight')
+                data = await self.collect_chunk_async(chunk)
+            else:
+                data = await loop.run_in_executor(
+                    executor, self._fetch_chunk, chunk, verbose
+                )
+            return await loop.run_in_executor(
+                executor, validate_and_write, chunk, data
+            )
+
+        async def collect_one(chunk: absorb.Chunk) -> ChunkResultSummary:
+            # retries back off without holding a concurrency slot
+            start = loop.time()
+            n_failures = 0
+            while True:
+                async with semaphore:
+                    try:
+                        summary = await fetch_and_write(chunk)
+                        break
+                    except Exception as e:
+                        n_failures += 1
+                        elapsed = loop.time() - start
+                        delay = self._get_retry_delay(e, n_failures, elapsed)
+                        if delay is None:
+                            self._journal_chunk(chunk, 'failed', str(e))
+                            raise
+                await asyncio.sleep(delay)
+            summary['n_retries'] = n_failures
+            return summary
+
+        tasks = [asyncio.create_task(collect_one(chunk)) for chunk in chunks]
+        try:
+            if len(tasks) > 0:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # cancel chunks still in flight after a failure or cancellation
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # wait for running writes without blocking the event loop
+            await asyncio.to_thread(executor.shutdown)
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                raise typing.cast(BaseException, task.exception())
+        chunk_summaries = [task.result() for task in tasks]
 
         # summarize collection
-        self._summarize_collected_data(chunk_summaries, start, verbose)
+        self._summarize_collected_data(list(chunk_summaries), start, verbose)
+
+    def _get_collect_plan(
+        self, data_range: typing.Any | None, overwrite: bool, verbose: int
+    ) -> tuple[typing.Sequence[absorb.Chunk], bool]:
+        """get chunks to collect and whether they resume an unfinished run"""
+        if overwrite and self.has_compacted_files():
+            raise Exception(
+                'cannot overwrite chunks of '
+                + self.full_name()
+                + ' because some of its files are compacted'
+            )
+        if data_range is None and not overwrite and self._uses_journal():
+            journal_path = self.get_journal_path()
+            pending = absorb.ops.get_pending_journal_chunks(journal_path)
+            if len(pending) > 0:
+                if verbose >= 1:
+                    print(
+                        'resuming',
+                        len(pending),
+                        'unfinished chunks from collection journal',
+                    )
+                chunk_size = self.get_chunk_size()
+                chunks = [
+                    absorb.ops.parse_chunk(chunk, chunk_size)
+                    for chunk in pending
+                ]
+                return chunks, True
+        return self._get_chunks_to_collect(data_range, overwrite), False
+
+    def _start_collect_journal(
+        self, chunks: typing.Sequence[absorb.Chunk], resumed: bool, verbose: int
+    ) -> None:
+        # remove partial files of interrupted writes
+        removed = absorb.ops.remove_tmp_files(self.get_table_dir())
+        if verbose >= 1 and len(removed) > 0:
+            print('removed', len(removed), 'incomplete tmp files')
+
+        # build manifest of files collected before manifests existed
+        self.get_manifest()
+
+        # record plan, unless continuing the plan already in the journal
+        if self._uses_journal() and not resumed:
+            absorb.ops.write_journal_entries(
+                self.get_journal_path(),
+                [self._get_journal_key(chunk) for chunk in chunks],
+                'planned',
+                truncate=True,
+            )
+
+    def _uses_journal(self) -> bool:
+        chunk_size = self.get_chunk_size()
+        return self.write_range != 'overwrite_all' and (
+            chunk_size in absorb.ops.temporal_intervals
+            or isinstance(chunk_size, int)
+            or absorb.ops.get_number_interval(chunk_size) is not None
+        )
+
+    def _get_journal_key(self, chunk: absorb.Chunk) -> str:
+        return absorb.ops.format_chunk(chunk, self.get_chunk_size())
+
+    def _journal_chunk(
+        self,
+        chunk: absorb.Chunk,
+        status: typing.Literal['in_flight', 'done', 'failed'],
+        error: str | None = None,
+    ) -> None:
+        if self._uses_journal():
+            absorb.ops.write_journal_entries(
+                self.get_journal_path(),
+                [self._get_journal_key(chunk)],
+                status,
+                error=error,
+            )
 
     def _check_ready_to_collect(self) -> None:
         import os
@@ -88,11 +369,11 @@ class TableCollect(table_coverage.TableCoverage):
 
     def _get_chunks_to_collect(
         self, data_range: absorb.Coverage | None = None, overwrite: bool = False
-    ) -> list[absorb.Chunk]:
+    ) -> typing.Sequence[absorb.Chunk]:
         if self.write_range == 'overwrite_all':
             if overwrite:
                 return [None]
-            available_range = self.get_available_range()
+            available_range = self.get_cached_available_range()
             collected_range = self.get_collected_range()
             if available_range is not None:
                 # if available_range exists, use it to decide whether to collect
@@ -150,7 +431,7 @@ class TableCollect(table_coverage.TableCoverage):
                         )
             else:
                 if overwrite:
-                    available_range = self.get_available_range()
+                    available_range = self.get_cached_available_range()
                     if available_range is None:
                         raise Exception(
                             'get_available_range() not properly implemented'
@@ -164,7 +445,7 @@ class TableCollect(table_coverage.TableCoverage):
 
     def _summarize_collect_plan(
         self,
-        chunks: list[absorb.Chunk],
+        chunks: typing.Sequence[absorb.Chunk],
         overwrite: bool,
         verbose: int,
         dry: bool,
@@ -223,6 +504,7 @@ class TableCollect(table_coverage.TableCoverage):
         summaries: list[ChunkResultSummary],
         start_time: datetime.datetime,
         verbose: int,
+        stage_stats: list[absorb.PipelineStageStats] | None = None,
     ) -> None:
         import datetime
         import toolstr
@@ -234,12 +516,16 @@ class TableCollect(table_coverage.TableCoverage):
         total_rows = 0
         total_disk_bytes = 0
         total_memory_bytes = 0
+        decoded_disk_bytes = 0
         n_success = 0
         for summary in summaries:
             if summary['success']:
                 total_rows += summary['n_rows']
                 total_disk_bytes += summary['bytes_on_disk']
-                total_memory_bytes += summary['bytes_in_memory']
+                # files moved into place are never decoded into memory
+                if 'bytes_in_memory' in summary:
+                    total_memory_bytes += summary['bytes_in_memory']
+                    decoded_disk_bytes += summary['bytes_on_disk']
                 n_success += 1
         n_fail = len(summaries) - n_success
 
@@ -275,6 +561,13 @@ class TableCollect(table_coverage.TableCoverage):
             str(n_success) + ' / ' + str(len(summaries)),
             symbol_color=symbol_color,
         )
+        n_retries = sum(summary.get('n_retries', 0) for summary in summaries)
+        if n_retries > 0:
+            absorb.ops.print_bullet(
+                'chunk retries',
+                str(n_retries),
+                symbol_color=symbol_color,
+            )
         absorb.ops.print_bullet(
             'collection end time',
             '  ' + str(end_time),
@@ -297,40 +590,257 @@ class TableCollect(table_coverage.TableCoverage):
             + toolstr.format_nbytes(total_memory_bytes)
             + ' in memory ('
             + toolstr.format(
-                total_memory_bytes / total_disk_bytes
-                if total_disk_bytes > 0 else 0
+                total_memory_bytes / decoded_disk_bytes
+                if decoded_disk_bytes > 0 else 0
                 , decimals=2)
             + 'x compression)',
             symbol_color=symbol_color,
         )
+        if stage_stats is not None and len(summaries) > 0:
+            absorb.ops.print_bullet(
+                'stage utilization',
+                ', '.join(
+                    stage['name']
+                    + ' '
+                    + toolstr.format(stage['utilization'], percentage=True)
+                    for stage in stage_stats
+                ),
+                symbol_color=symbol_color,
+            )
+
+        # adaptive concurrency windows of hosts requested during collection
+        windows = absorb.ops.get_concurrency_windows(
+            since=start_time.timestamp()
+        )
+        if len(windows) > 0 and len(summaries) > 0:
+            absorb.ops.print_bullet(
+                'concurrency windows',
+                ', '.join(
+                    host + ' ' + toolstr.format(window, decimals=1)
+                    for host, window in windows.items()
+                ),
+                symbol_color=symbol_color,
+            )
+
+    def _execute_collect_pipeline(
+        self,
+        chunks: typing.Sequence[absorb.Chunk],
+        overwrite: bool,
+        verbose: int,
+        workers: int | None,
+        executor: typing.Literal['thread', 'process'] = 'thread',
+        processes: int | None = None,
+    ) -> tuple[list[ChunkResultSummary], list[absorb.PipelineStageStats]]:
+        """collect chunks through fetch -> validate -> write stages
+
+        - fetch stage uses `workers` threads, validate and write use 1 each
+        - bounded queues let the next fetch overlap validating and writing
+        - if executor='process', fetch stage downloads raw payloads and a
+          pool of processes parses and validates each payload
+        """
+        if workers is None:
+            workers = 1
+
+        if executor == 'process':
+            return self._execute_collect_process_pipeline(
+                chunks, overwrite, verbose, workers, processes
+            )
+        elif executor != 'thread':
+            raise Exception('invalid executor: ' + str(executor))
+
+        def fetch(chunk: absorb.Chunk, previous: None) -> typing.Any:
+            return self._fetch_chunk(chunk, verbose)
+
+        def validate(chunk: absorb.Chunk, data: typing.Any) -> typing.Any:
+            self.validate_chunk(chunk=chunk, data=data)
+            return data
+
+        def write(chunk: absorb.Chunk, data: typing.Any) -> ChunkResultSummary:
+            return self._write_chunk(chunk, data, overwrite, verbose)
+
+        return self._run_collect_stages(
+            chunks,
+            [
+                ('fetch', fetch, workers),
+                ('validate', validate, 1),
+                ('write', write, 1),
+            ],
+            workers,
+            verbose,
+        )
 
-    def _execute_collect_chunk(
+    def _execute_collect_process_pipeline(
         self,
-        chunk: absorb.Chunk,
+        chunks: typing.Sequence[absorb.Chunk],
         overwrite: bool,
         verbose: int,
-    ) -> ChunkResultSummary:
-        import glob
+        workers: int,
+        processes: int | None = None,
+    ) -> tuple[list[ChunkResultSummary], list[absorb.PipelineStageStats]]:
+        """collect chunks through fetch -> parse -> write stages
+
+        - parse stage decodes and validates payloads in worker processes
+        - write stage runs in this process, in plan order, so overwrite
+          cleanup and truncation on failure behave like executor='thread'
+        """
+        import concurrent.futures
+        import contextlib
+        import multiprocessing
         import os
 
-        # print summary
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        # a single chunk is parsed inline rather than paying for a pool
+        process_pool: concurrent.futures.Executor | None
+        if len(chunks) <= 1:
+            processes = 1
+            process_pool = None
+        else:
+            # spawn rather than fork, forking a process that has started
+            # polars threads can deadlock
+            process_pool = concurrent.futures.ProcessPoolExecutor(
+                processes, mp_context=multiprocessing.get_context('spawn')
+            )
+
+        def fetch(chunk: absorb.Chunk, previous: None) -> bytes | None:
+            self._print_collecting_chunk(chunk, verbose)
+            self._journal_chunk(chunk, 'in_flight')
+            return self.fetch_chunk_payload(chunk)
+
+        def parse(
+            chunk: absorb.Chunk, payload: bytes | None
+        ) -> absorb.ChunkResult | None:
+            if process_pool is None:
+                return _parse_and_validate_chunk(self, chunk, payload)
+            future = process_pool.submit(
+                _parse_and_validate_chunk, self, chunk, payload
+            )
+            return future.result()
+
+        def write(
+            chunk: absorb.Chunk, data: absorb.ChunkResult | None
+        ) -> ChunkResultSummary:
+            return self._write_chunk(chunk, data, overwrite, verbose)
+
+        with process_pool or contextlib.nullcontext():
+            return self._run_collect_stages(
+                chunks,
+                [
+                    ('fetch', fetch, workers),
+                    ('parse', parse, processes),
+                    ('write', write, 1),
+                ],
+                workers,
+                verbose,
+            )
+
+    def _run_collect_stages(
+        self,
+        chunks: typing.Sequence[absorb.Chunk],
+        stages: list[tuple[str, typing.Callable[..., typing.Any], int]],
+        workers: int,
+        verbose: int,
+    ) -> tuple[list[ChunkResultSummary], list[absorb.PipelineStageStats]]:
+        """run collection stages, requeueing failed fetches per retry_policy"""
+        n_retries: dict[int, int] = {}
+
+        def retry(
+            index: int, error: BaseException, n_failures: int, elapsed: float
+        ) -> float | None:
+            delay = self._get_retry_delay(error, n_failures, elapsed)
+            if delay is None:
+                self._journal_chunk(chunks[index], 'failed', str(error))
+            else:
+                n_retries[index] = n_failures
+                if verbose >= 1:
+                    print(
+                        'requeueing chunk '
+                        + str(index + 1)
+                        + ' after error: '
+                        + str(error)
+                    )
+            return delay
+
+        summaries, stage_stats = absorb.ops.run_pipeline(
+            chunks, stages, queue_size=workers, ordered=True, retry=retry
+        )
+        for index, summary in enumerate(summaries):
+            summary['n_retries'] = n_retries.get(index, 0)
+        return summaries, stage_stats
+
+    def _fetch_chunk(
+        self, chunk: absorb.Chunk, verbose: int
+    ) -> absorb.ChunkResult | None:
+        self._print_collecting_chunk(chunk, verbose)
+        self._journal_chunk(chunk, 'in_flight')
+        return self.collect_chunk(chunk=chunk)
+
+    def _print_collecting_chunk(
+        self, chunk: absorb.Chunk, verbose: int
+    ) -> None:
         if verbose >= 1:
             if self.write_range == 'overwrite_all':
-                as_str = 'all'
                 print('[collecting entire dataset]')
             else:
                 as_str = absorb.ops.format_chunk(chunk, self.get_chunk_size())
                 print('[collecting', as_str + ']')
 
-        # collect chunk
-        data = self.collect_chunk(chunk=chunk)
-
-        # validate chunk
-        self.validate_chunk(chunk=chunk, data=data)
+    def _sort_by_index(self, df: pl.DataFrame) -> pl.DataFrame:
+        try:
+            index_column = self.get_index_column()
+        except Exception:
+            return df
+        if isinstance(index_column, str):
+            columns = [index_column]
+        elif isinstance(index_column, tuple):
+            columns = list(index_column)
+        else:
+            return df
+        if not all(column in df.columns for column in columns):
+            return df
+        if len(columns) == 1 and df[columns[0]].is_sorted():
+            return df
+        return df.sort(columns, maintain_order=True)
+
+    def _write_chunk(
+        self,
+        chunk: absorb.Chunk,
+        data: absorb.ChunkResult | None,
+        overwrite: bool,
+        verbose: int,
+    ) -> ChunkResultSummary:
+        import os
 
         # write file
         if data is None:
             chunk_summary: ChunkResultSummary = {'success': False}
+        elif isinstance(data, dict) and data.get('type') == 'files':
+            import shutil
+
+            # move file into place without decoding it
+            if len(data['paths']) != 1:
+                raise Exception(
+                    'expected one file per chunk, got '
+                    + str(len(data['paths']))
+                )
+            path = self.get_chunk_path(chunk=chunk)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.move(data['paths'][0], path)
+            entry = self._create_manifest_entry_from_file(
+                path, self._get_manifest_chunk_key(path)
+            )
+            absorb.ops.update_manifest(self.get_manifest_path(), add=[entry])
+            if self.write_range == 'overwrite_all':
+                self._remove_other_files(path)
+
+            chunk_summary = {
+                'success': True,
+                'paths': [path],
+                'bytes_on_disk': os.path.getsize(path),
+                'n_rows': entry['n_rows'],
+            }
+            self._journal_chunk(chunk, 'done')
         elif self.chunk_datatype == 'dataframe':
             import polars as pl
 
@@ -338,15 +848,23 @@ class TableCollect(table_coverage.TableCoverage):
                 raise Exception(
                     'collected data is not a DataFrame: ' + str(type(data))
                 )
+            # sort by index so that row group statistics are narrow
+            data = self._sort_by_index(data)
+
             path = self.get_chunk_path(chunk=chunk, df=data)
-            absorb.ops.write_file(df=data, path=path)
+            manifest_path = self.get_manifest_path()
+            absorb.ops.write_file(
+                df=data,
+                path=path,
+                manifest_path=manifest_path,
+                chunk=self._get_manifest_chunk_key(path),
+                index_column=self._get_manifest_index_column(),
+                parquet_options=self.get_parquet_options(),
+            )
 
             # delete other files if write_range=overwrite_all
             if self.write_range == 'overwrite_all':
-                for other_path in glob.glob(self.get_data_glob()):
-                    if other_path != path:
-                        print('removing old data', other_path)
-                        os.remove(other_path)
+                self._remove_other_files(path)
 
             chunk_summary = {
                 'success': True,
@@ -355,6 +873,7 @@ class TableCollect(table_coverage.TableCoverage):
                 'bytes_on_disk': os.path.getsize(path),
                 'n_rows': data.shape[0],
             }
+            self._journal_chunk(chunk, 'done')
         else:
             raise Exception()
 
@@ -364,6 +883,43 @@ class TableCollect(table_coverage.TableCoverage):
 
         return chunk_summary
 
+    def _remove_other_files(self, path: str) -> None:
+        """remove data files other than path, for write_range=overwrite_all"""
+        import os
+
+        table_dir = self.get_table_dir()
+        old_paths = [
+            os.path.join(table_dir, filename)
+            for filename in self.get_manifest()
+            if filename != os.path.relpath(path, table_dir)
+        ]
+        for other_path in old_paths:
+            print('removing old data', other_path)
+            if os.path.isfile(other_path):
+                os.remove(other_path)
+        absorb.ops.update_manifest(self.get_manifest_path(), remove=old_paths)
+
+    def download_chunk_file(
+        self, chunk: absorb.Chunk, url: str
+    ) -> absorb.ChunkResult:
+        """download parquet file of chunk, streamed next to its destination
+
+        if the file already has the schema of the table, returns its path so
+        that collect() moves it into place without decoding or re-encoding
+        it, otherwise returns its DataFrame
+        """
+        import os
+        import polars as pl
+
+        path = self.get_chunk_path(chunk=chunk) + '.download_tmp'
+        absorb.ops.download_file(url=url, path=path)
+        if dict(pl.scan_parquet(path).collect_schema()) == self.get_schema():
+            return {'type': 'files', 'paths': [path]}
+        try:
+            return pl.read_parquet(path)
+        finally:
+            os.remove(path)
+
     def validate_chunk(
         self, chunk: absorb.Chunk, data: absorb.ChunkResult | None
     ) -> None:
@@ -373,22 +929,7 @@ class TableCollect(table_coverage.TableCoverage):
         if data is None:
             return
 
-        if self.chunk_datatype == 'dataframe':
-            if not isinstance(data, pl.DataFrame):
-                raise Exception(
-                    'collected data is not a DataFrame: ' + str(type(data))
-                )
-            assert dict(data.schema) == self.get_schema(), (
-                'collected data does not match schema: '
-                + str(dict(data.schema))
-                + ' != '
-                + str(self.get_schema())
-            )
-        elif self.chunk_datatype == 'files':
-            if not isinstance(data, dict) or data.get('type') != 'files':
-                raise Exception(
-                    'collected data is not a path dict: ' + str(type(data))
-                )
+        if isinstance(data, dict) and data.get('type') == 'files':
             for path in data['paths']:
                 assert os.path.exists(path), (
                     'collected data does not exist: ' + path
@@ -400,5 +941,32 @@ class TableCollect(table_coverage.TableCoverage):
                     + ' != '
                     + str(self.get_schema())
                 )
+        elif self.chunk_datatype == 'dataframe':
+            if not isinstance(data, pl.DataFrame):
+                raise Exception(
+                    'collected data is not a DataFrame: ' + str(type(data))
+                )
+            assert dict(data.schema) == self.get_schema(), (
+                'collected data does not match schema: '
+                + str(dict(data.schema))
+                + ' != '
+                + str(self.get_schema())
+            )
+        elif self.chunk_datatype == 'files':
+            raise Exception(
+                'collected data is not a path dict: ' + str(type(data))
+            )
         else:
             raise Exception('invalid data format: ' + str(type(data)))
+
+
+def _parse_and_validate_chunk(
+    table: TableCollect, chunk: absorb.Chunk, payload: bytes | None
+) -> absorb.ChunkResult | None:
+    """runs inside worker process when using executor='process'"""
+    if payload is None:
+        data = None
+    else:
+        data = table.parse_chunk_payload(chunk, payload)
+    table.validate_chunk(chunk=chunk, data=data)
+    return data
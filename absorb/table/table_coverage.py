@@ -22,57 +22,218 @@ class TableCoverage(table_io.TableIO):
                 + str(type(self).__name__)
             )
 
+    def get_cached_available_range(
+        self, refresh: bool = False
+    ) -> absorb.Coverage | None:
+        """get available range, reusing a result fetched by any process
+
+        results are cached under ABSORB_ROOT for the table's update latency,
+        refresh=True fetches a new result regardless
+        """
+        try:
+            ttl = self.get_update_latency()
+        except Exception:
+            ttl = 0
+        if not refresh and ttl > 0:
+            hit, available_range = absorb.ops.read_cached_available_range(
+                self, ttl
+            )
+            if hit:
+                return available_range
+        available_range = self.get_available_range()
+        if ttl > 0:
+            absorb.ops.write_cached_available_range(self, available_range)
+        return available_range
+
     def get_collected_range(self) -> absorb.Coverage | None:
-        import os
-        import glob
+        """get collected coverage
 
-        dir_path = self.get_table_dir()
-        if not os.path.isdir(dir_path):
+        for chunked tables, this is a sorted list of ranges of contiguous
+        chunks, so that gaps count as missing
+        - closed ranges are (first_chunk, last_chunk)
+        - semiopen ranges are (first_chunk, end_of_last_chunk)
+        - number_range chunks give ranges of the index, (first, last)
+        """
+        if self.write_range != 'overwrite_all' and self.is_range_sortable():
+            ranges = self._get_collected_chunk_ranges()
+            if len(ranges) == 0:
+                return None
+            if self.boundary_type == 'semiopen':
+                chunk_size = self.get_chunk_size()
+                if absorb.ops.get_number_interval(chunk_size) is not None:
+                    step = 1
+                else:
+                    step = absorb.ops.get_chunk_step(chunk_size)
+                ranges = [(start, end + step) for start, end in ranges]
+            return ranges
+
+        manifest = self.get_manifest()
+        if len(manifest) == 0:
             return None
 
-        data_glob = self.get_data_glob()
         if self.write_range == 'overwrite_all':
-            files = sorted(glob.glob(data_glob))
-            if len(files) == 0:
-                return None
-            elif len(files) == 1:
-                import polars as pl
-
-                # for now: only handle timestamp ranges if timestamp present
-                schema = self.scan().collect_schema()
-                if 'timestamp' in schema.names():
-                    df = (
-                        self.scan()
-                        .select(
-                            min_timestamp=pl.col.timestamp.min(),
-                            max_timestamp=pl.col.timestamp.max(),
-                        )
-                        .collect()
-                    )
-                    return (df['min_timestamp'][0], df['max_timestamp'][0])
-
-                else:
-                    return None
-            else:
+            if len(manifest) > 1:
                 raise Exception(
                     'too many files, there should only be one parquet file when when overwrite_all=True'
                 )
-        elif self.is_range_sortable():
-            files = sorted(glob.glob(data_glob))
-            if len(files) == 0:
+            # for now: only handle timestamp ranges if timestamp present
+            (entry,) = manifest.values()
+            if self._get_manifest_index_column() != 'timestamp':
                 return None
-            start = self.parse_chunk_path(files[0])['chunk']
-            end = self.parse_chunk_path(files[-1])['chunk']
-            return (start, end)
+            if entry['index_min'] is None or entry['index_max'] is None:
+                return None
+            return (
+                absorb.ops.parse_manifest_index_value(entry['index_min']),
+                absorb.ops.parse_manifest_index_value(entry['index_max']),
+            )
         else:
             raise Exception()
 
+    def _get_collected_chunk_ranges(
+        self,
+    ) -> list[tuple[typing.Any, typing.Any]]:
+        """get contiguous chunk ranges, cached until the manifest changes"""
+        import json
+        import os
+
+        chunk_size = self.get_chunk_size()
+        if chunk_size is None:
+            raise Exception('chunk ranges require chunk_size to be set')
+        manifest_path = self.get_manifest_path()
+        if not os.path.isfile(manifest_path):
+            # build manifest of files collected before manifests existed
+            if len(self.get_manifest()) == 0:
+                return []
+        stat = os.stat(manifest_path)
+        key = [stat.st_size, stat.st_mtime_ns]
+
+        # use cached ranges if manifest is unchanged
+        coverage_path = self.get_coverage_path()
+        try:
+            with open(coverage_path, 'r') as f:
+                cached = json.load(f)
+            if cached['manifest'] == key:
+                if isinstance(chunk_size, dict):
+                    return [(start, end) for start, end in cached['ranges']]
+                return [
+                    (
+                        absorb.ops.parse_chunk(start, chunk_size),
+                        absorb.ops.parse_chunk(end, chunk_size),
+                    )
+                    for start, end in cached['ranges']
+                ]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+        # merge chunks of manifest into ranges
+        chunks = self.parse_chunk_paths(
+            list(absorb.ops.read_manifest(manifest_path))
+        )
+        ranges = absorb.ops.get_contiguous_ranges(chunks, chunk_size)
+
+        # write cache via tmp file
+        if isinstance(chunk_size, dict):
+            cached_ranges = [[start, end] for start, end in ranges]
+        else:
+            cached_ranges = [
+                [
+                    absorb.ops.format_chunk(start, chunk_size),
+                    absorb.ops.format_chunk(end, chunk_size),
+                ]
+                for start, end in ranges
+            ]
+        cached = {'manifest': key, 'ranges': cached_ranges}
+        tmp_path = coverage_path + '_tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cached, f)
+        os.replace(tmp_path, coverage_path)
+
+        return ranges
+
+    def get_manifest(self) -> dict[str, absorb.ManifestEntry]:
+        """get manifest entries of collected data files, keyed by filename
+
+        tables collected before manifests existed get a manifest built from
+        their data files on first use
+        """
+        import os
+
+        manifest_path = self.get_manifest_path()
+        if not os.path.isfile(manifest_path):
+            if not os.path.isdir(self.get_table_dir()):
+                return {}
+            entries = self._create_manifest_from_files()
+            if len(entries) == 0:
+                return {}
+            absorb.ops.write_manifest(manifest_path, entries)
+        return absorb.ops.read_manifest(manifest_path)
+
+    def _create_manifest_from_files(self) -> list[absorb.ManifestEntry]:
+        import glob
+
+        paths = sorted(glob.glob(self.get_data_glob()))
+        chunk_keys = absorb.ops.parse_chunk_paths(
+            paths, self.filename_template, chunk_size=None
+        ).to_list()
+        return [
+            self._create_manifest_entry_from_file(path, chunk_key)
+            for path, chunk_key in zip(paths, chunk_keys)
+        ]
+
+    def _create_manifest_entry_from_file(
+        self, path: str, chunk_key: str | None
+    ) -> absorb.ManifestEntry:
+        """create manifest entry of data file, reading only its index column"""
+        import polars as pl
+
+        index_column = self._get_manifest_index_column()
+        lf = pl.scan_parquet(path)
+        columns = lf.collect_schema().names()
+        if index_column in columns:
+            df = lf.select(index_column).collect()
+        else:
+            df = lf.select(columns[:1]).collect()
+        return absorb.ops.create_manifest_entry(
+            df=df,
+            path=path,
+            chunk=chunk_key,
+            index_column=index_column,
+            root=self.get_table_dir(),
+        )
+
+    def _get_manifest_index_column(self) -> str | None:
+        try:
+            index_column = self.get_index_column()
+        except Exception:
+            index_column = None
+        if index_column is None:
+            return 'timestamp'
+        elif isinstance(index_column, str):
+            return index_column
+        else:
+            return None
+
+    def _get_manifest_chunk_key(self, path: str) -> str | None:
+        parsed = absorb.ops.parse_chunk_path(
+            path, self.filename_template, chunk_size=None
+        )
+        return parsed.get('chunk')
+
+    def has_compacted_files(self) -> bool:
+        """return True if any data file holds a compacted range of chunks"""
+        if absorb.ops.get_number_interval(self.get_chunk_size()) is not None:
+            return False
+        return any(
+            entry['chunk'] is not None and '_to_' in entry['chunk']
+            for entry in self.get_manifest().values()
+        )
+
     def get_missing_ranges(self) -> absorb.Coverage:
         if self.write_range == 'overwrite_all':
             raise Exception(
                 'get_missing_ranges() does not apply to tables that use overwrite_all'
             )
-        available_range = self.get_available_range()
+        available_range = self.get_cached_available_range()
         if available_range is None:
             raise Exception('get_available_range() not properly implemented')
 
@@ -108,7 +269,10 @@ class TableCoverage(table_io.TableIO):
         update_latency = datetime.timedelta(self.get_update_latency())
 
         # return whether now is past the last update time + min update_latency
-        return datetime.datetime.now(tz=datetime.timezone.utc) > last_update_time + update_latency
+        return (
+            datetime.datetime.now(tz=datetime.timezone.utc)
+            > last_update_time + update_latency
+        )
 
     def get_last_update_time(self) -> datetime.datetime | None:
         """
@@ -117,15 +281,22 @@ class TableCoverage(table_io.TableIO):
         - the time that the dataset was collected
         - can decide based on whether is temporal and whether write_range=all
         """
+        manifest = self.get_manifest()
         if self.get_index_type() == 'temporal':
-            return self.get_max_collected_timestamp()
+            if self._get_manifest_index_column() is None:
+                return self.get_max_collected_timestamp()
+            index_maxes = [
+                absorb.ops.parse_manifest_index_value(entry['index_max'])
+                for entry in manifest.values()
+                if entry['index_max'] is not None
+            ]
+            if len(index_maxes) == 0:
+                return None
+            return max(index_maxes)
         else:
-            import glob
-
-            files = sorted(glob.glob(self.get_data_glob()))
-            if len(files) == 0:
+            if len(manifest) == 0:
                 return None
-            parsed = self.parse_chunk_path(files[-1])
+            parsed = self.parse_chunk_path(list(manifest.keys())[-1])
             if 'chunk' in parsed:
                 try:
                     return absorb.ops.parse_raw_datetime(parsed['chunk'])
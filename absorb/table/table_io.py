@@ -13,20 +13,225 @@ class TableIO(table_paths.TablePaths):
     def scan(
         self,
         *,
+        start: typing.Any = None,
+        end: typing.Any = None,
+        columns: typing.Sequence[str] | None = None,
+        filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
         scan_kwargs: dict[str, typing.Any] | None = None,
     ) -> pl.LazyFrame:
+        """scan data files of table
+
+        - start and end select the range [start, end) of the index, only the
+          data files that overlap the range are read
+        - filter is applied before selecting columns, so it can use columns
+          that are not in columns
+        """
         import polars as pl
 
-        if scan_kwargs is None:
-            scan_kwargs = {}
+        source: str | list[str] = self.get_data_glob()
+        empty = False
+        if start is not None or end is not None:
+            range_paths = self.get_range_paths(start=start, end=end)
+            if len(range_paths) > 0:
+                source = range_paths
+            else:
+                empty = True
+
+        scan_kwargs = dict(self.get_hive_scan_kwargs(), **(scan_kwargs or {}))
         try:
-            return pl.scan_parquet(self.get_data_glob(), **scan_kwargs)
+            lf = pl.scan_parquet(source, **scan_kwargs)
         except Exception as e:
             if e.args[0].startswith('expected at least 1 source'):
                 raise Exception('no data to load for ' + str(self.full_name()))
             else:
                 raise e
 
+        # let polars use sortedness for range filters and joins
+        sorted_column = self.get_sorted_column()
+        if sorted_column is not None:
+            lf = lf.set_sorted(sorted_column)
+
+        if empty:
+            lf = lf.clear()
+        else:
+            lf = self.filter_range(lf, start=start, end=end)
+        return self._filter_and_select(lf, columns=columns, filter=filter)
+
+    def _filter_and_select(
+        self,
+        lf: pl.LazyFrame,
+        *,
+        columns: typing.Sequence[str] | None = None,
+        filter: pl.Expr | typing.Sequence[pl.Expr] | None = None,
+    ) -> pl.LazyFrame:
+        """polars pushes both into the parquet reader of the scan"""
+        import polars as pl
+
+        if isinstance(filter, pl.Expr):
+            lf = lf.filter(filter)
+        elif filter is not None:
+            lf = lf.filter(*filter)
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf
+
+    def get_range_paths(
+        self, *, start: typing.Any = None, end: typing.Any = None
+    ) -> list[str]:
+        """get data files that overlap the range [start, end) of the index
+
+        files are selected by the chunks in their filenames, or by the index
+        bounds in the manifest if filenames do not have parseable chunks
+        """
+        import glob
+        import os
+        import polars as pl
+
+        start = _to_naive_utc(start)
+        end = _to_naive_utc(end)
+        paths = sorted(glob.glob(self.get_data_glob()))
+        if len(paths) == 0:
+            return []
+
+        # select by chunks of filenames
+        chunk_size = self.get_chunk_size()
+        if chunk_size is not None and not isinstance(chunk_size, int):
+            chunks = self.parse_chunk_paths(paths)
+            if chunks.dtype != pl.String and chunks.null_count() == 0:
+                spans = chunks.struct.unnest().with_columns(
+                    path=pl.Series(paths)
+                )
+                if start is not None:
+                    if absorb.ops.get_number_interval(chunk_size) is not None:
+                        end_of_file = pl.col.end + 1
+                    else:
+                        offset = _polars_durations[chunk_size]  # type: ignore
+                        end_of_file = pl.col.end.dt.offset_by(offset)
+                    spans = spans.filter(end_of_file > start)
+                if end is not None:
+                    spans = spans.filter(pl.col.start < end)
+                return spans['path'].to_list()
+
+        # select by index bounds of manifest
+        table_dir = self.get_table_dir()
+        selected = []
+        manifest = self.get_manifest()
+        for path in paths:
+            entry = manifest.get(os.path.relpath(path, table_dir))
+            if entry is not None and entry['index_min'] is not None:
+                index_min = _to_naive_utc(
+                    absorb.ops.parse_manifest_index_value(entry['index_min'])
+                )
+                index_max = _to_naive_utc(
+                    absorb.ops.parse_manifest_index_value(entry['index_max'])
+                )
+                if start is not None and index_max < start:
+                    continue
+                if end is not None and index_min >= end:
+                    continue
+            selected.append(path)
+        return selected
+
+    def filter_range(
+        self,
+        lf: pl.LazyFrame,
+        *,
+        start: typing.Any = None,
+        end: typing.Any = None,
+    ) -> pl.LazyFrame:
+        """filter rows of table scan to the range [start, end) of the index
+
+        also filters hive partition columns, so that scans of a hive glob
+        skip the directories outside of the range
+        """
+        import datetime
+        import polars as pl
+
+        if start is None and end is None:
+            return lf
+        start = _to_naive_utc(start)
+        end = _to_naive_utc(end)
+        schema = lf.collect_schema()
+        predicates = []
+
+        # filter rows at the edges of the range
+        try:
+            index_column = self.get_index_column()
+        except Exception:
+            index_column = None
+        if isinstance(index_column, str) and index_column in schema:
+            dtype = schema[index_column]
+            bounds = {}
+            for name, value in [('start', start), ('end', end)]:
+                if value is None:
+                    continue
+                elif (
+                    isinstance(dtype, pl.Datetime)
+                    and dtype.time_zone is not None
+                ):
+                    value = value.replace(tzinfo=datetime.timezone.utc)
+                    bounds[name] = pl.lit(value).dt.convert_time_zone(
+                        dtype.time_zone
+                    )
+                else:
+                    bounds[name] = pl.lit(value)
+            if 'start' in bounds:
+                predicates.append(pl.col(index_column) >= bounds['start'])
+            if 'end' in bounds:
+                predicates.append(pl.col(index_column) < bounds['end'])
+
+        # filter directories of hive partitions
+        if self.file_layout == 'hive':
+            keys = absorb.ops.get_hive_partition_keys(self.get_chunk_size())
+            if all(key in schema for key in keys):
+                predicates.extend(
+                    absorb.ops.get_hive_range_predicates(
+                        keys, start=start, end=end
+                    )
+                )
+
+        if len(predicates) == 0:
+            return lf
+        return lf.filter(*predicates)
+
+    def get_sorted_column(self) -> str | None:
+        """get index column that scan() output is sorted by, if any
+
+        data is sorted if, according to the manifest, each file is sorted and
+        the files do not overlap when taken in filename order
+        """
+        import os
+
+        try:
+            index_column = self.get_index_column()
+        except Exception:
+            return None
+        if not isinstance(index_column, str):
+            return None
+
+        manifest_path = self.get_manifest_path()
+        if not os.path.isfile(manifest_path):
+            return None
+        manifest = absorb.ops.read_manifest(manifest_path)
+        previous_max = None
+        for filename in sorted(manifest.keys()):
+            entry = manifest[filename]
+            if entry['n_rows'] == 0:
+                continue
+            if not entry.get('sorted', False):
+                return None
+            index_min = absorb.ops.parse_manifest_index_value(
+                entry['index_min']
+            )
+            if previous_max is not None and index_min < previous_max:
+                return None
+            previous_max = absorb.ops.parse_manifest_index_value(
+                entry['index_max']
+            )
+        if previous_max is None:
+            return None
+        return index_column
+
     def load(self, **kwargs: typing.Any) -> pl.DataFrame:
         """kwargs are the parameters of Table.scan()"""
         import polars as pl
@@ -38,3 +243,22 @@ class TableIO(table_paths.TablePaths):
                 raise Exception('no data to load for ' + str(self.full_name()))
             else:
                 raise e
+
+
+_polars_durations = {
+    'hour': '1h',
+    'day': '1d',
+    'week': '1w',
+    'month': '1mo',
+    'quarter': '1q',
+    'year': '1y',
+}
+
+
+def _to_naive_utc(value: typing.Any) -> typing.Any:
+    """chunks and bounds of ranges are compared as naive utc timestamps"""
+    import datetime
+
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
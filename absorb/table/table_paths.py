@@ -20,6 +20,21 @@ class TablePaths(table_names.TableNames):
             self.name(), source=self.source, warn=warn
         )
 
+    def get_journal_path(self, warn: bool = True) -> str:
+        return absorb.ops.get_table_journal_path(
+            self.name(), source=self.source, warn=warn
+        )
+
+    def get_manifest_path(self, warn: bool = True) -> str:
+        return absorb.ops.get_table_manifest_path(
+            self.name(), source=self.source, warn=warn
+        )
+
+    def get_coverage_path(self, warn: bool = True) -> str:
+        return absorb.ops.get_table_coverage_path(
+            self.name(), source=self.source, warn=warn
+        )
+
     def get_data_glob(self, warn: bool = True) -> str:
         return self.get_chunk_path(glob=True, warn=warn)
 
@@ -65,8 +80,21 @@ class TablePaths(table_names.TableNames):
             parameters=self.parameters,
             glob=glob,
             warn=warn,
+            file_layout=self.file_layout,
         )
 
+    def get_hive_scan_kwargs(self) -> dict[str, typing.Any]:
+        """get scan_parquet() kwargs for reading partitions of the file layout"""
+        import polars as pl
+
+        if self.file_layout != 'hive':
+            return {}
+        keys = absorb.ops.get_hive_partition_keys(self.get_chunk_size())
+        return {
+            'hive_partitioning': True,
+            'hive_schema': {key: pl.Int32 for key in keys},
+        }
+
     def parse_chunk_path(self, path: str) -> dict[str, typing.Any]:
         if self.write_range == 'overwrite_all':
             chunk_size = None
@@ -78,6 +106,17 @@ class TablePaths(table_names.TableNames):
             chunk_size=chunk_size,
         )
 
+    def parse_chunk_paths(self, paths: typing.Sequence[str]) -> pl.Series:
+        if self.write_range == 'overwrite_all':
+            chunk_size = None
+        else:
+            chunk_size = self.get_chunk_size()
+        return absorb.ops.paths.parse_chunk_paths(
+            paths=paths,
+            filename_template=self.filename_template,
+            chunk_size=chunk_size,
+        )
+
     def setup_table_dir(self) -> None:
         import json
         import os
@@ -33,6 +33,8 @@ class TableProperties(table_base.TableBase):
         elif isinstance(chunk_size, int):
             return 'numerical'
         elif isinstance(chunk_size, dict):
+            if absorb.ops.get_number_interval(chunk_size) is not None:
+                return 'numerical'
             raise NotImplementedError('chunk_size as dict is not implemented')
         else:
             raise Exception('invalid type for chunk_size')
@@ -91,3 +93,8 @@ class TableProperties(table_base.TableBase):
             raise Exception('could not determine update latency')
         else:
             raise Exception('invalid format for class update_latency')
+
+    def get_parquet_options(self) -> absorb.ParquetOptions:
+        options = absorb.ops.get_config()['parquet_options'].copy()
+        options.update(type(self).parquet_options)
+        return options
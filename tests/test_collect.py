@@ -0,0 +1,834 @@
+from __future__ import annotations
+
+import datetime
+import json
+import typing
+
+import polars as pl
+import pytest
+
+import absorb
+
+
+class Counts(absorb.Table):
+    source = 'test_source'
+    description = 'one row per day'
+    url = 'https://example.com'
+    write_range = 'append_only'
+    chunk_size = 'day'
+
+    def get_schema(self) -> dict[str, pl.DataType | type[pl.DataType]]:
+        return {'timestamp': pl.Datetime('us', 'UTC'), 'value': pl.Int64}
+
+    def get_available_range(self) -> absorb.Coverage:
+        return (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 20))
+
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        timestamp = typing.cast(datetime.datetime, chunk)
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        return pl.DataFrame(
+            {'timestamp': [timestamp], 'value': [timestamp.day]},
+            schema=self.get_schema(),
+        )
+
+
+@pytest.fixture
+def absorb_root(tmp_path: typing.Any, monkeypatch: typing.Any) -> str:
+    root = str(tmp_path)
+    monkeypatch.setenv('ABSORB_ROOT', root)
+    config = absorb.ops.get_default_config()
+    config['use_git'] = False
+    with open(absorb.ops.get_config_path(), 'w') as f:
+        json.dump(config, f)
+    return root
+
+
+@pytest.mark.parametrize('workers', [None, 1, 4])
+def test_collect_with_workers(absorb_root: str, workers: int | None) -> None:
+    table = Counts()
+    table.collect(verbose=0, workers=workers)
+
+    df = table.load().sort('timestamp')
+    assert len(df) == 20
+    assert df['value'].to_list() == list(range(1, 21))
+    assert table.get_missing_ranges() == []
+
+
+def test_collect_pipeline_stage_stats(absorb_root: str) -> None:
+    table = Counts()
+    table.setup_table_dir()
+    chunks = table._get_chunks_to_collect()
+    summaries, stage_stats = table._execute_collect_pipeline(
+        chunks, overwrite=False, verbose=0, workers=3
+    )
+
+    assert [summary['success'] for summary in summaries] == [True] * 20
+    assert [stage['name'] for stage in stage_stats] == [
+        'fetch',
+        'validate',
+        'write',
+    ]
+    for stage in stage_stats:
+        assert stage['n_items'] == 20
+        assert 0 <= stage['utilization'] <= 1
+
+
+def test_pipeline_reraises_stage_errors() -> None:
+    def fail_on_three(item: int, previous: typing.Any) -> int:
+        if item == 3:
+            raise ValueError('bad item')
+        return item
+
+    with pytest.raises(ValueError):
+        absorb.ops.run_pipeline(
+            list(range(10)),
+            [('a', fail_on_three, 2), ('b', lambda item, prev: prev, 1)],
+        )
+
+
+class FailingCounts(Counts):
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        timestamp = typing.cast(datetime.datetime, chunk)
+        if timestamp.day == 3:
+            raise ValueError('bad chunk')
+        return super().collect_chunk(chunk)
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_collect_failure_truncates(absorb_root: str, workers: int) -> None:
+    table = FailingCounts()
+    with pytest.raises(ValueError, match='bad chunk'):
+        table.collect(verbose=0, workers=workers)
+
+    # chunks before the failure are written, nothing after it
+    df = table.load().sort('timestamp')
+    assert df['value'].to_list() == [1, 2]
+    missing = table.get_missing_ranges()
+    assert missing[0][0] == datetime.datetime(2025, 1, 3)
+
+
+def test_pipeline_failure_keeps_ordered_prefix() -> None:
+    def fail_on_three(item: int, previous: typing.Any) -> int:
+        if item == 3:
+            raise ValueError('bad item')
+        return item
+
+    outputs: list[int] = []
+
+    def record(item: int, previous: typing.Any) -> int:
+        outputs.append(previous)
+        return previous
+
+    with pytest.raises(ValueError):
+        absorb.ops.run_pipeline(
+            list(range(10)),
+            [('a', fail_on_three, 3), ('b', record, 1)],
+            ordered=True,
+        )
+    assert outputs == [0, 1, 2]
+
+
+class AsyncCounts(Counts):
+    async def collect_chunk_async(
+        self, chunk: absorb.Chunk
+    ) -> absorb.ChunkResult | None:
+        import asyncio
+
+        await asyncio.sleep(0.01)
+        return self.collect_chunk(chunk)
+
+
+@pytest.mark.parametrize('table_class', [Counts, AsyncCounts])
+def test_acollect(absorb_root: str, table_class: type[Counts]) -> None:
+    import asyncio
+
+    table = table_class()
+    assert table.has_async_collect_chunk() == (table_class is AsyncCounts)
+    asyncio.run(table.acollect(verbose=0, concurrency=8))
+
+    df = table.load().sort('timestamp')
+    assert df['value'].to_list() == list(range(1, 21))
+
+
+@pytest.mark.parametrize('workers', [0, -1])
+def test_collect_rejects_invalid_workers(
+    absorb_root: str, workers: int
+) -> None:
+    with pytest.raises(Exception, match='workers must be at least 1'):
+        Counts().collect(verbose=0, workers=workers)
+
+
+class FailingAsyncCounts(AsyncCounts):
+    async def collect_chunk_async(
+        self, chunk: absorb.Chunk
+    ) -> absorb.ChunkResult | None:
+        import asyncio
+
+        timestamp = typing.cast(datetime.datetime, chunk)
+        await asyncio.sleep(0.05 * timestamp.day)
+        if timestamp.day == 3:
+            raise ValueError('bad chunk')
+        return self.collect_chunk(chunk)
+
+
+def test_acollect_failure_cancels_pending(absorb_root: str) -> None:
+    import asyncio
+
+    table = FailingAsyncCounts()
+    with pytest.raises(ValueError, match='bad chunk'):
+        asyncio.run(table.acollect(verbose=0, concurrency=4))
+
+    # chunks still pending when the failure happened are never written
+    df = table.load().sort('timestamp')
+    assert df['value'].to_list() == [1, 2]
+
+
+@pytest.mark.parametrize('concurrency', [0, -1])
+def test_acollect_rejects_invalid_concurrency(
+    absorb_root: str, concurrency: int
+) -> None:
+    import asyncio
+
+    with pytest.raises(Exception, match='concurrency must be at least 1'):
+        asyncio.run(Counts().acollect(verbose=0, concurrency=concurrency))
+
+
+class PayloadCounts(Counts):
+    def fetch_chunk_payload(self, chunk: absorb.Chunk) -> bytes | None:
+        timestamp = typing.cast(datetime.datetime, chunk)
+        return ('value\n' + str(timestamp.day) + '\n').encode()
+
+    def parse_chunk_payload(
+        self, chunk: absorb.Chunk, payload: bytes
+    ) -> absorb.ChunkResult | None:
+        timestamp = typing.cast(datetime.datetime, chunk)
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        return pl.read_csv(payload).select(
+            pl.lit(timestamp).cast(pl.Datetime('us', 'UTC')).alias('timestamp'),
+            pl.col.value.cast(pl.Int64),
+        )
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_collect_chunk_payloads(absorb_root: str, executor: str) -> None:
+    table = PayloadCounts()
+    assert table.has_chunk_payloads()
+    table.collect(
+        verbose=0,
+        workers=2,
+        executor=executor,  # type: ignore
+        processes=2,
+    )
+
+    df = table.load().sort('timestamp')
+    assert df['value'].to_list() == list(range(1, 21))
+
+
+def test_process_executor_single_chunk(absorb_root: str) -> None:
+    table = PayloadCounts()
+    data_range = (datetime.datetime(2025, 1, 5), datetime.datetime(2025, 1, 5))
+    table.collect(data_range=data_range, verbose=0, executor='process')
+
+    assert table.load()['value'].to_list() == [5]
+
+
+def test_process_executor_requires_payloads(absorb_root: str) -> None:
+    with pytest.raises(Exception):
+        Counts().collect(verbose=0, executor='process')
+
+
+class SlowCounts(Counts):
+    source = 'slow_source'
+    running = 0
+    max_running = 0
+
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        import time
+
+        # counters are shared by every table of slow_source
+        SlowCounts.running += 1
+        SlowCounts.max_running = max(SlowCounts.max_running, SlowCounts.running)
+        time.sleep(0.002)
+        SlowCounts.running -= 1
+        return super().collect_chunk(chunk)
+
+
+class SlowCountsA(SlowCounts):
+    pass
+
+
+class SlowCountsB(SlowCounts):
+    pass
+
+
+def test_collect_tables_source_limits(absorb_root: str) -> None:
+    tables = [SlowCountsA(), SlowCountsB(), Counts(), FailingCounts()]
+    statuses = absorb.ops.collect_tables(
+        tables, max_workers=4, source_limits={'slow_source': 1}, verbose=0
+    )
+
+    assert [status['status'] for status in statuses] == [
+        'done',
+        'done',
+        'done',
+        'failed',
+    ]
+    assert statuses[3]['error'] == 'bad chunk'
+    assert len(Counts().load()) == 20
+
+    # the two slow_source tables never ran at the same time
+    assert SlowCounts.max_running == 1
+    assert SlowCountsA().load()['value'].to_list() == list(range(1, 21))
+
+
+class FlakyCounts(Counts):
+    retry_policy: absorb.RetryPolicy = {
+        'max_attempts': 3,
+        'initial_backoff': 0.001,
+        'max_backoff': 0.01,
+        'jitter': 0.5,
+        'retryable_status_codes': [503],
+        'chunk_deadline': None,
+    }
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.fetched: list[int] = []
+
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        import requests
+
+        timestamp = typing.cast(datetime.datetime, chunk)
+        self.fetched.append(timestamp.day)
+        if timestamp.day == 5 and self.fetched.count(5) == 1:
+            raise requests.ConnectionError('connection reset')
+        return super().collect_chunk(chunk)
+
+
+def test_collect_requeues_retryable_chunks(absorb_root: str) -> None:
+    table = FlakyCounts()
+    table.setup_table_dir()
+    chunks = table._get_chunks_to_collect()
+    summaries, stage_stats = table._execute_collect_pipeline(
+        chunks, overwrite=False, verbose=0, workers=1
+    )
+
+    # failed chunk is retried after every other chunk
+    assert table.fetched == list(range(1, 21)) + [5]
+    assert [summary['n_retries'] for summary in summaries] == [0] * 4 + [1] + [
+        0
+    ] * 15
+    df = table.load().sort('timestamp')
+    assert df['value'].to_list() == list(range(1, 21))
+
+
+def test_acollect_retries_chunks(absorb_root: str) -> None:
+    import asyncio
+
+    table = FlakyCounts()
+    asyncio.run(table.acollect(verbose=0, concurrency=4))
+    assert table.fetched.count(5) == 2
+    assert len(table.load()) == 20
+
+
+def test_retry_policy_gives_up(absorb_root: str) -> None:
+    import requests
+
+    table = FlakyCounts()
+    calls = []
+
+    def always_unavailable() -> None:
+        response = requests.Response()
+        response.status_code = 503
+        calls.append(1)
+        raise requests.HTTPError('unavailable', response=response)
+
+    with pytest.raises(requests.HTTPError):
+        table.call_with_retry(always_unavailable)
+    assert len(calls) == 3
+
+    # status codes outside the policy are not retried
+    calls.clear()
+    table.retry_policy = {**table.retry_policy, 'retryable_status_codes': []}
+    with pytest.raises(requests.HTTPError):
+        table.call_with_retry(always_unavailable)
+    assert len(calls) == 1
+
+
+class InterruptedCounts(Counts):
+    interrupt = True
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.fetched: list[int] = []
+
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        timestamp = typing.cast(datetime.datetime, chunk)
+        if self.interrupt and timestamp.day == 8:
+            raise KeyboardInterrupt()
+        self.fetched.append(timestamp.day)
+        return super().collect_chunk(chunk)
+
+
+def test_collect_resumes_from_journal(absorb_root: str) -> None:
+    import os
+
+    table = InterruptedCounts()
+    with pytest.raises(KeyboardInterrupt):
+        table.collect(verbose=0)
+    pending = absorb.ops.get_pending_journal_chunks(table.get_journal_path())
+    assert pending[0] == '2025-01-08' and len(pending) == 13
+
+    # leftover tmp file of an interrupted write is removed on startup
+    tmp_path = os.path.join(table.get_table_dir(), 'partial.parquet_tmp')
+    with open(tmp_path, 'w') as f:
+        f.write('partial')
+
+    resumed = InterruptedCounts()
+    resumed.interrupt = False
+    resumed.collect(verbose=0)
+    assert resumed.fetched == list(range(8, 21))
+    assert not os.path.exists(tmp_path)
+    assert absorb.ops.get_pending_journal_chunks(table.get_journal_path()) == []
+    assert resumed.load()['value'].sort().to_list() == list(range(1, 21))
+
+
+def test_manifest_tracks_collected_chunks(
+    absorb_root: str, monkeypatch: typing.Any
+) -> None:
+    import glob
+    import os
+
+    table = Counts()
+    table.collect(verbose=0)
+    manifest = table.get_manifest()
+    assert len(manifest) == 20
+    first = manifest['test_source__counts__2025-01-01.parquet']
+    assert first['chunk'] == '2025-01-01'
+    assert first['n_rows'] == 1
+    assert first['index_min'] == '2025-01-01T00:00:00+00:00'
+
+    # coverage is answered from the manifest, without listing data files
+    def fail_glob(*args: typing.Any, **kwargs: typing.Any) -> None:
+        raise AssertionError('glob should not be used')
+
+    with monkeypatch.context() as m:
+        m.setattr(glob, 'glob', fail_glob)
+        assert table.is_collected()
+        assert table.get_collected_range() == [
+            (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 20))
+        ]
+        assert table.get_last_update_time() == datetime.datetime(
+            2025, 1, 20, tzinfo=datetime.timezone.utc
+        )
+
+    # manifest is rebuilt from data files when missing
+    os.remove(table.get_manifest_path())
+    assert table.get_manifest() == manifest
+
+    absorb.ops.delete_table_data(table, confirm=True)
+    assert not table.is_collected()
+
+
+def test_collect_backfills_gaps(
+    absorb_root: str, monkeypatch: typing.Any
+) -> None:
+    import os
+
+    table = Counts()
+    table.collect(verbose=0)
+
+    # remove two separate chunks from the middle of the table
+    removed = [
+        table.get_chunk_path(datetime.datetime(2025, 1, day)) for day in [5, 11]
+    ]
+    for path in removed:
+        os.remove(path)
+    absorb.ops.update_manifest(table.get_manifest_path(), remove=removed)
+
+    assert table.get_collected_range() == [
+        (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 4)),
+        (datetime.datetime(2025, 1, 6), datetime.datetime(2025, 1, 10)),
+        (datetime.datetime(2025, 1, 12), datetime.datetime(2025, 1, 20)),
+    ]
+    assert table.get_missing_ranges() == [
+        (datetime.datetime(2025, 1, 5), datetime.datetime(2025, 1, 5)),
+        (datetime.datetime(2025, 1, 11), datetime.datetime(2025, 1, 11)),
+    ]
+
+    # ranges are served from the coverage cache while the manifest is unchanged
+    def fail_read(*args: typing.Any, **kwargs: typing.Any) -> None:
+        raise AssertionError('manifest should not be read')
+
+    with monkeypatch.context() as m:
+        m.setattr(absorb.ops, 'read_manifest', fail_read)
+        assert len(table.get_missing_ranges()) == 2
+
+    assert table._get_chunks_to_collect() == [
+        datetime.datetime(2025, 1, 5, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2025, 1, 11, tzinfo=datetime.timezone.utc),
+    ]
+    table.collect(verbose=0)
+    assert table.get_missing_ranges() == []
+    assert table.load()['value'].sort().to_list() == list(range(1, 21))
+
+
+class BlockCounts(absorb.Table):
+    source = 'test_source'
+    description = 'one row per block'
+    url = 'https://example.com'
+    write_range = 'append_only'
+    chunk_size = {'type': 'number_range', 'number_interval': 10}
+    index_column = 'block_number'
+
+    def get_schema(self) -> dict[str, pl.DataType | type[pl.DataType]]:
+        return {'block_number': pl.Int64}
+
+    def get_available_range(self) -> absorb.Coverage:
+        return (0, 49)
+
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        start, end = typing.cast(tuple[int, int], chunk)
+        return pl.DataFrame(
+            {'block_number': list(range(start, end + 1))},
+            schema=self.get_schema(),
+        )
+
+
+def test_collect_number_range_chunks(absorb_root: str) -> None:
+    import os
+
+    table = BlockCounts()
+    assert table.get_index_type() == 'numerical'
+    table.collect(verbose=0)
+    assert table.get_collected_range() == [(0, 49)]
+    assert table.get_missing_ranges() == []
+    assert os.path.basename(table.get_chunk_path((10, 19))) == (
+        'test_source__block_counts__0000000010_to_0000000019.parquet'
+    )
+
+    removed = table.get_chunk_path((20, 29))
+    os.remove(removed)
+    absorb.ops.update_manifest(table.get_manifest_path(), remove=[removed])
+    assert table.get_missing_ranges() == [(20, 29)]
+    assert table._get_chunks_to_collect() == [(20, 29)]
+
+    table.collect(verbose=0)
+    assert table.load()['block_number'].sort().to_list() == list(range(50))
+
+
+class CountedAvailability(Counts):
+    n_requests = 0
+
+    def get_available_range(self) -> absorb.Coverage:
+        CountedAvailability.n_requests += 1
+        return super().get_available_range()
+
+
+def test_available_range_cache(
+    absorb_root: str, monkeypatch: typing.Any
+) -> None:
+    import time
+
+    CountedAvailability.n_requests = 0
+    CountedAvailability().collect(verbose=0)
+    assert CountedAvailability.n_requests == 1
+
+    # cached result is shared across instances until update latency passes
+    table = CountedAvailability()
+    assert table.get_missing_ranges() == []
+    assert absorb.ops.get_available_range(table) == (
+        datetime.datetime(2025, 1, 1),
+        datetime.datetime(2025, 1, 20),
+    )
+    assert CountedAvailability.n_requests == 1
+
+    now = time.time()
+    with monkeypatch.context() as m:
+        m.setattr(time, 'time', lambda: now + 86400 + 1)
+        table.get_cached_available_range()
+    assert CountedAvailability.n_requests == 2
+
+    # explicit refresh and cleared caches fetch again
+    table.get_cached_available_range(refresh=True)
+    assert CountedAvailability.n_requests == 3
+    absorb.ops.clear_cached_available_ranges([table])
+    table.get_cached_available_range()
+    assert CountedAvailability.n_requests == 4
+
+
+class UncompressedCounts(Counts):
+    parquet_options = {'compression': 'uncompressed'}
+
+    def get_available_range(self) -> absorb.Coverage:
+        return (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 3))
+
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        timestamp = typing.cast(datetime.datetime, chunk)
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        return pl.DataFrame(
+            {
+                'timestamp': [timestamp] * 10_000,
+                'value': [i % 7 for i in range(10_000)],
+            },
+            schema=self.get_schema(),
+        )
+
+
+def test_recompress_table(absorb_root: str) -> None:
+    import os
+
+    table = UncompressedCounts()
+    assert table.get_parquet_options()['compression'] == 'uncompressed'
+    assert table.get_parquet_options()['statistics'] is True
+    table.collect(verbose=0)
+    sizes = {
+        filename: entry['n_bytes']
+        for filename, entry in table.get_manifest().items()
+    }
+    df = table.load().sort('timestamp')
+
+    # dry run reports savings without touching files
+    result = absorb.ops.recompress_table(
+        table, {'compression': 'zstd'}, dry=True
+    )
+    assert result['n_files'] == 3
+    assert result['bytes_before'] == sum(sizes.values())
+    assert result['bytes_after'] < result['bytes_before']
+    for filename, size in sizes.items():
+        path = os.path.join(table.get_table_dir(), filename)
+        assert os.path.getsize(path) == size
+
+    # rewrite files and manifest
+    result = absorb.ops.recompress_table(table, {'compression': 'zstd'})
+    assert result['n_files'] == 3
+    manifest = table.get_manifest()
+    assert (
+        sum(entry['n_bytes'] for entry in manifest.values())
+        == (result['bytes_after'])
+    )
+    assert (
+        manifest['test_source__uncompressed_counts__2025-01-01.parquet'][
+            'chunk'
+        ]
+        == '2025-01-01'
+    )
+    assert table.load().sort('timestamp').equals(df)
+    assert table.get_collected_range() == [
+        (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 3))
+    ]
+
+
+class ShuffledCounts(Counts):
+    def collect_chunk(self, chunk: absorb.Chunk) -> absorb.ChunkResult | None:
+        timestamp = typing.cast(datetime.datetime, chunk)
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        timestamps = [
+            timestamp + datetime.timedelta(hours=hour) for hour in [5, 1, 3]
+        ]
+        return pl.DataFrame(
+            {'timestamp': timestamps, 'value': [5, 1, 3]},
+            schema=self.get_schema(),
+        )
+
+
+def test_collect_sorts_chunks_by_index(absorb_root: str) -> None:
+    table = ShuffledCounts()
+    table.collect(verbose=0)
+
+    manifest = table.get_manifest()
+    assert all(entry['sorted'] for entry in manifest.values())
+    assert table.get_sorted_column() == 'timestamp'
+
+    df = table.load()
+    assert df['value'].to_list()[:6] == [1, 3, 5, 1, 3, 5]
+    assert df['timestamp'].flags['SORTED_ASC']
+
+    # files whose index ranges overlap are not sorted as a whole
+    entry = manifest['test_source__shuffled_counts__2025-01-02.parquet']
+    entry['index_min'] = '2024-12-31T00:00:00+00:00'
+    absorb.ops.update_manifest(table.get_manifest_path(), add=[entry])
+    assert table.get_sorted_column() is None
+    assert not table.load()['timestamp'].flags['SORTED_ASC']
+
+
+class CompactedCounts(Counts):
+    end = datetime.datetime(2025, 3, 10)
+
+    def get_available_range(self) -> absorb.Coverage:
+        return (datetime.datetime(2025, 1, 1), self.end)
+
+
+def test_compact_table(absorb_root: str) -> None:
+    import os
+
+    table = CompactedCounts()
+    table.collect(
+        [
+            (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 9)),
+            (datetime.datetime(2025, 2, 11), datetime.datetime(2025, 3, 10)),
+        ],
+        verbose=0,
+    )
+    df = table.load().sort('timestamp')
+
+    # february has a gap and march is still open, so only january compacts
+    result = absorb.ops.compact_table(table, 'month')
+    assert [os.path.basename(path) for path in result['compacted_paths']] == [
+        'test_source__compacted_counts__2025-01-01_to_2025-01-31.parquet'
+    ]
+    assert result['n_files_before'] == 68
+    assert result['n_files_after'] == 38
+    assert table.has_compacted_files()
+    assert table.load().sort('timestamp').equals(df)
+    assert table.get_sorted_column() == 'timestamp'
+    assert table.get_collected_range() == [
+        (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 9)),
+        (datetime.datetime(2025, 2, 11), datetime.datetime(2025, 3, 10)),
+    ]
+
+    # incremental collection fills the gap and extends the mixed layout
+    CompactedCounts.end = datetime.datetime(2025, 4, 2)
+    try:
+        table.collect(verbose=0)
+        assert table.get_missing_ranges() == []
+        result = absorb.ops.compact_table(table, 'month')
+        assert len(result['compacted_paths']) == 2
+        assert result['n_files_after'] == 5
+        assert table.get_collected_range() == [
+            (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 4, 2))
+        ]
+        assert len(table.load()) == 92
+        with pytest.raises(Exception, match='compacted'):
+            table.collect(overwrite=True, verbose=0)
+    finally:
+        CompactedCounts.end = datetime.datetime(2025, 3, 10)
+
+
+class HiveCounts(CompactedCounts):
+    file_layout = 'hive'
+
+
+def test_hive_file_layout(absorb_root: str) -> None:
+    import os
+
+    table = HiveCounts()
+    table.collect(verbose=0)
+    table_dir = table.get_table_dir()
+    path = table.get_chunk_path(datetime.datetime(2025, 2, 3))
+    assert os.path.relpath(path, table_dir) == os.path.join(
+        'year=2025',
+        'month=02',
+        'test_source__hive_counts__2025-02-03.parquet',
+    )
+    assert os.path.isfile(path)
+    assert os.path.join('year=2025', 'month=02') in {
+        os.path.dirname(key) for key in table.get_manifest()
+    }
+    assert table.get_collected_range() == [
+        (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 3, 10))
+    ]
+
+    # partition columns are exposed by scans and prune directories
+    df = table.scan().filter(pl.col.month == 2).collect()
+    assert df.columns == ['timestamp', 'value', 'year', 'month']
+    assert len(df) == 28
+    assert table.get_sorted_column() == 'timestamp'
+
+    # compacted files stay in the partition of their first chunk
+    result = absorb.ops.compact_table(table, 'month')
+    assert len(result['compacted_paths']) == 2
+    assert len(table.load()) == 69
+    with pytest.raises(Exception, match='hive'):
+        absorb.ops.compact_table(table, 'year')
+
+    # manifest can be rebuilt from nested data files
+    manifest = table.get_manifest()
+    os.remove(table.get_manifest_path())
+    os.remove(table.get_coverage_path())
+    assert table.get_manifest() == manifest
+    assert table.get_collected_range() == [
+        (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 3, 10))
+    ]
+
+
+def test_scan_range(absorb_root: str, monkeypatch: typing.Any) -> None:
+    import os
+
+    table = Counts()
+    table.collect(verbose=0)
+    start = datetime.datetime(2025, 1, 5, 12)
+    end = datetime.datetime(2025, 1, 8)
+
+    # only files overlapping the range are scanned
+    paths = table.get_range_paths(start=start, end=end)
+    assert [os.path.basename(path)[-13:-8] for path in paths] == [
+        '01-05',
+        '01-06',
+        '01-07',
+    ]
+    df = table.scan(start=start, end=end).collect()
+    assert df['value'].to_list() == [6, 7]
+    assert absorb.query(table, start=start).height == 15
+    assert absorb.ops.load(table, end=end).height == 7
+    utc_end = end.replace(tzinfo=datetime.timezone.utc)
+    assert absorb.ops.load(table, end=utc_end).height == 7
+
+    # empty ranges keep the schema
+    df = table.scan(start=datetime.datetime(2026, 1, 1)).collect()
+    assert df.height == 0
+    assert df.columns == ['timestamp', 'value']
+
+    # manifest bounds are used when filenames have no chunks, these are the
+    # bounds of the rows, so the file of 01-05 can be skipped
+    with monkeypatch.context() as m:
+        m.setattr(Counts, 'chunk_size', None)
+        assert table.get_range_paths(start=start, end=end) == paths[1:]
+
+
+def test_scan_range_number_chunks(absorb_root: str) -> None:
+    table = BlockCounts()
+    table.collect(verbose=0)
+    assert len(table.get_range_paths(start=15, end=20)) == 1
+    df = table.scan(start=15, end=25).collect()
+    assert df['block_number'].to_list() == list(range(15, 25))
+
+
+def test_scan_range_hive(absorb_root: str) -> None:
+    table = HiveCounts()
+    table.collect(verbose=0)
+    start = datetime.datetime(2025, 2, 27)
+    end = datetime.datetime(2025, 3, 2)
+    assert len(table.get_range_paths(start=start, end=end)) == 3
+    assert table.scan(start=start, end=end).collect().height == 3
+
+    # hive predicates prune directories of glob scans
+    lf = table.filter_range(table.scan(), start=start, end=end)
+    assert 'month' in lf.explain()
+    assert lf.collect()['value'].to_list() == [27, 28, 1]
+
+
+def test_load_columns_and_filter(absorb_root: str) -> None:
+    table = Counts()
+    table.collect(verbose=0)
+
+    df = table.load(columns=['value'], filter=pl.col.value > 15)
+    assert df.columns == ['value']
+    assert df['value'].to_list() == [16, 17, 18, 19, 20]
+
+    # filter can use unselected columns, and combines with range pruning
+    df = absorb.ops.load(
+        table,
+        start=datetime.datetime(2025, 1, 10),
+        columns=['timestamp'],
+        filter=[pl.col.value % 2 == 0, pl.col.value < 15],
+    )
+    assert df['timestamp'].dt.day().to_list() == [10, 12, 14]
+
+    # both are pushed into the parquet scan
+    lf = absorb.query(
+        table, columns=['value'], filter=pl.col.value > 15, lazy=True
+    )
+    plan = lf.explain()
+    assert 'PROJECT 1/2 COLUMNS' in plan
+    assert 'SELECTION' in plan
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import os
+import time
+import typing
+
+import absorb
+
+
+def test_rate_limit_burst_then_steady(
+    tmp_path: typing.Any, monkeypatch: typing.Any
+) -> None:
+    monkeypatch.setenv('ABSORB_ROOT', str(tmp_path))
+    rate_limit: absorb.RateLimit = {'requests_per_second': 20, 'burst': 2}
+
+    start = time.time()
+    for i in range(2):
+        absorb.ops.wait_for_rate_limit('test', rate_limit)
+    assert time.time() - start < 0.04
+
+    for i in range(4):
+        absorb.ops.wait_for_rate_limit('test', rate_limit)
+    assert time.time() - start >= 0.19
+
+
+def test_rate_limit_tiers_use_separate_buckets(
+    tmp_path: typing.Any, monkeypatch: typing.Any
+) -> None:
+    monkeypatch.setenv('ABSORB_ROOT', str(tmp_path))
+    rate_limit: absorb.RateLimit = {
+        'requests_per_second': 0.01,
+        'burst': 1,
+        'tiers': {'fast': {'requests_per_second': 1000, 'burst': 1}},
+    }
+
+    absorb.ops.wait_for_rate_limit('test', rate_limit)
+    start = time.time()
+    for i in range(5):
+        absorb.ops.wait_for_rate_limit('test', rate_limit, tier='fast')
+    assert time.time() - start < 0.5
+    assert os.path.exists(
+        os.path.join(str(tmp_path), 'rate_limits', 'test__fast.json')
+    )
+
+
+def _serve(statuses: list[int]) -> typing.Any:
+    import http.server
+    import threading
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            status = statuses.pop(0) if len(statuses) > 0 else 200
+            self.send_response(status)
+            if status == 429:
+                self.send_header('Retry-After', '0.3')
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_concurrency_window_grows_and_backs_off() -> None:
+    server = _serve([200] * 20 + [429])
+    url = 'http://127.0.0.1:' + str(server.server_address[1]) + '/'
+    host = url.split('/')[2]
+    try:
+        initial = None
+        for i in range(20):
+            absorb.ops.http_get(url)
+            if initial is None:
+                initial = absorb.ops.get_concurrency_windows()[host]
+        grown = absorb.ops.get_concurrency_windows()[host]
+        assert initial is not None and grown > initial
+
+        # 429 halves the window and pauses requests for Retry-After
+        assert absorb.ops.http_get(url).status_code == 429
+        assert absorb.ops.get_concurrency_windows()[host] == grown / 2
+        start = time.time()
+        assert absorb.ops.http_get(url).status_code == 200
+        assert time.time() - start >= 0.25
+    finally:
+        server.shutdown()
+
+
+def test_find_last_existing_url_uses_logarithmic_probes() -> None:
+    for last in [-1, 0, 1, 500, 9998, 9999]:
+        for seed in [None, 0, 480, 9999]:
+            for workers in [1, 4]:
+                probed: list[int] = []
+
+                def exists(url: str) -> bool:
+                    probed.append(int(url))
+                    return int(url) <= last
+
+                found = absorb.ops.find_last_existing_url(
+                    str,
+                    lower=0,
+                    upper=9999,
+                    seed=seed,
+                    workers=workers,
+                    exists=exists,
+                )
+                assert found == (last if last >= 0 else None)
+                assert len(probed) <= 4 * 14 * 2
+
+
+def test_find_last_existing_url_near_seed_is_cheap() -> None:
+    probed: list[int] = []
+
+    def exists(url: str) -> bool:
+        probed.append(int(url))
+        return int(url) <= 1003
+
+    found = absorb.ops.find_last_existing_url(
+        str, lower=0, upper=100_000, seed=1000, exists=exists
+    )
+    assert found == 1003
+    assert len(probed) <= 6
+
+
+def _serve_files(files: dict[str, bytes]) -> typing.Any:
+    import http.server
+    import threading
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body = files.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_download_file_streams_to_path(tmp_path: typing.Any) -> None:
+    import pytest
+    import requests
+
+    body = os.urandom(3 * 2**20 + 17)
+    server = _serve_files({'/data.bin': body})
+    url = 'http://127.0.0.1:' + str(server.server_address[1])
+    try:
+        path = os.path.join(str(tmp_path), 'nested', 'data.bin')
+        absorb.ops.download_file(url=url + '/data.bin', path=path)
+        with open(path, 'rb') as f:
+            assert f.read() == body
+        assert absorb.ops.download_bytes(url + '/data.bin') == body
+
+        missing = os.path.join(str(tmp_path), 'missing.bin')
+        with pytest.raises(requests.HTTPError):
+            absorb.ops.download_file(url=url + '/missing.bin', path=missing)
+        assert os.listdir(str(tmp_path)) == ['nested']
+    finally:
+        server.shutdown()
+
+
+def test_download_chunk_file_skips_decoding(
+    tmp_path: typing.Any, monkeypatch: typing.Any
+) -> None:
+    import datetime
+    import io
+    import json
+
+    import polars as pl
+
+    schema = {'timestamp': pl.Datetime('us', 'UTC'), 'value': pl.Int64}
+    files = {}
+    for day in range(1, 4):
+        timestamp = datetime.datetime(
+            2025, 1, day, tzinfo=datetime.timezone.utc
+        )
+        buffer = io.BytesIO()
+        pl.DataFrame(
+            {'timestamp': [timestamp], 'value': [day]}, schema=schema
+        ).write_parquet(buffer, compression='snappy')
+        files['/' + str(day) + '.parquet'] = buffer.getvalue()
+    buffer = io.BytesIO()
+    pl.DataFrame({'value': [1], 'extra': ['x']}).write_parquet(buffer)
+    files['/other.parquet'] = buffer.getvalue()
+    server = _serve_files(files)
+    url = 'http://127.0.0.1:' + str(server.server_address[1])
+
+    class DownloadedCounts(absorb.Table):
+        source = 'test_source'
+        description = 'one downloaded file per day'
+        url = 'https://example.com'
+        write_range = 'append_only'
+        chunk_size = 'day'
+
+        def get_schema(self) -> dict[str, pl.DataType | type[pl.DataType]]:
+            return schema  # type: ignore
+
+        def get_available_range(self) -> absorb.Coverage:
+            return (
+                datetime.datetime(2025, 1, 1),
+                datetime.datetime(2025, 1, 3),
+            )
+
+        def collect_chunk(
+            self, chunk: absorb.Chunk
+        ) -> absorb.ChunkResult | None:
+            day = typing.cast(datetime.datetime, chunk).day
+            return self.download_chunk_file(chunk, url + f'/{day}.parquet')
+
+    with monkeypatch.context() as m:
+        m.setenv('ABSORB_ROOT', str(tmp_path))
+        config = absorb.ops.get_default_config()
+        config['use_git'] = False
+        with open(absorb.ops.get_config_path(), 'w') as f:
+            json.dump(config, f)
+        try:
+            # files with the table schema are moved into place byte for byte
+            table = DownloadedCounts()
+            table.collect(verbose=0)
+            for day in range(1, 4):
+                path = table.get_chunk_path(datetime.datetime(2025, 1, day))
+                with open(path, 'rb') as f:
+                    assert f.read() == files['/' + str(day) + '.parquet']
+            assert table.get_collected_range() == [
+                (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 3))
+            ]
+            assert table.get_sorted_column() == 'timestamp'
+            assert table.load()['value'].to_list() == [1, 2, 3]
+            assert not any(
+                name.endswith('_tmp')
+                for name in os.listdir(table.get_table_dir())
+            )
+
+            # files with other schemas are decoded into a DataFrame
+            data = table.download_chunk_file(
+                datetime.datetime(2025, 1, 4), url + '/other.parquet'
+            )
+            assert isinstance(data, pl.DataFrame)
+            assert data['value'].to_list() == [1]
+            assert not any(
+                name.endswith('_tmp')
+                for name in os.listdir(table.get_table_dir())
+            )
+        finally:
+            server.shutdown()
+
+
+_csv_memory_script = """
+import gzip, io, sys
+import polars as pl
+import absorb
+
+
+def read_status(key):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(key + ':'):
+                return int(line.split()[1])
+
+
+payload = open(sys.argv[1], 'rb').read()
+pl.read_csv(b'a\\n1\\n')
+
+# reset peak RSS to current RSS
+with open('/proc/self/clear_refs', 'w') as f:
+    f.write('5')
+base = read_status('VmRSS')
+if sys.argv[2] == 'str_buffer':
+    csv = io.StringIO(gzip.decompress(payload).decode('utf-8'))
+    df = pl.read_csv(csv)
+elif sys.argv[2] == 'bytes':
+    df = absorb.ops.read_csv_gz_bytes(payload)
+elif sys.argv[2] == 'batches':
+    for batch in absorb.ops.iter_csv_archive_batches(payload):
+        pass
+print(read_status('VmHWM') - base)
+"""
+
+
+def test_csv_archive_peak_memory(tmp_path: typing.Any) -> None:
+    """compare peak RSS of reading a csv.gz through a str copy vs bytes"""
+    import gzip
+    import subprocess
+    import sys
+
+    import polars as pl
+    import pytest
+
+    if not os.path.exists('/proc/self/clear_refs'):
+        pytest.skip('measuring peak RSS requires linux /proc')
+
+    n = 1_000_000
+    df = pl.DataFrame(
+        {'id': range(n), 'price': [i * 0.5 for i in range(n)], 'side': 'buy'}
+    )
+    path = os.path.join(str(tmp_path), 'trades.csv.gz')
+    with open(path, 'wb') as f:
+        f.write(gzip.compress(df.write_csv().encode(), 1))
+    with open(path, 'rb') as f:
+        payload = f.read()
+    assert absorb.ops.read_csv_gz_bytes(payload).equals(df)
+    assert pl.concat(absorb.ops.iter_csv_archive_batches(payload)).equals(df)
+
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(absorb.__file__))
+    env['PYTHONPATH'] = os.pathsep.join([root, env.get('PYTHONPATH', '')])
+    peaks = {}
+    for mode in ['str_buffer', 'bytes', 'batches']:
+        output = subprocess.check_output(
+            [sys.executable, '-c', _csv_memory_script, path, mode], env=env
+        )
+        peaks[mode] = int(output)
+    assert peaks['bytes'] < peaks['str_buffer'] / 2
+    assert peaks['batches'] < peaks['str_buffer'] / 2
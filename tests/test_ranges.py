@@ -293,3 +293,276 @@ def test_semiopen_date_range_diffs(test: RangeDiffTest) -> None:
     if isinstance(actual_output, tuple):
         actual_output = [actual_output]
     assert target_output == actual_output
+
+
+def _day(day: int) -> datetime.datetime:
+    return datetime.datetime(2020, 1, 1) + datetime.timedelta(days=day)
+
+
+def test_closed_range_diff_multiple_intervals() -> None:
+    from_this = [(_day(20), _day(29)), (_day(0), _day(9))]
+    subtract_this = [
+        (_day(25), _day(40)),
+        (_day(2), _day(3)),
+        (_day(5), _day(6)),
+    ]
+    assert absorb.ops.get_range_diff(
+        subtract_this=subtract_this,
+        from_this=from_this,
+        boundary_type='closed',
+        chunk_size='day',
+    ) == [
+        (_day(0), _day(1)),
+        (_day(4), _day(4)),
+        (_day(7), _day(9)),
+        (_day(20), _day(24)),
+    ]
+
+
+def test_range_union() -> None:
+    ranges = [(_day(5), _day(6)), (_day(0), _day(2)), (_day(3), _day(3))]
+    assert absorb.ops.get_range_union(
+        ranges, [(_day(10), _day(12))], boundary_type='closed', chunk_size='day'
+    ) == [(_day(0), _day(3)), (_day(5), _day(6)), (_day(10), _day(12))]
+    semiopen_ranges = [
+        (_day(5), _day(6)),
+        (_day(0), _day(2)),
+        (_day(2), _day(3)),
+    ]
+    assert absorb.ops.get_range_union(
+        semiopen_ranges, boundary_type='semiopen'
+    ) == [(_day(0), _day(3)), (_day(5), _day(6))]
+
+
+def test_range_intersection() -> None:
+    ranges = [(_day(0), _day(4)), (_day(8), _day(12))]
+    other = [(_day(4), _day(9)), (_day(12), _day(20))]
+    assert absorb.ops.get_range_intersection(
+        ranges, other, boundary_type='closed', chunk_size='day'
+    ) == [(_day(4), _day(4)), (_day(8), _day(9)), (_day(12), _day(12))]
+    assert absorb.ops.get_range_intersection(
+        ranges, other, boundary_type='semiopen'
+    ) == [(_day(8), _day(9))]
+
+
+@pytest.mark.parametrize('n', [10**3, 10**4, 10**5])
+def test_range_diff_benchmark(n: int) -> None:
+    import random
+    import time
+
+    # every other day collected, in shuffled order
+    collected = [(_day(2 * i), _day(2 * i)) for i in range(n)]
+    random.Random(0).shuffle(collected)
+    available = (_day(0), _day(2 * n - 1))
+
+    t_start = time.perf_counter()
+    missing = absorb.ops.get_range_diff(
+        subtract_this=collected,
+        from_this=available,
+        boundary_type='closed',
+        chunk_size='day',
+    )
+    union = absorb.ops.get_range_union(
+        collected, missing, boundary_type='closed', chunk_size='day'
+    )
+    intersection = absorb.ops.get_range_intersection(
+        collected, missing, boundary_type='closed', chunk_size='day'
+    )
+    elapsed = time.perf_counter() - t_start
+
+    assert len(missing) == n
+    assert missing[0] == (_day(1), _day(1))
+    assert union == [available]
+    assert intersection == []
+    assert elapsed < 5
+
+
+def test_partition_into_chunks_is_lazy() -> None:
+    import time
+
+    utc = datetime.timezone.utc
+    t_start = time.perf_counter()
+    chunks = absorb.ops.partition_into_chunks(
+        (datetime.datetime(1900, 1, 1), datetime.datetime(2100, 1, 1, 5)),
+        'hour',
+    )
+    assert len(chunks) == 200 * 365 * 24 + 49 * 24 + 6
+    assert chunks[0] == datetime.datetime(1900, 1, 1, tzinfo=utc)
+    assert chunks[-1] == datetime.datetime(2100, 1, 1, 5, tzinfo=utc)
+    assert datetime.datetime(2025, 6, 1, 13, tzinfo=utc) in chunks
+    assert datetime.datetime(2025, 6, 1, 13, 30) not in chunks
+    assert time.perf_counter() - t_start < 0.1
+
+    sliced = chunks[24:48]
+    assert len(sliced) == 24
+    assert list(sliced)[0] == datetime.datetime(1900, 1, 2, tzinfo=utc)
+
+
+@pytest.mark.parametrize(
+    'chunk_size,expected',
+    [
+        ('day', ['2025-01-30', '2025-01-31', '2025-02-01', '2025-03-01']),
+        ('week', ['2025-01-26', '2025-02-23']),
+        ('month', ['2025-01-01', '2025-02-01', '2025-03-01']),
+        ('quarter', ['2025-01-01']),
+        ('year', ['2025-01-01']),
+    ],
+)
+def test_partition_into_chunks_calendar(
+    chunk_size: absorb.ChunkSize, expected: list[str]
+) -> None:
+    coverage = [
+        (datetime.datetime(2025, 1, 30, 12), datetime.datetime(2025, 2, 1)),
+        (datetime.datetime(2025, 3, 1), datetime.datetime(2025, 3, 1, 1)),
+    ]
+    chunks = absorb.ops.partition_into_chunks(coverage, chunk_size)
+    as_str = [chunk.strftime('%Y-%m-%d') for chunk in chunks]
+    if chunk_size in ['quarter', 'year']:
+        # both ranges fall in the same quarter and year
+        assert as_str == expected * 2
+    else:
+        assert as_str == expected
+    assert [chunks[i] for i in range(len(chunks))] == list(chunks)
+    assert all(chunk in chunks for chunk in chunks)
+
+
+def test_partition_into_int_chunks() -> None:
+    chunks = absorb.ops.partition_into_chunks([(0, 2500), (5000, 5000)], 1000)
+    assert list(chunks) == [0, 1000, 2000, 5000]
+    assert chunks[1:3] == [1000, 2000]
+    assert 2000 in chunks and 2500 not in chunks
+
+
+def test_partition_into_number_range_chunks() -> None:
+    chunk_size = {'type': 'number_range', 'number_interval': 1000}
+    chunks = absorb.ops.partition_into_chunks((1500, 4000), chunk_size)
+    assert list(chunks) == [
+        (1000, 1999),
+        (2000, 2999),
+        (3000, 3999),
+        (4000, 4999),
+    ]
+    assert (2000, 2999) in chunks and (2000, 2500) not in chunks
+
+    formatted = absorb.ops.format_chunk(chunks[0], chunk_size)
+    assert formatted == '0000001000_to_0000001999'
+    assert absorb.ops.parse_chunk(formatted, chunk_size) == (1000, 1999)
+
+    collected = absorb.ops.get_contiguous_ranges(
+        [(0, 999), (1000, 1999), (3000, 3999)], chunk_size
+    )
+    assert collected == [(0, 1999), (3000, 3999)]
+    missing = absorb.ops.get_range_diff(
+        subtract_this=collected,
+        from_this=(0, 5500),
+        boundary_type='closed',
+        chunk_size=chunk_size,
+    )
+    assert missing == [(2000, 2999), (4000, 5500)]
+    assert list(absorb.ops.partition_into_chunks(missing, chunk_size)) == [
+        (2000, 2999),
+        (4000, 4999),
+        (5000, 5999),
+    ]
+
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [
+        'hour',
+        'day',
+        'week',
+        'month',
+        'quarter',
+        'year',
+        {'type': 'number_range', 'number_interval': 1000},
+    ],
+)
+def test_parse_chunk_paths_matches_parse_chunk_path(
+    chunk_size: absorb.ChunkSize,
+) -> None:
+    template = '{source}__{table}__{chunk}.parquet'
+    coverage: absorb.Coverage
+    if isinstance(chunk_size, dict):
+        coverage = [(0, 4999), (7000, 7999)]
+    else:
+        coverage = [
+            (datetime.datetime(2023, 12, 1), datetime.datetime(2024, 2, 1)),
+            (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 1)),
+        ]
+    chunks = absorb.ops.partition_into_chunks(coverage, chunk_size)
+    paths = [
+        '/data/source__table__'
+        + absorb.ops.format_chunk(chunk, chunk_size)
+        + '.parquet'
+        for chunk in chunks
+    ]
+
+    parsed = absorb.ops.parse_chunk_paths(
+        paths, template, chunk_size=chunk_size
+    )
+    expected = [
+        absorb.ops.parse_chunk_path(path, template, chunk_size=chunk_size)[
+            'chunk'
+        ]
+        for path in paths
+    ]
+    if isinstance(chunk_size, dict):
+        assert [(c['start'], c['end']) for c in parsed.to_list()] == expected
+    else:
+        assert [(c['start'], c['end']) for c in parsed.to_list()] == [
+            (chunk, chunk) for chunk in expected
+        ]
+    assert absorb.ops.get_contiguous_ranges(
+        parsed, chunk_size
+    ) == absorb.ops.get_contiguous_ranges(expected, chunk_size)
+
+    invalid = absorb.ops.parse_chunk_paths(
+        ['source__table__invalid.parquet', 'other.parquet'],
+        template,
+        chunk_size=chunk_size,
+    )
+    assert invalid.null_count() == 2
+
+
+def test_parse_chunk_paths_benchmark() -> None:
+    import time
+
+    template = '{source}__{table}__{chunk}.parquet'
+    start = datetime.datetime(2020, 1, 1)
+    paths = [
+        'source__table__'
+        + absorb.ops.format_chunk(start + datetime.timedelta(hours=i), 'hour')
+        + '.parquet'
+        for i in range(50_000)
+        if i % 1000 != 999
+    ]
+
+    t_start = time.perf_counter()
+    chunks = absorb.ops.parse_chunk_paths(paths, template, chunk_size='hour')
+    ranges = absorb.ops.get_contiguous_ranges(chunks, 'hour')
+    elapsed = time.perf_counter() - t_start
+
+    assert len(ranges) == 50
+    assert ranges[0] == (start, start + datetime.timedelta(hours=998))
+    assert elapsed < 1
+
+
+def test_parse_compacted_chunk_paths() -> None:
+    template = '{source}__{table}__{chunk}.parquet'
+    paths = [
+        'source__table__2025-01-01_to_2025-01-31.parquet',
+        'source__table__2025-02-01.parquet',
+        'source__table__2025-02-02.parquet',
+        'source__table__2025-02-04_to_2025-02-28.parquet',
+        'source__table__2025-02-10.parquet',
+    ]
+    assert absorb.ops.parse_chunk_path(paths[0], template, chunk_size='day')[
+        'chunk'
+    ] == (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 31))
+
+    chunks = absorb.ops.parse_chunk_paths(paths, template, chunk_size='day')
+    assert absorb.ops.get_contiguous_ranges(chunks, 'day') == [
+        (datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 2)),
+        (datetime.datetime(2025, 2, 4), datetime.datetime(2025, 2, 28)),
+    ]